@@ -19,10 +19,30 @@ class Config:
     CRAWL_BATCH_SIZE = int(os.getenv("CRAWL_BATCH_SIZE", "12"))
     MAX_POSTS_PER_PAGE = int(os.getenv("MAX_POSTS_PER_PAGE", "50"))
     
+    # 상세 페이지 동시 처리 설정 (하나의 브라우저 컨텍스트 내 탭 수)
+    DETAIL_CONCURRENCY = int(os.getenv("DETAIL_CONCURRENCY", "3"))
+    DETAIL_LOAD_TIMEOUT_MS = int(os.getenv("DETAIL_LOAD_TIMEOUT_MS", "15000"))
+    # evaluate: page.evaluate 1회로 추출 / legacy: 선택자별 개별 호출
+    DETAIL_EXTRACTION_MODE = os.getenv("DETAIL_EXTRACTION_MODE", "evaluate")
+    DETAIL_MIN_SLEEP_SECONDS = float(os.getenv("DETAIL_MIN_SLEEP_SECONDS", "1.5"))
+    DETAIL_MAX_SLEEP_SECONDS = float(os.getenv("DETAIL_MAX_SLEEP_SECONDS", "3.5"))
+    
+    # 메인/태그 피드와 여러 브랜드가 공유하는 페이지 이동 예산
+    NAV_MAX_CONCURRENT = int(os.getenv("NAV_MAX_CONCURRENT", "3"))
+    NAV_MIN_INTERVAL_SECONDS = float(os.getenv("NAV_MIN_INTERVAL_SECONDS", "1.0"))
+    
+    # 다중 브랜드 모드에서 동시에 사용할 로그인 컨텍스트 수
+    MAX_CONTEXTS = int(os.getenv("MAX_CONTEXTS", "2"))
+    
     # 경로 설정
     PROJECT_ROOT = Path(__file__).parent.parent
     DATA_DIR = PROJECT_ROOT / "data" / "instagram"
     
+    # 로그인 세션(storage_state) 저장 위치 및 검증 설정
+    SESSION_DIR = Path(os.getenv("INSTAGRAM_SESSION_DIR", str(PROJECT_ROOT / "data" / "sessions")))
+    SESSION_EXPIRY_MARGIN_SECONDS = int(os.getenv("SESSION_EXPIRY_MARGIN_SECONDS", "3600"))
+    SESSION_VALIDATE_TIMEOUT_MS = int(os.getenv("SESSION_VALIDATE_TIMEOUT_MS", "8000"))
+    
     # 브라우저 설정
     HEADLESS = os.getenv("HEADLESS", "false").lower() == "true"
     
@@ -1,3 +1,4 @@
+import asyncio
 import time
 import random
 import os
@@ -14,6 +15,8 @@ import re
 
 # from database.queries import BrandQueries, DataQueries
 from .config import Config
+from .session_store import open_logged_in_context
+from .post_extractor import extract_post_detail
 
 
 class InstagramCrawler:
@@ -33,11 +36,11 @@ class InstagramCrawler:
         # self.data_queries = DataQueries()  # DB 사용 시 활성화
 
     @staticmethod
-    def random_sleep(min_sec=5, max_sec=9):
-        """탐지 방지를 위한 랜덤 대기"""
+    async def random_sleep(min_sec=5, max_sec=9):
+        """탐지 방지를 위한 랜덤 대기 (이벤트 루프를 막지 않음)"""
         delay = random.uniform(min_sec, max_sec)
         print(f"[*] {delay:.2f}초 대기 중...")
-        time.sleep(delay)
+        await asyncio.sleep(delay)
 
     @staticmethod
     def extract_post_id(url: str) -> Optional[str]:
@@ -76,113 +79,32 @@ class InstagramCrawler:
             # 페이지 전체가 로딩될 때까지 대기
             await new_page.wait_for_load_state("networkidle", timeout=30000)
 
-            # 게시물 내용 크롤링 (여러 selector 시도)
-            content_selectors = [
-                "h1._ap3a._aaco._aacu._aacx._aad7._aade",  # 기본 캡션 선택자
-                "h1._aacl._aaco._aacu._aacx._aad7._aade",  # 대체 캡션 선택자
-                "div[role='button'] span._aacl._aaco._aacu._aacx._aad7._aade",
-                # 버튼 내 텍스트
-                "article div[data-testid='post-content'] span",  # 새로운 구조
-                "article span[dir='auto']",  # 자동 방향 설정된 텍스트
-                "div._a9zs h1",  # 간소화된 선택자
-                "span._aacl._aaco._aacu._aacx._aad7._aade",  # 직접 span 선택자
-                "div[style*='word-wrap'] span",  # 텍스트 래핑이 적용된 요소
-            ]
-
-            for selector in content_selectors:
-                content_elem = await new_page.query_selector(selector)
-                if content_elem:
-                    content = await content_elem.inner_text()
-                    if content and content.strip():  # 빈 내용이 아닌 경우만
-                        break
+            # 캡션/미디어/좋아요/댓글/작성 시각을 한 번에 추출
+            detail = await extract_post_detail(new_page, Config.DETAIL_EXTRACTION_MODE)
+            content = detail["content"]
+            imgs = detail["media"]
+            like_count = detail["like_count"]
+            comments = detail["comments"]
+            comment_count = len(comments)
 
-            # 만약 위의 선택자로 찾지 못했다면, 더 넓은 범위에서 텍스트 검색
-            if not content:
+            # time 태그의 datetime 속성
+            datetime_str = detail["datetime"]
+            if datetime_str:
                 try:
-                    # article 내의 모든 span 요소에서 해시태그나 멘션이 포함된 텍스트 찾기
-                    all_spans = await new_page.query_selector_all("article span")
-                    for span in all_spans:
-                        text = await span.inner_text()
-                        if text and ("#" in text or "@" in text) and len(text) > 10:
-                            content = text
-                            break
+                    # ISO 형식 처리
+                    if "T" in datetime_str:
+                        posted_at = datetime.fromisoformat(
+                            datetime_str.replace("Z", "+00:00")
+                        )
+                        posted_at = posted_at.strftime("%Y-%m-%d %H:%M:%S")
+                    else:
+                        # 한국어 형식 처리
+                        posted_at = datetime.strptime(
+                            datetime_str, "%Y년 %m월 %d일"
+                        )
+                        posted_at = posted_at.strftime("%Y-%m-%d")
                 except Exception:
-                    pass
-
-            # 이미지/비디오 src 추출
-            img_elems = await new_page.query_selector_all("article img[src]")
-            vid_elems = await new_page.query_selector_all("article video[src]")
-            media_urls = []
-
-            for img in img_elems:
-                src = await img.get_attribute("src")
-                if src and not src.startswith("data:"):
-                    media_urls.append(src)
-
-            for vid in vid_elems:
-                src = await vid.get_attribute("src")
-                if src:
-                    media_urls.append(src)
-
-            imgs = list(set(media_urls))  # 중복 제거
-
-            # 좋아요 수 추출
-            like_selectors = [
-                "button[type='button'] span.html-span.xdj266r",
-                "section span._ac2a",
-                "div span._ac2a",
-            ]
-
-            for selector in like_selectors:
-                like_elem = await new_page.query_selector(selector)
-                if like_elem:
-                    like_text = await like_elem.inner_text()
-                    # 숫자만 추출
-                    like_numbers = re.findall(r"[\d,]+", like_text)
-                    if like_numbers:
-                        like_count = int(like_numbers[0].replace(",", ""))
-                        break
-
-            # 댓글 추출 (최대 10개)
-            comment_selectors = [
-                "div[role='button'] span._aacl._aaco._aacu._aacx._aad7._aade",
-                "span._ap3a._aaco._aacu._aacx._aad7._aade",
-            ]
-
-            for selector in comment_selectors:
-                comment_elems = await new_page.query_selector_all(selector)
-                if comment_elems:
-                    for i, comment in enumerate(comment_elems[:10]):
-                        text = await comment.inner_text()
-                        if text and text != content:  # 본문과 중복 제거
-                            comments.append(text)
-                    break
-
-            comment_count = len(comments)
-
-            # time 태그의 datetime 속성 추출
-            time_elem = await new_page.query_selector("time")
-            if time_elem:
-                datetime_str = await time_elem.get_attribute("datetime")
-                if not datetime_str:
-                    datetime_str = await time_elem.get_attribute("title")
-
-                if datetime_str:
-                    try:
-                        # ISO 형식 처리
-                        if "T" in datetime_str:
-                            posted_at = datetime.fromisoformat(
-                                datetime_str.replace("Z", "+00:00")
-                            )
-                            posted_at = posted_at.strftime("%Y-%m-%d %H:%M:%S")
-                        else:
-                            # 한국어 형식 처리
-                            posted_at = datetime.strptime(
-                                datetime_str, "%Y년 %m월 %d일"
-                            )
-                            posted_at = posted_at.strftime("%Y-%m-%d")
-                    except Exception:
-                        posted_at = datetime_str
+                    posted_at = datetime_str
 
         except Exception as e:
             print(f"상세 크롤링 실패 ({href}): {str(e)}")
@@ -226,13 +148,13 @@ class InstagramCrawler:
         try:
             await page.goto("https://www.instagram.com/accounts/login/")
             await page.wait_for_selector("input[name='username']", timeout=10000)
-            self.random_sleep(1, 3)
+            await self.random_sleep(1, 3)
 
             await page.fill("input[name='username']", self.username)
             await page.fill("input[name='password']", self.password)
             await page.click("button[type='submit']")
 
-            self.random_sleep(8, 10)
+            await self.random_sleep(8, 10)
 
             # 로그인 성공 확인
             if await page.query_selector(
@@ -257,7 +179,7 @@ class InstagramCrawler:
     ):
         """Instagram 계정에서 게시물 크롤링"""
         await page.goto(target_url)
-        self.random_sleep()
+        await self.random_sleep()
         post_info = []
         crawled_post_ids = set()
         post_number = 1
@@ -299,7 +221,7 @@ class InstagramCrawler:
                     f"[{file_suffix if file_suffix else ''}] 게시물을 찾을 수 없음, 다음 라운드 시도"
                 )
                 await page.evaluate("window.scrollTo(0, document.body.scrollHeight)")
-                self.random_sleep(2, 4)
+                await self.random_sleep(2, 4)
                 continue
 
             print(
@@ -382,7 +304,7 @@ class InstagramCrawler:
                 break
 
             await page.evaluate("window.scrollTo(0, document.body.scrollHeight)")
-            self.random_sleep(1.5, 3.8)
+            await self.random_sleep(1.5, 3.8)
 
         # JSON 파일로 저장 (백업용)
         file_path = os.path.join(
@@ -415,13 +337,15 @@ class InstagramCrawler:
         #     print(f"브랜드의 Instagram 핸들을 찾을 수 없습니다: {brand_info['brand_official_name']}")
         #     return
 
+        started_at = time.perf_counter()
         async with async_playwright() as p:
             browser = await p.chromium.launch(headless=False)
-            context = await browser.new_context()
+            # 저장된 세션이 유효하면 로그인 생략
+            context, self.startup_metric = await open_logged_in_context(
+                browser, self.username, self.login, started_at
+            )
             page = await context.new_page()
 
-            await self.login(page)
-
             print(f"\n[*] Instagram 크롤링 시작: @{instagram_handle}")
 
             # 메인 게시물 크롤링
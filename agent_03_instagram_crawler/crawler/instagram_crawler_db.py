@@ -1,3 +1,4 @@
+import asyncio
 import time
 import random
 import os
@@ -15,7 +16,34 @@ sys.path.append(str(project_root))
 
 from database.queries.data_queries import DataQueries
 from database.queries.brand_queries import BrandQueries
+from database.config import Tables
 from .config import Config
+from .session_store import open_logged_in_context
+from .post_extractor import extract_post_detail
+
+
+class NavigationBudget:
+    """여러 피드/탭이 공유하는 페이지 이동 예산 (동시 이동 수 + 최소 간격)"""
+    
+    def __init__(self, max_concurrent: int, min_interval: float):
+        self._semaphore = asyncio.Semaphore(max(1, max_concurrent))
+        self._lock = asyncio.Lock()
+        self._min_interval = min_interval
+        self._next_slot = 0.0
+    
+    async def __aenter__(self):
+        await self._semaphore.acquire()
+        async with self._lock:
+            now = asyncio.get_running_loop().time()
+            wait = self._next_slot - now
+            self._next_slot = max(now, self._next_slot) + self._min_interval
+        if wait > 0:
+            await asyncio.sleep(wait)
+        return self
+    
+    async def __aexit__(self, exc_type, exc, tb):
+        self._semaphore.release()
+        return False
 
 
 class InstagramCrawlerDB:
@@ -36,13 +64,19 @@ class InstagramCrawlerDB:
         # 데이터베이스 쿼리 객체 초기화
         self.data_queries = DataQueries()
         self.brand_queries = BrandQueries()
+        # 배치 저장 대기 중인 행 (flush_posts_to_db()로 일괄 저장)
+        self.pending_rows = []
+        # 모든 피드/브랜드가 공유하는 페이지 이동 예산
+        self.nav_budget = NavigationBudget(Config.NAV_MAX_CONCURRENT, Config.NAV_MIN_INTERVAL_SECONDS)
+        # 브라우저 실행~로그인 완료까지 소요 시간 기록
+        self.startup_metrics: List[dict] = []
 
     @staticmethod
-    def random_sleep(min_sec=5, max_sec=9):
-        """탐지 방지를 위한 랜덤 대기"""
+    async def random_sleep(min_sec=5, max_sec=9):
+        """탐지 방지를 위한 랜덤 대기 (이벤트 루프를 막지 않음)"""
         delay = random.uniform(min_sec, max_sec)
         print(f"[*] {delay:.2f}초 대기 중...")
-        time.sleep(delay)
+        await asyncio.sleep(delay)
     
     @staticmethod
     def extract_post_id(url: str) -> Optional[str]:
@@ -71,7 +105,10 @@ class InstagramCrawlerDB:
             return 'image'
 
     async def get_post_detail(self, page, href):
-        """게시물 상세 페이지에서 크롤링하는 함수 (DB 저장용)"""
+        """게시물 상세 페이지에서 크롤링하는 함수 (DB 저장용)
+        
+        page는 상세 조회 전용 탭이며, 호출 간에 재사용된다.
+        """
         posted_at = ""
         content = ""
         imgs = []
@@ -86,120 +123,39 @@ class InstagramCrawlerDB:
         if not post_id:
             return None
             
-        new_page = await page.context.new_page()
+        new_page = page
         try:
-            await new_page.goto(href, wait_until="domcontentloaded")
-            # 페이지 전체가 로딩될 때까지 대기
-            await new_page.wait_for_load_state('networkidle', timeout=30000)
-            
-            # 게시물 내용 크롤링 (여러 selector 시도)
-            content_selectors = [
-                "h1._ap3a._aaco._aacu._aacx._aad7._aade",  # 기본 캡션 선택자
-                "h1._aacl._aaco._aacu._aacx._aad7._aade",  # 대체 캡션 선택자
-                "div[role='button'] span._aacl._aaco._aacu._aacx._aad7._aade", 
-                # 버튼 내 텍스트
-                "article div[data-testid='post-content'] span",  # 새로운 구조
-                "article span[dir='auto']",  # 자동 방향 설정된 텍스트
-                "div._a9zs h1",  # 간소화된 선택자
-                "span._aacl._aaco._aacu._aacx._aad7._aade",  # 직접 span 선택자
-                "div[style*='word-wrap'] span"  # 텍스트 래핑이 적용된 요소
-            ]
-            
-            for selector in content_selectors:
-                content_elem = await new_page.query_selector(selector)
-                if content_elem:
-                    content = await content_elem.inner_text()
-                    if content and content.strip():  # 빈 내용이 아닌 경우만
-                        break
-                        
-            # 만약 위의 선택자로 찾지 못했다면, 더 넓은 범위에서 텍스트 검색
-            if not content:
+            async with self.nav_budget:
+                await new_page.goto(href, wait_until="domcontentloaded")
+            # networkidle 대신 게시물 본문(article) 렌더링까지만 대기
+            try:
+                await new_page.wait_for_selector("article", timeout=Config.DETAIL_LOAD_TIMEOUT_MS)
+            except Exception:
+                pass
+            
+            # 캡션/미디어/좋아요/댓글/작성 시각을 한 번에 추출
+            detail = await extract_post_detail(new_page, Config.DETAIL_EXTRACTION_MODE)
+            content = detail["content"]
+            imgs = detail["media"]
+            like_count = detail["like_count"]
+            comments = detail["comments"]
+            comment_count = len(comments)
+
+            # time 태그의 datetime 속성
+            datetime_str = detail["datetime"]
+            if datetime_str:
                 try:
-                    # article 내의 모든 span 요소에서 해시태그나 멘션이 포함된 텍스트 찾기
-                    all_spans = await new_page.query_selector_all(
-                        "article span"
-                    )
-                    for span in all_spans:
-                        text = await span.inner_text()
-                        if text and ('#' in text or '@' in text) and len(text) > 10:
-                            content = text
-                            break
+                    # ISO 형식 처리
+                    if 'T' in datetime_str:
+                        posted_at = datetime.fromisoformat(datetime_str.replace('Z', '+00:00'))
+                    else:
+                        # 한국어 형식 처리
+                        posted_at = datetime.strptime(datetime_str, "%Y년 %m월 %d일")
                 except Exception:
-                    pass
-                    
-            # 이미지/비디오 src 추출
-            img_elems = await new_page.query_selector_all("article img[src]")
-            vid_elems = await new_page.query_selector_all("article video[src]")
-            media_urls = []
-            
-            for img in img_elems:
-                src = await img.get_attribute("src")
-                if src and not src.startswith("data:"):
-                    media_urls.append(src)
-                    
-            for vid in vid_elems:
-                src = await vid.get_attribute("src")
-                if src:
-                    media_urls.append(src)
+                    posted_at = None
                     
-            imgs = list(set(media_urls))  # 중복 제거
-            
-            # 좋아요 수 추출
-            like_selectors = [
-                "button[type='button'] span.html-span.xdj266r",
-                "section span._ac2a",
-                "div span._ac2a"
-            ]
-            
-            for selector in like_selectors:
-                like_elem = await new_page.query_selector(selector)
-                if like_elem:
-                    like_text = await like_elem.inner_text()
-                    # 숫자만 추출
-                    like_numbers = re.findall(r'[\d,]+', like_text)
-                    if like_numbers:
-                        like_count = int(like_numbers[0].replace(',', ''))
-                        break
-            
-            # 댓글 추출 (최대 10개)
-            comment_selectors = [
-                "div[role='button'] span._aacl._aaco._aacu._aacx._aad7._aade",
-                "span._ap3a._aaco._aacu._aacx._aad7._aade"
-            ]
-            
-            for selector in comment_selectors:
-                comment_elems = await new_page.query_selector_all(selector)
-                if comment_elems:
-                    for i, comment in enumerate(comment_elems[:10]):
-                        text = await comment.inner_text()
-                        if text and text != content:  # 본문과 중복 제거
-                            comments.append(text)
-                    break
-                    
-            comment_count = len(comments)
-            
-            # time 태그의 datetime 속성 추출
-            time_elem = await new_page.query_selector("time")
-            if time_elem:
-                datetime_str = await time_elem.get_attribute("datetime")
-                if not datetime_str:
-                    datetime_str = await time_elem.get_attribute("title")
-                    
-                if datetime_str:
-                    try:
-                        # ISO 형식 처리
-                        if 'T' in datetime_str:
-                            posted_at = datetime.fromisoformat(datetime_str.replace('Z', '+00:00'))
-                        else:
-                            # 한국어 형식 처리
-                            posted_at = datetime.strptime(datetime_str, "%Y년 %m월 %d일")
-                    except Exception:
-                        posted_at = None
-                        
         except Exception as e:
             print(f"상세 크롤링 실패 ({href}): {str(e)}")
-        finally:
-            await new_page.close()
             
         # 디버깅: 추출된 콘텐츠 확인
         if content:
@@ -234,13 +190,13 @@ class InstagramCrawlerDB:
         try:
             await page.goto("https://www.instagram.com/accounts/login/")
             await page.wait_for_selector("input[name='username']", timeout=10000)
-            self.random_sleep(1, 3)
+            await self.random_sleep(1, 3)
             
             await page.fill("input[name='username']", self.username)
             await page.fill("input[name='password']", self.password)
             await page.click("button[type='submit']")
             
-            self.random_sleep(8, 10)
+            await self.random_sleep(8, 10)
             
             # 로그인 성공 확인
             if await page.query_selector("svg[aria-label='홈']") or await page.query_selector("svg[aria-label='Home']"):
@@ -252,18 +208,26 @@ class InstagramCrawlerDB:
             print(f"[!] 로그인 중 오류 발생: {str(e)}")
             raise
 
-    async def save_post_to_db(self, brand_id: int, post_data: dict, is_tagged: bool = False) -> bool:
-        """게시물을 데이터베이스에 저장"""
+    def find_saved_post_ids(self, brand_id: int, post_ids: List[str]) -> set:
+        """이미 저장된 post_id 조회 (한 번의 IN 쿼리)"""
+        try:
+            existing = self.data_queries.find_existing_keys(
+                Tables.RAW_INSTAGRAM_DATA, DataQueries.RAW_INSTAGRAM_KEY,
+                [(brand_id, post_id) for post_id in post_ids]
+            )
+            return {post_id for _, post_id in existing}
+        except Exception as e:
+            print(f"[❌] 중복 체크 실패: {str(e)}")
+            return set()
+
+    async def save_post_to_db(self, brand_id: int, post_data: dict, is_tagged: bool = False,
+                              buffer: Optional[List[dict]] = None) -> bool:
+        """게시물을 저장 버퍼에 추가 (실제 저장은 flush_posts_to_db)"""
         try:
             if not post_data.get('post_id') or not post_data.get('content'):
                 print(f"[WARNING] 필수 데이터 누락: {post_data}")
                 return False
             
-            # 중복 체크
-            if self.data_queries.check_instagram_post_exists(brand_id, post_data['post_id']):
-                print(f"[*] 이미 존재하는 게시물 건너뛰기: {post_data['post_id']}")
-                return False
-            
             # DB 저장용 데이터 구조 변환
             instagram_data = {
                 'brand_id': brand_id,
@@ -296,170 +260,295 @@ class InstagramCrawlerDB:
                 'crawled_at': datetime.now()
             }
             
-            # DB에 저장
-            result_id = self.data_queries.insert_03_raw_instagram_data(instagram_data)
-            print(f"[✅] 게시물 DB 저장 성공: {post_data['post_id']} (ID: {result_id})")
+            (self.pending_rows if buffer is None else buffer).append(instagram_data)
             return True
             
         except Exception as e:
-            print(f"[❌] 게시물 DB 저장 실패 ({post_data.get('post_id', 'unknown')}): {str(e)}")
+            print(f"[❌] 게시물 데이터 변환 실패 ({post_data.get('post_id', 'unknown')}): {str(e)}")
             return False
 
+    def flush_posts_to_db(self, rows: Optional[List[dict]] = None) -> int:
+        """버퍼에 쌓인 게시물을 중복 제거 후 한 트랜잭션으로 일괄 저장"""
+        if rows is None:
+            rows, self.pending_rows = self.pending_rows, []
+        if not rows:
+            return 0
+        
+        try:
+            inserted = self.data_queries.bulk_insert_03_raw_instagram_data(rows)
+        except Exception as e:
+            print(f"[❌] 게시물 일괄 저장 실패 ({len(rows)}개): {str(e)}")
+            return 0
+        
+        print(f"[✅] 게시물 DB 일괄 저장: {len(inserted)}개 저장, {len(rows) - len(inserted)}개 중복 건너뜀")
+        return len(inserted)
+
+    async def _collect_post_links(self, page, crawl_batch_size, seen_post_ids, round_no):
+        """현재 렌더링된 그리드에서 새 게시물 링크 수집"""
+        post_selectors = [
+            "article a[href*='/p/'], article a[href*='/reel/']",  # 일반 게시물 + 릴스 링크
+            "div._aagu",               # 일반 게시물 컨테이너
+            "article div[role='button']", # 대체 선택자
+            "a[href*='/p/'] img, a[href*='/reel/'] img"      # 이미지를 포함한 게시물/릴스 링크
+        ]
+        
+        post_elements = []
+        for selector in post_selectors:
+            try:
+                await page.wait_for_selector(selector, timeout=10000)
+                elements = await page.query_selector_all(selector)
+                if elements:
+                    post_elements = elements
+                    print(f"[{round_no}] 선택자 '{selector}'로 {len(elements)}개 요소 발견")
+                    break
+            except Exception:
+                continue
+        
+        if not post_elements:
+            return None
+        
+        print(f"[{round_no}] 현재까지 렌더링된 게시물 수: {len(post_elements)}")
+        new_links = []
+        
+        for post in post_elements:
+            # 게시물 링크 찾기
+            href = None
+            
+            # 현재 요소가 a 태그인지 확인
+            tag_name = await post.evaluate("node => node.tagName.toLowerCase()")
+            
+            if tag_name == 'a':
+                # 이미 a 태그라면 직접 href 가져오기
+                href = await post.get_attribute("href")
+            else:
+                # a 태그가 아니라면 부모나 자식에서 a 태그 찾기
+                parent_a = await post.evaluate_handle("node => node.closest('a')")
+                if parent_a:
+                    href = await parent_a.get_attribute("href")
+                else:
+                    # 자식에서 a 태그 찾기 (일반 게시물 + 릴스)
+                    child_a = await post.query_selector("a[href*='/p/'], a[href*='/reel/']")
+                    if child_a:
+                        href = await child_a.get_attribute("href")
+            
+            # href 검증 및 정규화 (일반 게시물 + 릴스)
+            if href and ('/p/' in href or '/reel/' in href):
+                if not href.startswith("http"):
+                    href = "https://www.instagram.com" + href
+            
+            # 중복 체크용 post_id 추출
+            post_id = self.extract_post_id(href) if href else None
+            if post_id and post_id not in seen_post_ids:
+                new_links.append(href)
+                seen_post_ids.add(post_id)
+                if len(new_links) >= crawl_batch_size:
+                    break
+        
+        return new_links
+
+    async def _flush_pending_async(self, buffer: List[dict]) -> int:
+        """버퍼를 이벤트 루프에서 분리한 뒤 DB 저장은 스레드에서 수행"""
+        rows = buffer[:]
+        buffer.clear()
+        if not rows:
+            return 0
+        return await asyncio.to_thread(self.flush_posts_to_db, rows)
+
     async def crawl_posts_to_db(self, page, target_url, brand_id: int, max_scroll_round=5, crawl_batch_size=20, is_tagged=False):
-        """Instagram 계정에서 게시물 크롤링하여 DB에 저장"""
-        await page.goto(target_url)
-        self.random_sleep()
+        """Instagram 계정에서 게시물 크롤링하여 DB에 저장
         
-        crawled_post_ids = set()
-        total_saved = 0
+        그리드 스크롤(생산자)과 상세 페이지 추출(소비자)을 겹쳐서 실행한다.
+        스크롤 루프가 작업 큐에 링크를 넣으면, 같은 브라우저 컨텍스트 안의
+        상세 조회 탭 풀(Config.DETAIL_CONCURRENCY개)이 병렬로 처리한다.
+        """
+        async with self.nav_budget:
+            await page.goto(target_url)
+        await self.random_sleep()
+        
+        # 피드별 저장 버퍼 (메인/태그 피드가 동시에 실행되므로 분리)
+        buffer: List[dict] = []
         
         # 페이지당 최대 게시물 수 설정
         max_posts = Config.MAX_POSTS_PER_PAGE
         
-        for r in range(1, max_scroll_round + 1):
-            # 게시물 요소 찾기
-            post_selectors = [
-                "article a[href*='/p/'], article a[href*='/reel/']",  # 일반 게시물 + 릴스 링크
-                "div._aagu",               # 일반 게시물 컨테이너
-                "article div[role='button']", # 대체 선택자
-                "a[href*='/p/'] img, a[href*='/reel/'] img"      # 이미지를 포함한 게시물/릴스 링크
-            ]
-            
-            post_elements = []
-            for selector in post_selectors:
-                try:
-                    await page.wait_for_selector(selector, timeout=10000)
-                    elements = await page.query_selector_all(selector)
-                    if elements:
-                        post_elements = elements
-                        print(f"[{r}] 선택자 '{selector}'로 {len(elements)}개 요소 발견")
+        queue: asyncio.Queue = asyncio.Queue()
+        progress = {'accepted': 0, 'pending': 0}
+        seen_post_ids = set()
+        total_saved = 0
+        
+        async def detail_worker(worker_no: int):
+            tab = await page.context.new_page()
+            try:
+                while True:
+                    href = await queue.get()
+                    if href is None:
                         break
-                except Exception:
-                    continue
-                    
-            if not post_elements:
-                print(f"[{r}] 게시물을 찾을 수 없음, 다음 라운드 시도")
-                await page.evaluate("window.scrollTo(0, document.body.scrollHeight)")
-                self.random_sleep(2, 4)
-                continue
-                
-            print(f"[{r}] 현재까지 렌더링된 게시물 수: {len(post_elements)}")
-            new_posts = []
-            
-            for post in post_elements:
-                # 게시물 링크 찾기
-                href = None
+                    try:
+                        if progress['accepted'] >= max_posts:
+                            continue
+                        detail = await self.get_post_detail(tab, href)
+                        if detail and detail.get('post_id'):
+                            detail['href'] = href
+                            if await self.save_post_to_db(brand_id, detail, is_tagged, buffer):
+                                progress['accepted'] += 1
+                        await self.random_sleep(Config.DETAIL_MIN_SLEEP_SECONDS,
+                                                Config.DETAIL_MAX_SLEEP_SECONDS)
+                    except Exception as e:
+                        print(f"[worker-{worker_no}] 상세 처리 실패 ({href}): {str(e)}")
+                    finally:
+                        progress['pending'] -= 1
+            finally:
+                await tab.close()
+        
+        workers = [asyncio.create_task(detail_worker(i))
+                   for i in range(max(1, Config.DETAIL_CONCURRENCY))]
+        
+        try:
+            for r in range(1, max_scroll_round + 1):
+                if progress['accepted'] + progress['pending'] >= max_posts:
+                    print(f"최대 게시물 수 도달 ({max_posts})")
+                    break
                 
-                # 현재 요소가 a 태그인지 확인
-                tag_name = await post.evaluate("node => node.tagName.toLowerCase()")
+                links = await self._collect_post_links(page, crawl_batch_size, seen_post_ids, r)
+                if links is None:
+                    print(f"[{r}] 게시물을 찾을 수 없음, 다음 라운드 시도")
+                    await page.evaluate("window.scrollTo(0, document.body.scrollHeight)")
+                    await self.random_sleep(2, 4)
+                    continue
                 
-                if tag_name == 'a':
-                    # 이미 a 태그라면 직접 href 가져오기
-                    href = await post.get_attribute("href")
-                else:
-                    # a 태그가 아니라면 부모나 자식에서 a 태그 찾기
-                    parent_a = await post.evaluate_handle("node => node.closest('a')")
-                    if parent_a:
-                        href = await parent_a.get_attribute("href")
-                    else:
-                        # 자식에서 a 태그 찾기 (일반 게시물 + 릴스)
-                        child_a = await post.query_selector("a[href*='/p/'], a[href*='/reel/']")
-                        if child_a:
-                            href = await child_a.get_attribute("href")
+                # 이미 저장된 게시물은 상세 페이지 방문 전에 제외
+                saved_ids = await asyncio.to_thread(
+                    self.find_saved_post_ids, brand_id,
+                    [self.extract_post_id(href) for href in links]
+                )
                 
-                # href 검증 및 정규화 (일반 게시물 + 릴스)
-                if href and ('/p/' in href or '/reel/' in href):
-                    if not href.startswith("http"):
-                        href = "https://www.instagram.com" + href
-                    
-                # 중복 체크용 post_id 추출
-                post_id = self.extract_post_id(href)
-                if post_id and post_id not in crawled_post_ids:
-                    new_posts.append((post, href))
-                    crawled_post_ids.add(post_id)
-                    
-                    # 최대 게시물 수에 도달했는지 확인
-                    if total_saved + len(new_posts) >= max_posts:
-                        new_posts = new_posts[:max_posts - total_saved]
+                enqueued = 0
+                for href in links:
+                    if self.extract_post_id(href) in saved_ids:
+                        print(f"[*] 이미 존재하는 게시물 건너뛰기: {self.extract_post_id(href)}")
+                        continue
+                    if progress['accepted'] + progress['pending'] >= max_posts:
                         break
-                        
-                    if len(new_posts) >= crawl_batch_size:
-                        break
-                    
-            print(f"[{r}] 이번 라운드에서 크롤링할 게시물 수: {len(new_posts)}")
-            
-            # 각 게시물에 대해 상세 정보 크롤링 및 DB 저장
-            for post, href in new_posts:
-                detail = await self.get_post_detail(page, href)
-                if detail and detail.get('post_id'):
-                    detail['href'] = href
-                    saved = await self.save_post_to_db(brand_id, detail, is_tagged)
-                    if saved:
-                        total_saved += 1
+                    progress['pending'] += 1
+                    queue.put_nowait(href)
+                    enqueued += 1
                 
-                # 최대 게시물 수에 도달하면 중지
-                if total_saved >= max_posts:
-                    print(f"최대 게시물 수 도달 ({max_posts})")
-                    break
-                    
-            # 최대 게시물 수에 도달하면 스크롤 중지
-            if total_saved >= max_posts:
-                break
+                print(f"[{r}] 이번 라운드에서 크롤링할 게시물 수: {enqueued}")
                 
-            await page.evaluate("window.scrollTo(0, document.body.scrollHeight)")
-            self.random_sleep(1.5, 3.8)
-            
+                # 상세 추출이 진행되는 동안 다음 라운드 스크롤
+                total_saved += await self._flush_pending_async(buffer)
+                await page.evaluate("window.scrollTo(0, document.body.scrollHeight)")
+                await self.random_sleep(1.5, 3.8)
+        finally:
+            for _ in workers:
+                queue.put_nowait(None)
+            await asyncio.gather(*workers, return_exceptions=True)
+        
+        total_saved += await self._flush_pending_async(buffer)
         return total_saved
 
-    async def run(self, brand_id: int):
-        """메인 실행 메서드 (DB 저장용)"""
+    async def _open_logged_in_context(self, browser, started_at: Optional[float] = None):
+        """저장된 세션을 재사용하거나 로그인한 브라우저 컨텍스트 반환"""
+        context, metric = await open_logged_in_context(browser, self.username, self.login, started_at)
+        self.startup_metrics.append(metric)
+        return context
+
+    async def crawl_brand(self, context, brand_id: int) -> Optional[dict]:
+        """로그인된 컨텍스트에서 한 브랜드의 메인/태그 피드를 동시에 크롤링"""
         # 브랜드 정보 가져오기
-        brand_info = self.brand_queries.get_brand_by_id(brand_id)
+        brand_info = await asyncio.to_thread(self.brand_queries.get_brand_by_id, brand_id)
         if not brand_info:
             print(f"브랜드를 찾을 수 없습니다: {brand_id}")
-            return
+            return None
             
         # 채널 정보 가져오기
-        channels = self.brand_queries.get_brand_channels(brand_id)
+        channels = await asyncio.to_thread(self.brand_queries.get_brand_channels, brand_id)
         if not channels or not channels.get('instagram_handle'):
             print(f"브랜드의 Instagram 핸들을 찾을 수 없습니다: {brand_info['brand_official_name']}")
-            return
+            return None
             
         instagram_handle = channels['instagram_handle'].replace('@', '')
-            
-        async with async_playwright() as p:
-            browser = await p.chromium.launch(headless=False)
-            context = await browser.new_context()
-            page = await context.new_page()
-            
-            await self.login(page)
-            
-            print(f"\n[*] Instagram 크롤링 시작: @{instagram_handle}")
-            
-            # 메인 게시물 크롤링 및 DB 저장
-            target_url = f"https://www.instagram.com/{instagram_handle}/"
-            main_saved = await self.crawl_posts_to_db(
-                page, target_url, brand_id,
-                max_scroll_round=Config.MAX_SCROLL_ROUND,
-                crawl_batch_size=Config.CRAWL_BATCH_SIZE,
-                is_tagged=False
-            )
-            
-            print(f"[✅] 메인 게시물 DB 저장 완료: {main_saved}개")
-            
-            # 태그된 게시물 크롤링 및 DB 저장
-            tagged_url = f"https://www.instagram.com/{instagram_handle}/tagged/"
-            tagged_saved = await self.crawl_posts_to_db(
-                page, tagged_url, brand_id,
-                max_scroll_round=Config.MAX_SCROLL_ROUND,
-                crawl_batch_size=Config.CRAWL_BATCH_SIZE,
-                is_tagged=True
+        print(f"\n[*] Instagram 크롤링 시작: @{instagram_handle}")
+        
+        # 메인/태그 피드는 서로 독립적이므로 별도 페이지에서 동시에 진행
+        main_page = await context.new_page()
+        tagged_page = await context.new_page()
+        try:
+            main_saved, tagged_saved = await asyncio.gather(
+                self.crawl_posts_to_db(
+                    main_page, f"https://www.instagram.com/{instagram_handle}/", brand_id,
+                    max_scroll_round=Config.MAX_SCROLL_ROUND,
+                    crawl_batch_size=Config.CRAWL_BATCH_SIZE,
+                    is_tagged=False
+                ),
+                self.crawl_posts_to_db(
+                    tagged_page, f"https://www.instagram.com/{instagram_handle}/tagged/", brand_id,
+                    max_scroll_round=Config.MAX_SCROLL_ROUND,
+                    crawl_batch_size=Config.CRAWL_BATCH_SIZE,
+                    is_tagged=True
+                ),
             )
-            
-            print(f"[✅] 태그된 게시물 DB 저장 완료: {tagged_saved}개")
-            print(f"[✅] 전체 저장된 게시물: {main_saved + tagged_saved}개")
-                    
-            await browser.close()
+        finally:
+            await main_page.close()
+            await tagged_page.close()
+        
+        print(f"[✅] @{instagram_handle} 메인 게시물 DB 저장 완료: {main_saved}개")
+        print(f"[✅] @{instagram_handle} 태그된 게시물 DB 저장 완료: {tagged_saved}개")
+        print(f"[✅] @{instagram_handle} 전체 저장된 게시물: {main_saved + tagged_saved}개")
+        
+        return {
+            'brand_id': brand_id,
+            'instagram_handle': instagram_handle,
+            'main_saved': main_saved,
+            'tagged_saved': tagged_saved,
+        }
+
+    async def run(self, brand_id: int):
+        """메인 실행 메서드 (DB 저장용)"""
+        started_at = time.perf_counter()
+        async with async_playwright() as p:
+            browser = await p.chromium.launch(headless=Config.HEADLESS)
+            try:
+                context = await self._open_logged_in_context(browser, started_at)
+                return await self.crawl_brand(context, brand_id)
+            finally:
+                await browser.close()
+
+    async def run_many(self, brand_ids: List[int], max_contexts: Optional[int] = None) -> List[Optional[dict]]:
+        """여러 브랜드를 하나의 브라우저 프로세스에서 처리 (다중 핸들 모드)
+        
+        로그인된 컨텍스트는 최대 max_contexts개까지만 만들고 브랜드 간에
+        재사용하므로, 브랜드마다 브라우저 실행/로그인 비용이 들지 않는다.
+        """
+        max_contexts = max(1, min(max_contexts or Config.MAX_CONTEXTS, len(brand_ids) or 1))
+        
+        async with async_playwright() as p:
+            browser = await p.chromium.launch(headless=Config.HEADLESS)
+            # None 슬롯은 처음 사용할 때 로그인된 컨텍스트로 채워진다
+            context_pool: asyncio.Queue = asyncio.Queue()
+            for _ in range(max_contexts):
+                context_pool.put_nowait(None)
+            contexts = []
+            
+            async def crawl_one(brand_id: int):
+                context = await context_pool.get()
+                try:
+                    if context is None:
+                        context = await self._open_logged_in_context(browser)
+                        contexts.append(context)
+                    return await self.crawl_brand(context, brand_id)
+                except Exception as e:
+                    print(f"[❌] 브랜드 {brand_id} 크롤링 실패: {str(e)}")
+                    return None
+                finally:
+                    context_pool.put_nowait(context)
+            
+            try:
+                return await asyncio.gather(*(crawl_one(brand_id) for brand_id in brand_ids))
+            finally:
+                for context in contexts:
+                    await context.close()
+                await browser.close()
     
     def _extract_hashtags(self, text: str) -> List[str]:
         """텍스트에서 해시태그 추출"""
@@ -0,0 +1,208 @@
+"""
+Instagram 게시물 상세 페이지 추출기
+
+InstagramCrawler / InstagramCrawlerDB가 공유하는 선택자 테이블과 추출 로직.
+기본 모드("evaluate")는 page.evaluate 한 번으로 캡션, 미디어, 좋아요,
+댓글, 작성 시각을 모두 수집한다. "legacy" 모드는 기존처럼 선택자마다
+Playwright 호출을 보내며, 벤치마크 비교용으로 남겨 둔다.
+"""
+import re
+from typing import Dict, Any
+
+# 상세 페이지 선택자 테이블 (두 크롤러 공용)
+POST_DETAIL_SELECTORS: Dict[str, Any] = {
+    # 게시물 내용 (여러 selector 순서대로 시도)
+    "content": [
+        "h1._ap3a._aaco._aacu._aacx._aad7._aade",  # 기본 캡션 선택자
+        "h1._aacl._aaco._aacu._aacx._aad7._aade",  # 대체 캡션 선택자
+        "div[role='button'] span._aacl._aaco._aacu._aacx._aad7._aade",  # 버튼 내 텍스트
+        "article div[data-testid='post-content'] span",  # 새로운 구조
+        "article span[dir='auto']",  # 자동 방향 설정된 텍스트
+        "div._a9zs h1",  # 간소화된 선택자
+        "span._aacl._aaco._aacu._aacx._aad7._aade",  # 직접 span 선택자
+        "div[style*='word-wrap'] span",  # 텍스트 래핑이 적용된 요소
+    ],
+    # 위 선택자로 못 찾았을 때 해시태그/멘션이 포함된 텍스트 검색 범위
+    "content_fallback": "article span",
+    "images": "article img[src]",
+    "videos": "article video[src]",
+    "likes": [
+        "button[type='button'] span.html-span.xdj266r",
+        "section span._ac2a",
+        "div span._ac2a",
+    ],
+    "comments": [
+        "div[role='button'] span._aacl._aaco._aacu._aacx._aad7._aade",
+        "span._ap3a._aaco._aacu._aacx._aad7._aade",
+    ],
+    "time": "time",
+    "max_comments": 10,
+}
+
+# 브라우저 안에서 한 번에 실행되는 추출 스크립트
+EXTRACT_POST_DETAIL_JS = """
+(sel) => {
+    const textOf = (el) => (el ? (el.innerText || '') : '');
+
+    let content = '';
+    for (const s of sel.content) {
+        const el = document.querySelector(s);
+        if (el) {
+            content = textOf(el);
+            if (content && content.trim()) break;
+        }
+    }
+    if (!content) {
+        for (const span of document.querySelectorAll(sel.content_fallback)) {
+            const t = textOf(span);
+            if (t && (t.includes('#') || t.includes('@')) && t.length > 10) {
+                content = t;
+                break;
+            }
+        }
+    }
+
+    const media = [];
+    for (const img of document.querySelectorAll(sel.images)) {
+        const src = img.getAttribute('src');
+        if (src && !src.startsWith('data:')) media.push(src);
+    }
+    for (const vid of document.querySelectorAll(sel.videos)) {
+        const src = vid.getAttribute('src');
+        if (src) media.push(src);
+    }
+
+    let likeText = '';
+    for (const s of sel.likes) {
+        const el = document.querySelector(s);
+        if (el) {
+            const t = textOf(el);
+            if (/[\\d,]+/.test(t)) {
+                likeText = t;
+                break;
+            }
+        }
+    }
+
+    const comments = [];
+    for (const s of sel.comments) {
+        const els = document.querySelectorAll(s);
+        if (els.length) {
+            for (const el of Array.from(els).slice(0, sel.max_comments)) {
+                const t = textOf(el);
+                if (t && t !== content) comments.push(t);
+            }
+            break;
+        }
+    }
+
+    let datetimeStr = null;
+    const timeEl = document.querySelector(sel.time);
+    if (timeEl) {
+        datetimeStr = timeEl.getAttribute('datetime') || timeEl.getAttribute('title');
+    }
+
+    return {content, media, like_text: likeText, comments, datetime: datetimeStr};
+}
+"""
+
+
+def parse_like_count(like_text: str) -> int:
+    """좋아요 텍스트에서 첫 번째 숫자 추출"""
+    for number in re.findall(r"[\d,]+", like_text or ""):
+        digits = number.replace(",", "")
+        if digits:
+            return int(digits)
+    return 0
+
+
+async def _extract_with_evaluate(page) -> Dict[str, Any]:
+    """page.evaluate 한 번으로 모든 필드 수집"""
+    return await page.evaluate(EXTRACT_POST_DETAIL_JS, POST_DETAIL_SELECTORS)
+
+
+async def _extract_with_selectors(page) -> Dict[str, Any]:
+    """선택자별 Playwright 호출로 수집 (기존 방식)"""
+    sel = POST_DETAIL_SELECTORS
+    content = ""
+
+    for selector in sel["content"]:
+        content_elem = await page.query_selector(selector)
+        if content_elem:
+            content = await content_elem.inner_text()
+            if content and content.strip():  # 빈 내용이 아닌 경우만
+                break
+
+    if not content:
+        try:
+            for span in await page.query_selector_all(sel["content_fallback"]):
+                text = await span.inner_text()
+                if text and ("#" in text or "@" in text) and len(text) > 10:
+                    content = text
+                    break
+        except Exception:
+            pass
+
+    media = []
+    for img in await page.query_selector_all(sel["images"]):
+        src = await img.get_attribute("src")
+        if src and not src.startswith("data:"):
+            media.append(src)
+    for vid in await page.query_selector_all(sel["videos"]):
+        src = await vid.get_attribute("src")
+        if src:
+            media.append(src)
+
+    like_text = ""
+    for selector in sel["likes"]:
+        like_elem = await page.query_selector(selector)
+        if like_elem:
+            text = await like_elem.inner_text()
+            if re.search(r"[\d,]+", text):
+                like_text = text
+                break
+
+    comments = []
+    for selector in sel["comments"]:
+        comment_elems = await page.query_selector_all(selector)
+        if comment_elems:
+            for comment in comment_elems[:sel["max_comments"]]:
+                text = await comment.inner_text()
+                if text and text != content:  # 본문과 중복 제거
+                    comments.append(text)
+            break
+
+    datetime_str = None
+    time_elem = await page.query_selector(sel["time"])
+    if time_elem:
+        datetime_str = await time_elem.get_attribute("datetime")
+        if not datetime_str:
+            datetime_str = await time_elem.get_attribute("title")
+
+    return {
+        "content": content,
+        "media": media,
+        "like_text": like_text,
+        "comments": comments,
+        "datetime": datetime_str,
+    }
+
+
+async def extract_post_detail(page, mode: str = "evaluate") -> Dict[str, Any]:
+    """상세 페이지에서 원시 필드 추출
+
+    Returns:
+        content, media(중복 제거), like_count, comments, datetime(원본 문자열)
+    """
+    if mode == "legacy":
+        raw = await _extract_with_selectors(page)
+    else:
+        raw = await _extract_with_evaluate(page)
+
+    return {
+        "content": raw.get("content") or "",
+        "media": list(set(raw.get("media") or [])),  # 중복 제거
+        "like_count": parse_like_count(raw.get("like_text")),
+        "comments": raw.get("comments") or [],
+        "datetime": raw.get("datetime"),
+    }
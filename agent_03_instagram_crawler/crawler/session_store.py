@@ -0,0 +1,131 @@
+"""
+Instagram 로그인 세션 저장소
+
+계정별 Playwright storage_state를 로컬 디스크에 저장해 두고, 다음 실행 시
+쿠키가 유효하면 로그인 없이 재사용한다. 만료되었거나 검증에 실패하면
+로그인 후 새로 저장한다.
+"""
+import os
+import json
+import time
+from datetime import datetime
+from pathlib import Path
+from typing import Awaitable, Callable, Optional
+
+from .config import Config
+
+# 로그인 여부 판단에 사용하는 세션 쿠키
+SESSION_COOKIE_NAME = "sessionid"
+
+
+def session_state_path(username: str) -> Path:
+    """계정별 storage_state 파일 경로"""
+    safe_name = "".join(c if c.isalnum() or c in "._-" else "_" for c in username)
+    return Config.SESSION_DIR / f"{safe_name}.json"
+
+
+def load_valid_state(username: str) -> Optional[Path]:
+    """저장된 세션 쿠키가 아직 만료되지 않았으면 파일 경로 반환"""
+    path = session_state_path(username)
+    if not path.exists():
+        return None
+
+    try:
+        with open(path, "r", encoding="utf-8") as f:
+            state = json.load(f)
+    except (OSError, ValueError):
+        return None
+
+    # 만료 임박한 쿠키는 재사용하지 않음
+    min_expiry = time.time() + Config.SESSION_EXPIRY_MARGIN_SECONDS
+    for cookie in state.get("cookies", []):
+        if cookie.get("name") == SESSION_COOKIE_NAME and "instagram.com" in cookie.get("domain", ""):
+            expires = cookie.get("expires", -1)
+            # -1은 세션 쿠키 (만료 시각 없음)
+            if expires == -1 or expires > min_expiry:
+                return path
+    return None
+
+
+async def is_logged_in(page) -> bool:
+    """홈 화면에서 로그인 상태인지 확인"""
+    try:
+        await page.goto("https://www.instagram.com/", wait_until="domcontentloaded")
+        if "/accounts/login" in page.url:
+            return False
+        await page.wait_for_selector(
+            "svg[aria-label='홈'], svg[aria-label='Home']",
+            timeout=Config.SESSION_VALIDATE_TIMEOUT_MS
+        )
+        return True
+    except Exception:
+        return False
+
+
+async def save_state(context, username: str):
+    """현재 컨텍스트의 storage_state를 저장 (소유자만 읽기/쓰기)"""
+    path = session_state_path(username)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    await context.storage_state(path=str(path))
+    os.chmod(path, 0o600)
+
+
+def record_startup_metric(metric: dict):
+    """시작 시간 지표를 JSONL 파일에 누적 (콜드 스타트 절감 효과 비교용)"""
+    try:
+        Config.SESSION_DIR.mkdir(parents=True, exist_ok=True)
+        with open(Config.SESSION_DIR / "startup_metrics.jsonl", "a", encoding="utf-8") as f:
+            f.write(json.dumps(metric, ensure_ascii=False) + "\n")
+    except OSError as e:
+        print(f"[!] 시작 시간 지표 저장 실패: {e}")
+
+
+async def open_logged_in_context(browser, username: str,
+                                 login: Callable[..., Awaitable[None]],
+                                 started_at: Optional[float] = None):
+    """저장된 세션을 재사용하거나 로그인해서 컨텍스트 반환
+
+    Returns:
+        (context, metric) - metric에는 세션 재사용 여부와 소요 시간이 들어 있다
+    """
+    started_at = started_at or time.perf_counter()
+    metric = {
+        "timestamp": datetime.now().isoformat(),
+        "username": username,
+        "session_reused": False,
+    }
+
+    state_path = load_valid_state(username)
+    if state_path:
+        context = await browser.new_context(storage_state=str(state_path))
+        page = await context.new_page()
+        try:
+            if await is_logged_in(page):
+                metric["session_reused"] = True
+                print(f"[*] 저장된 세션 재사용: {username}")
+                # 갱신된 쿠키 반영
+                await save_state(context, username)
+            else:
+                print(f"[*] 저장된 세션 만료, 다시 로그인합니다: {username}")
+                await context.close()
+                context = None
+        finally:
+            if context is not None:
+                await page.close()
+    else:
+        context = None
+
+    if context is None:
+        context = await browser.new_context()
+        page = await context.new_page()
+        try:
+            await login(page)
+            await save_state(context, username)
+        finally:
+            await page.close()
+
+    metric["startup_seconds"] = round(time.perf_counter() - started_at, 3)
+    print(f"[*] 로그인 준비 완료 ({metric['startup_seconds']}초, "
+          f"세션 재사용: {'예' if metric['session_reused'] else '아니오'})")
+    record_startup_metric(metric)
+    return context, metric
@@ -20,8 +20,15 @@ async def main():
     
     try:
         crawler = InstagramCrawlerDB()
-        brand_id = 1  # kijun 브랜드 ID
-        await crawler.run(brand_id)
+        
+        # 브랜드 ID 여러 개 지정 시 하나의 브라우저에서 일괄 처리
+        # 예: python run_crawler_db.py 1 2 3
+        brand_ids = [int(arg) for arg in sys.argv[1:]]
+        if len(brand_ids) > 1:
+            await crawler.run_many(brand_ids)
+        else:
+            brand_id = brand_ids[0] if brand_ids else 1  # 기본값: kijun 브랜드 ID
+            await crawler.run(brand_id)
         
     except Exception as e:
         print(f"크롤러 실행 중 오류 발생: {str(e)}")
@@ -19,6 +19,17 @@ class Config:
     CRAWL_DELAY = float(os.getenv("NAVER_CRAWL_DELAY", "0.5"))
     PAGE_DELAY = float(os.getenv("NAVER_PAGE_DELAY", "1.0"))
     REQUEST_TIMEOUT = int(os.getenv("NAVER_REQUEST_TIMEOUT", "10"))
+    MAX_RETRIES = int(os.getenv("NAVER_MAX_RETRIES", "2"))
+    
+    # 파이프라인 설정 (본문 동시 수집 워커 수, 호스트별 동시 요청 수)
+    FETCH_WORKERS = int(os.getenv("NAVER_FETCH_WORKERS", "4"))
+    MAX_REQUESTS_PER_HOST = int(os.getenv("NAVER_MAX_REQUESTS_PER_HOST", "2"))
+    # 이만큼 본문이 모이면 중간 일괄 저장
+    SAVE_BATCH_SIZE = int(os.getenv("NAVER_SAVE_BATCH_SIZE", "50"))
+    
+    # 증분 크롤링: 저장된 포스트를 건너뛰고, 연속으로 이만큼 이미 본 결과가 나오면 중단
+    INCREMENTAL = os.getenv("NAVER_INCREMENTAL", "false").lower() == "true"
+    INCREMENTAL_STOP_AFTER = int(os.getenv("NAVER_INCREMENTAL_STOP_AFTER", "20"))
     
     # 데이터베이스 설정 (메인 .env에서 가져옴)
     DB_HOST = os.getenv("DB_HOST", "localhost")
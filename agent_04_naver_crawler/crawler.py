@@ -1,7 +1,8 @@
-import requests
+import httpx
 from bs4 import BeautifulSoup
 import time
 import re
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from urllib.parse import urljoin, urlparse, parse_qs
 import json
 from datetime import datetime, timedelta
@@ -14,21 +15,38 @@ sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
 from database.queries.data_queries import DataQueries
 from database.queries.brand_queries import BrandQueries
+from database.config import Tables
 from database.utils import get_db
+from shared.http_client import CrawlerHTTPClient
 from config import Config
 
 
 class NaverBlogCrawler:
+    # 본문이 들어 있는 mainFrame iframe 주소 (blogId/logNo로 직접 구성)
+    POST_VIEW_URL = (
+        "https://blog.naver.com/PostView.naver?blogId={blog_id}&logNo={log_no}"
+        "&redirect=Dlog&widgetTypeCall=true&directAccess=false"
+    )
+
     def __init__(self):
-        self.session = requests.Session()
-        self.session.headers.update(
-            {
+        self.config = Config
+        # 공용 HTTP 클라이언트 (keep-alive/HTTP2, 재시도, 조건부 GET)
+        # 기존 순차 크롤링과 같은 간격: 본문은 CRAWL_DELAY, 검색은 PAGE_DELAY
+        self.http = CrawlerHTTPClient(
+            headers={
                 "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/126.0.0.0 Safari/537.36"
-            }
+            },
+            timeout=Config.REQUEST_TIMEOUT,
+            max_connections=max(4, Config.FETCH_WORKERS + 1),
+            max_per_host=Config.MAX_REQUESTS_PER_HOST,
+            min_interval=Config.CRAWL_DELAY,
+            host_intervals={"search.naver.com": Config.PAGE_DELAY},
+            max_retries=Config.MAX_RETRIES,
         )
-        self.config = Config
         self.logger = self._setup_logger()
         self.data_queries = DataQueries()
+        # 배치 저장 대기 중인 행 (flush_to_database()로 일괄 저장)
+        self.pending_rows = []
         
     def _setup_logger(self):
         """로거 설정"""
@@ -119,8 +137,8 @@ class NaverBlogCrawler:
         """유효한 네이버 블로그 URL인지 확인"""
         return url and ("blog.naver.com" in url or "blog.me" in url)
 
-    def search_blogs(self, query, start=1, retry_count=0, max_retries=3):
-        """네이버 블로그 검색 (재시도 로직 포함)"""
+    def search_blogs(self, query, start=1, sort_by_date=False):
+        """네이버 블로그 검색 (재시도는 공용 HTTP 클라이언트가 처리)"""
         url = "https://search.naver.com/search.naver"
         params = {
             "ssc": "tab.blog.all",
@@ -128,17 +146,14 @@ class NaverBlogCrawler:
             "sm": "tab_jum",
             "start": start,
         }
+        if sort_by_date:
+            # 최신순 정렬 (증분 크롤링 시 새 글이 앞쪽에 오도록)
+            params["nso"] = "so:dd,p:all"
         try:
-            response = self.session.get(url, params=params, timeout=self.config.REQUEST_TIMEOUT)
+            response = self.http.get(url, params=params)
             response.raise_for_status()
             return response.text
-        except requests.RequestException as e:
-            self.logger.warning(f"검색 요청 실패 (시도 {retry_count + 1}/{max_retries}): {e}")
-            
-            if retry_count < max_retries - 1:
-                time.sleep(2 ** retry_count)  # 지수 백오프
-                return self.search_blogs(query, start, retry_count + 1, max_retries)
-            
+        except httpx.HTTPError as e:
             self.logger.error(f"검색 요청 최종 실패: {e}")
             return None
 
@@ -186,23 +201,36 @@ class NaverBlogCrawler:
                 continue
         return blog_items
 
+    def _fetch_soup(self, url):
+        """호스트별 요청 간격을 지키며 페이지를 가져와 파싱"""
+        response = self.http.get(url)
+        response.raise_for_status()
+        return BeautifulSoup(response.text, "html.parser")
+
     def get_blog_content(self, blog_url):
         """블로그 본문 내용 가져오기"""
         try:
-            response = self.session.get(blog_url, timeout=10)
-            response.raise_for_status()
-            soup = BeautifulSoup(response.text, "html.parser")
+            soup = None
+            content_div = None
+
+            # blogId/logNo를 알면 바깥 페이지를 건너뛰고 iframe 본문을 바로 요청
+            blog_id, log_no = self.extract_blog_id_and_log_no(blog_url)
+            if blog_id and log_no:
+                soup = self._fetch_soup(self.POST_VIEW_URL.format(blog_id=blog_id, log_no=log_no))
+                content_div = soup.select_one("div.se-main-container, div.post-view")
+
+            if content_div is None:
+                soup = self._fetch_soup(blog_url)
+
+                # iframe 처리
+                iframe = soup.find("iframe", id="mainFrame")
+                if iframe and iframe.get("src"):
+                    iframe_url = urljoin(blog_url, iframe["src"])
+                    soup = self._fetch_soup(iframe_url)
 
-            # iframe 처리
-            iframe = soup.find("iframe", id="mainFrame")
-            if iframe and iframe.get("src"):
-                iframe_url = urljoin(blog_url, iframe["src"])
-                response = self.session.get(iframe_url, timeout=10)
-                response.raise_for_status()
-                soup = BeautifulSoup(response.text, "html.parser")
+                content_div = soup.select_one("div.se-main-container, div.post-view")
 
             # 본문 내용 추출
-            content_div = soup.select_one("div.se-main-container, div.post-view")
             content_html = ""
             content_text = ""
             
@@ -269,42 +297,78 @@ class NaverBlogCrawler:
             self.logger.error(f"중복 체크 오류: {e}")
             return False
 
+    def find_saved_posts(self, blogs):
+        """검색 결과 중 이미 저장된 포스트 키 조회 (한 번의 IN 쿼리)"""
+        keys = []
+        for blog in blogs:
+            blog_id, log_no = self.extract_blog_id_and_log_no(blog["url"])
+            if blog_id and log_no:
+                keys.append((blog_id, log_no))
+        try:
+            return DataQueries.find_existing_keys(
+                Tables.RAW_NAVER_BLOG_DATA, DataQueries.RAW_NAVER_KEY, keys
+            )
+        except Exception as e:
+            self.logger.error(f"중복 체크 오류: {e}")
+            return set()
+
+    def load_known_posts(self, brand_official_name):
+        """브랜드의 저장된 (blog_id, log_no) 전체를 메모리로 로드 (증분 크롤링용)"""
+        try:
+            known = DataQueries.get_known_post_keys(
+                Tables.RAW_NAVER_BLOG_DATA, DataQueries.RAW_NAVER_KEY, brand_official_name
+            )
+            print(f"저장된 포스트 {len(known)}개 로드 (증분 모드)")
+            return known
+        except Exception as e:
+            self.logger.error(f"저장된 포스트 로드 실패: {e}")
+            return set()
+
     def save_to_database(self, brand_official_name, blog_data):
-        """데이터베이스에 저장"""
+        """저장할 행을 버퍼에 추가 (실제 저장은 flush_to_database)"""
+        blog_id, log_no = self.extract_blog_id_and_log_no(blog_data['url'])
+        
+        # 데이터 준비
+        data = {
+            'brand_name': brand_official_name,  # DB 컬럼명에 맞게 변경
+            'blog_url': blog_data['url'],
+            'blog_id': blog_id,
+            'log_no': log_no,
+            'post_title': blog_data.get('title', ''),
+            'post_content': blog_data.get('content_html', ''),
+            'images': blog_data.get('image_urls', []),
+            'posted_at': blog_data.get('date')
+        }
+        self.pending_rows.append(data)
+        return True
+
+    def flush_to_database(self):
+        """버퍼에 쌓인 행을 중복 제거 후 한 트랜잭션으로 일괄 저장"""
+        if not self.pending_rows:
+            return 0
+        
+        rows, self.pending_rows = self.pending_rows, []
         try:
-            blog_id, log_no = self.extract_blog_id_and_log_no(blog_data['url'])
-            
-            # 중복 체크
-            if blog_id and log_no and self.check_duplicate(blog_id, log_no):
-                print(f"  -> 이미 저장된 포스트입니다: {blog_id}/{log_no}")
-                self.logger.info(f"중복 포스트 건너뛰기: {blog_id}/{log_no}")
-                return False
-            
-            # 데이터 준비
-            data = {
-                'brand_name': brand_official_name,  # DB 컬럼명에 맞게 변경
-                'blog_url': blog_data['url'],
-                'blog_id': blog_id,
-                'log_no': log_no,
-                'post_title': blog_data.get('title', ''),
-                'post_content': blog_data.get('content_html', ''),
-                'images': blog_data.get('image_urls', []),
-                'posted_at': blog_data.get('date')
-            }
-            
-            # 데이터베이스에 저장
-            DataQueries.insert_raw_naver_data(data)
-            print(f"  -> 저장 완료: {blog_data['title'][:40]}...")
-            self.logger.info(f"포스트 저장 성공: {blog_data['title'][:40]}...")
-            return True
-            
+            inserted = DataQueries.bulk_insert_raw_naver_data(rows)
         except Exception as e:
-            print(f"  -> 저장 실패: {e}")
-            self.logger.error(f"포스트 저장 실패: {e}")
-            return False
+            print(f"  -> 일괄 저장 실패 ({len(rows)}개): {e}")
+            self.logger.error(f"일괄 저장 실패 ({len(rows)}개): {e}")
+            return 0
+        
+        skipped = len(rows) - len(inserted)
+        print(f"  -> 일괄 저장 완료: {len(inserted)}개 저장, {skipped}개 중복/누락 건너뜀")
+        self.logger.info(f"일괄 저장: {len(inserted)}개 저장, {skipped}개 건너뜀")
+        return len(inserted)
 
-    def crawl_brand_blogs(self, brand_official_name, max_pages=10, posts_per_page=10):
-        """특정 브랜드의 블로그 크롤링"""
+    def crawl_brand_blogs(self, brand_official_name, max_pages=10, posts_per_page=10,
+                          incremental=False, stop_after_known=None):
+        """특정 브랜드의 블로그 크롤링
+        
+        incremental=True이면 저장된 포스트 키를 한 번에 로드해 본문 요청 전에 건너뛰고,
+        최신순 검색 결과에서 이미 본 포스트가 stop_after_known개 연속되면 페이지 탐색을 멈춘다.
+        """
+        if stop_after_known is None:
+            stop_after_known = self.config.INCREMENTAL_STOP_AFTER
         print(f"\n브랜드 '{brand_official_name}' 블로그 크롤링 시작...")
         self.logger.info(f"브랜드 '{brand_official_name}' 크롤링 시작")
         
@@ -316,12 +380,14 @@ class NaverBlogCrawler:
         session_data = {
             'brand_official_name': brand_official_name,
             'platform': 'naver_blog',
-            'crawl_type': 'full',
+            'crawl_type': 'incremental' if incremental else 'full',
             'status': 'running',
             'config': {
                 'query': brand_official_name,
                 'max_pages': max_pages,
-                'posts_per_page': posts_per_page
+                'posts_per_page': posts_per_page,
+                'incremental': incremental,
+                'stop_after_known': stop_after_known if incremental else None
             }
         }
         
@@ -333,56 +399,117 @@ class NaverBlogCrawler:
             self.logger.error(f"세션 생성 실패: {e}")
             session_id = f"naver_{brand_official_name}_{datetime.now().strftime('%Y%m%d%H%M%S')}"
         
-        for page in range(1, max_pages + 1):
-            start = (page - 1) * 10 + 1
-            print(f"\n페이지 {page} 크롤링 중... (start: {start})")
-            
-            # 검색
-            html = self.search_blogs(brand_official_name, start=start)
-            if not html:
-                break
-            
-            # 블로그 정보 추출
-            blogs_on_page = self.extract_blog_info(html)
-            if not blogs_on_page:
-                print("더 이상 블로그 게시물을 찾을 수 없습니다.")
-                break
-            
-            # 각 블로그 크롤링
-            for blog in blogs_on_page:
-                crawled_count += 1
-                
-                print(f"  크롤링 중: {blog['title'][:40]}...")
-                
+        started_at = time.time()
+        pages_crawled = 0
+        skipped_known = 0
+        # 증분 모드: 저장된 포스트 키 (watermark)와 연속으로 이미 본 결과 수
+        known_keys = self.load_known_posts(brand_official_name) if incremental else None
+        known_run = 0
+        # 본문 수집 중인 future -> 검색 결과 항목
+        in_flight = {}
+        
+        def collect(futures):
+            """완료된 본문을 병합해 저장 버퍼에 넣고, 일정량마다 일괄 저장"""
+            nonlocal saved_count, error_count
+            for future in futures:
+                blog = in_flight.pop(future)
                 try:
-                    # 본문 내용 가져오기
-                    content_data = self.get_blog_content(blog["url"])
+                    content_data = future.result()
                     
                     # 데이터 병합
                     blog.update(content_data)
                     if content_data.get("date"):
                         blog["date"] = content_data["date"]
                     
-                    # 데이터베이스 저장
-                    if self.save_to_database(brand_official_name, blog):
-                        saved_count += 1
-                    
-                    # 크롤링 간격
-                    time.sleep(self.config.CRAWL_DELAY)
-                    
+                    # 저장 버퍼에 추가
+                    self.save_to_database(brand_official_name, blog)
                 except Exception as e:
                     error_count += 1
                     self.logger.error(f"크롤링 오류: {e}")
-                    continue
             
-            # 페이지 간 대기
-            time.sleep(self.config.PAGE_DELAY)
+            if len(self.pending_rows) >= self.config.SAVE_BATCH_SIZE:
+                saved_count += self.flush_to_database()
+        
+        # 검색 페이지 선요청(1개 스레드)과 본문 수집 워커 풀을 겹쳐서 실행
+        with ThreadPoolExecutor(max_workers=1) as search_pool, \
+                ThreadPoolExecutor(max_workers=max(1, self.config.FETCH_WORKERS)) as body_pool:
+            next_search = search_pool.submit(
+                self.search_blogs, brand_official_name, 1, sort_by_date=incremental
+            )
+            
+            for page in range(1, max_pages + 1):
+                # 검색 결과 (이전 반복에서 미리 요청해 둔 것)
+                html = next_search.result()
+                next_search = None
+                if not html:
+                    break
+                
+                # 블로그 정보 추출
+                blogs_on_page = self.extract_blog_info(html)
+                if not blogs_on_page:
+                    print("더 이상 블로그 게시물을 찾을 수 없습니다.")
+                    break
+                pages_crawled = page
+                
+                # 현재 페이지 본문을 받는 동안 다음 검색 페이지를 미리 요청
+                if page < max_pages:
+                    next_search = search_pool.submit(
+                        self.search_blogs, brand_official_name, page * 10 + 1,
+                        sort_by_date=incremental
+                    )
+                
+                print(f"\n페이지 {page}: {len(blogs_on_page)}개 포스트 발견")
+                
+                # 이미 저장된 포스트는 본문 요청 전에 제외
+                saved_keys = known_keys if incremental else self.find_saved_posts(blogs_on_page)
+                
+                # 각 블로그 본문 수집 작업 등록
+                for blog in blogs_on_page:
+                    crawled_count += 1
+                    
+                    blog_key = self.extract_blog_id_and_log_no(blog["url"])
+                    if blog_key in saved_keys:
+                        known_run += 1
+                        skipped_known += 1
+                        print(f"  -> 이미 저장된 포스트입니다: {blog_key[0]}/{blog_key[1]}")
+                        self.logger.info(f"중복 포스트 건너뛰기: {blog_key[0]}/{blog_key[1]}")
+                        continue
+                    known_run = 0
+                    if incremental and all(blog_key):
+                        # 같은 실행에서 다시 나오면 건너뛰도록 watermark에 추가
+                        known_keys.add(blog_key)
+                    
+                    print(f"  크롤링 예약: {blog['title'][:40]}...")
+                    in_flight[body_pool.submit(self.get_blog_content, blog["url"])] = blog
+                
+                # 이미 끝난 본문 정리 (기다리지 않음)
+                collect([future for future in list(in_flight) if future.done()])
+                
+                # 증분 모드: 이미 본 포스트가 연속으로 이어지면 이후 페이지는 탐색하지 않음
+                if incremental and known_run >= stop_after_known:
+                    print(f"이미 저장된 포스트가 {known_run}개 연속 - 페이지 탐색 중단")
+                    self.logger.info(f"증분 크롤링 중단: 연속 {known_run}개 기존 포스트 (페이지 {page})")
+                    break
+            
+            if next_search is not None:
+                next_search.cancel()
+            
+            # 남은 본문 수집 대기
+            collect(list(as_completed(list(in_flight))))
+        
+        # 남은 버퍼 저장
+        saved_count += self.flush_to_database()
+        
+        elapsed = time.time() - started_at
+        posts_per_minute = (crawled_count / elapsed * 60) if elapsed > 0 else 0
+        print(f"\n처리 속도: {posts_per_minute:.1f} 포스트/분 ({elapsed:.1f}초)")
+        self.logger.info(f"처리 속도: {posts_per_minute:.1f} 포스트/분 ({elapsed:.1f}초)")
         
         # 크롤링 세션 업데이트
         try:
             session_update = {
                 'status': 'completed',
-                'pages_crawled': page - 1,
+                'pages_crawled': pages_crawled,
                 'items_found': crawled_count,
                 'items_saved': saved_count,
                 'error_count': error_count
@@ -404,5 +531,6 @@ class NaverBlogCrawler:
             'brand_official_name': brand_official_name,
             'crawled_count': crawled_count,
             'saved_count': saved_count,
-            'error_count': error_count
+            'error_count': error_count,
+            'skipped_known': skipped_known
         }
\ No newline at end of file
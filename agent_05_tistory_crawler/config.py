@@ -20,12 +20,20 @@ class Config:
     PAGE_DELAY = float(os.getenv("TISTORY_PAGE_DELAY", "1.0"))
     REQUEST_TIMEOUT = int(os.getenv("TISTORY_REQUEST_TIMEOUT", "10"))
     
+    # 증분 크롤링: 저장된 포스트를 건너뛰고, 연속으로 이만큼 이미 본 결과가 나오면 중단
+    INCREMENTAL = os.getenv("TISTORY_INCREMENTAL", "false").lower() == "true"
+    INCREMENTAL_STOP_AFTER = int(os.getenv("TISTORY_INCREMENTAL_STOP_AFTER", "20"))
+    
     # 최소 이미지 개수 (원본과 동일하게 5개로 설정)
     MIN_IMAGES = int(os.getenv("TISTORY_MIN_IMAGES", "5"))
     
     # 최소 콘텐츠 길이
     MIN_CONTENT_LENGTH = int(os.getenv("TISTORY_MIN_CONTENT_LENGTH", "100"))
     
+    # 본문 요청 전 단계별 품질 필터 (검색 제목/URL -> 스트리밍 본문 -> 전체 파싱)
+    PREFILTER = os.getenv("TISTORY_PREFILTER", "true").lower() == "true"
+    STREAM_CHUNK_SIZE = int(os.getenv("TISTORY_STREAM_CHUNK_SIZE", str(16 * 1024)))
+    
     # Chrome 드라이버 설정
     USE_HEADLESS = os.getenv("TISTORY_USE_HEADLESS", "false").lower() == "true"
     CHROME_WAIT_TIME = int(os.getenv("TISTORY_CHROME_WAIT", "3"))
@@ -35,6 +43,17 @@ class Config:
     PRIMARY_SEARCH = os.getenv("TISTORY_SEARCH_ENGINE", "google")  # google, daum, naver
     FALLBACK_SEARCH = os.getenv("TISTORY_FALLBACK_SEARCH", "true").lower() == "true"
     
+    # 통합 검색: 아래 엔진을 동시에 검색하고 결과를 병합 (false면 기존 순차 폴백)
+    SEARCH_FEDERATION = os.getenv("TISTORY_SEARCH_FEDERATION", "true").lower() == "true"
+    SEARCH_ENGINES = [
+        engine.strip()
+        for engine in os.getenv("TISTORY_SEARCH_ENGINES", "google,daum,naver").split(",")
+        if engine.strip()
+    ]
+    SEARCH_MIN_CANDIDATES = int(os.getenv("TISTORY_SEARCH_MIN_CANDIDATES", "10"))
+    SEARCH_TIMEOUT = float(os.getenv("TISTORY_SEARCH_TIMEOUT", "30"))
+    SEARCH_CACHE_TTL = int(os.getenv("TISTORY_SEARCH_CACHE_TTL", str(6 * 3600)))
+    
     # 키워드 필터링 설정
     # 네거티브 키워드 (이러한 키워드가 포함된 콘텐츠는 제외)
     NEGATIVE_KEYWORDS = [
@@ -62,6 +81,10 @@ class Config:
     # 경로
     PROJECT_ROOT = Path(__file__).parent
     LOG_DIR = PROJECT_ROOT / "logs"
+    SEARCH_CACHE_PATH = os.getenv(
+        "TISTORY_SEARCH_CACHE_PATH",
+        str(PROJECT_ROOT.parent / ".cache" / "tistory_search_cache.sqlite3"),
+    )
     
     @classmethod
     def ensure_directories(cls):
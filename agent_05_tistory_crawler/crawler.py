@@ -1,4 +1,3 @@
-import requests
 from bs4 import BeautifulSoup
 import time
 import random
@@ -8,7 +7,9 @@ import json
 from datetime import datetime
 import sys
 import os
+import codecs
 import logging
+import threading
 from logging.handlers import RotatingFileHandler
 
 sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
@@ -27,22 +28,36 @@ except ImportError:
 
 from database.queries.data_queries import DataQueries
 from database.queries.brand_queries import BrandQueries
+from database.config import Tables
 from database.utils import get_db
+from shared.http_client import CrawlerHTTPClient
 from config import Config
+from search_federation import SearchFederation, SearchResultCache
+from quality_filter import QualityFilter
 
 
 class TistoryCrawler:
     def __init__(self):
-        self.session = requests.Session()
-        self.session.headers.update(
-            {
+        self.config = Config
+        # 공용 HTTP 클라이언트 (keep-alive/HTTP2, 재시도, 조건부 GET)
+        self.http = CrawlerHTTPClient(
+            headers={
                 "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36"
-            }
+            },
+            timeout=self.config.REQUEST_TIMEOUT,
         )
-        self.config = Config
         self.logger = self._setup_logger()
         self.data_queries = DataQueries()
         self.driver = None  # Chrome 드라이버 인스턴스 재사용
+        self._driver_lock = threading.Lock()  # 드라이버는 한 번에 한 검색만 사용
+        self.search_federation = None  # 통합 검색기 (필요할 때 생성)
+        self.quality_filter = QualityFilter(
+            self.config.NEGATIVE_KEYWORDS,
+            self.config.POSITIVE_KEYWORDS,
+            min_images=self.config.MIN_IMAGES,
+            min_content_length=self.config.MIN_CONTENT_LENGTH,
+        )
+        self.pending_rows = []  # 배치 저장 대기 중인 행
 
     def _check_captcha(self, driver) -> bool:
         """
@@ -93,31 +108,7 @@ class TistoryCrawler:
 
     def _check_content_quality(self, title, content):
         """콘텐츠 품질 체크 (키워드 필터링)"""
-        if not title or not content:
-            return False
-
-        # 콘텐츠 길이 체크
-        if len(content) < self.config.MIN_CONTENT_LENGTH:
-            return False
-
-        # 네거티브 키워드 체크
-        for neg_keyword in self.config.NEGATIVE_KEYWORDS:
-            if neg_keyword in title or neg_keyword in content:
-                self.logger.debug(f"네거티브 키워드 발견: {neg_keyword}")
-                return False
-
-        # 포지티브 키워드 체크 (최소 하나는 포함되어야 함)
-        found_positive = False
-        for pos_keyword in self.config.POSITIVE_KEYWORDS:
-            if pos_keyword in title.lower() or pos_keyword in content.lower():
-                found_positive = True
-                break
-
-        if not found_positive:
-            self.logger.debug("패션 관련 키워드가 없음")
-            return False
-
-        return True
+        return self.quality_filter.check_content(title, content)
 
     def random_delay(self, min_sec=None, max_sec=None):
         """랜덤 딜레이 (봇 탐지 회피)"""
@@ -158,7 +149,10 @@ class TistoryCrawler:
         return None, None
 
     def search_tistory(self, keyword, page=1):
-        """티스토리 검색 (구글 검색 사용)"""
+        """티스토리 검색 (통합 검색 또는 구글 검색 후 순차 폴백)"""
+        if self.config.SEARCH_FEDERATION:
+            return self._get_or_create_search_federation().search(keyword, page)
+
         # Selenium이 설치되어 있으면 사용
         if SELENIUM_AVAILABLE:
             return self.search_tistory_selenium(keyword, page)
@@ -166,6 +160,36 @@ class TistoryCrawler:
             # 기존 requests 방식 시도
             return self.search_tistory_requests(keyword, page)
 
+    def _get_or_create_search_federation(self):
+        """통합 검색기 가져오기 또는 생성"""
+        if self.search_federation is None:
+            available = {
+                "google": self._search_google,
+                "daum": self._search_daum,
+                "naver": self._search_naver,
+            }
+            engines = {
+                name: available[name]
+                for name in self.config.SEARCH_ENGINES
+                if name in available
+            }
+            self.search_federation = SearchFederation(
+                engines,
+                cache=SearchResultCache(
+                    self.config.SEARCH_CACHE_PATH, self.config.SEARCH_CACHE_TTL
+                ),
+                min_candidates=self.config.SEARCH_MIN_CANDIDATES,
+                timeout=self.config.SEARCH_TIMEOUT,
+                max_results=self.config.POSTS_PER_PAGE,
+            )
+        return self.search_federation
+
+    def _search_google(self, keyword, page=1):
+        """통합 검색용 구글 검색 (실패 시 다른 엔진으로 폴백하지 않음)"""
+        if SELENIUM_AVAILABLE:
+            return self.search_tistory_selenium(keyword, page, fallback=False)
+        return self.search_tistory_requests(keyword, page, fallback=False)
+
     def _get_or_create_driver(self):
         """드라이버 인스턴스 가져오기 또는 생성"""
         if self.driver is None:
@@ -184,7 +208,10 @@ class TistoryCrawler:
         return self.driver
 
     def close_driver(self):
-        """드라이버 종료"""
+        """드라이버 및 통합 검색기 종료"""
+        if self.search_federation is not None:
+            self.search_federation.close()
+            self.search_federation = None
         if self.driver:
             try:
                 self.driver.quit()
@@ -194,8 +221,12 @@ class TistoryCrawler:
             finally:
                 self.driver = None
 
-    def search_tistory_selenium(self, keyword, page=1):
+    def search_tistory_selenium(self, keyword, page=1, fallback=True):
         """Selenium을 사용한 구글 검색 (봇 탐지 우회)"""
+        with self._driver_lock:
+            return self._search_tistory_selenium(keyword, page, fallback)
+
+    def _search_tistory_selenium(self, keyword, page, fallback):
         print("  Selenium으로 구글 검색 시작...")
         query = f'"{keyword}" site:tistory.com'
         start = (page - 1) * 10
@@ -217,7 +248,7 @@ class TistoryCrawler:
                     input("     캐플를 해결한 후 Enter 키를 누르세요...")
                 else:
                     self.logger.warning("CAPTCHA 발생, 대체 검색으로 전환")
-                    return self.search_tistory_direct(keyword, page)
+                    return self.search_tistory_direct(keyword, page) if fallback else []
 
             # 검색 결과 대기
             WebDriverWait(driver, 10).until(
@@ -255,9 +286,9 @@ class TistoryCrawler:
         except Exception as e:
             print(f"  Selenium 검색 오류: {e}")
             self.logger.error(f"Selenium 검색 오류: {e}")
-            return self.search_tistory_direct(keyword, page)
+            return self.search_tistory_direct(keyword, page) if fallback else []
 
-    def search_tistory_requests(self, keyword, page=1):
+    def search_tistory_requests(self, keyword, page=1, fallback=True):
         """기존 requests 방식 검색 (백업)"""
         try:
             # 티스토리는 자체 검색 API가 제한적이므로 구글 검색 사용
@@ -272,15 +303,11 @@ class TistoryCrawler:
                 "User-Agent": "Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36",
                 "Accept": "text/html,application/xhtml+xml,application/xml;q=0.9,image/webp,*/*;q=0.8",
                 "Accept-Language": "ko-KR,ko;q=0.9,en;q=0.8",
-                "Accept-Encoding": "gzip, deflate, br",
                 "DNT": "1",
-                "Connection": "keep-alive",
                 "Upgrade-Insecure-Requests": "1",
             }
 
-            response = self.session.get(
-                url, params=params, headers=headers, timeout=self.config.REQUEST_TIMEOUT
-            )
+            response = self.http.get(url, params=params, headers=headers)
             response.raise_for_status()
 
             soup = BeautifulSoup(response.text, "html.parser")
@@ -313,14 +340,69 @@ class TistoryCrawler:
                 or "unusual traffic" in response.text.lower()
             ):
                 print("  ⚠️  구글에서 비정상적인 트래픽으로 감지됨")
-                return self.search_tistory_direct(keyword, page)
+                return self.search_tistory_direct(keyword, page) if fallback else []
 
             print(f"  구글 검색에서 {len(urls)}개 URL 발견")
             return urls
 
         except Exception as e:
             print(f"구글 검색 오류: {e}")
-            return self.search_tistory_direct(keyword, page)
+            return self.search_tistory_direct(keyword, page) if fallback else []
+
+    # 검색 엔진 요청 헤더 (Daum/Naver 공용)
+    SEARCH_HEADERS = {
+        "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36",
+        "Accept": "text/html,application/xhtml+xml,application/xml;q=0.9,*/*;q=0.8",
+        "Accept-Language": "ko-KR,ko;q=0.9",
+    }
+
+    def _search_daum(self, keyword, page=1):
+        """Daum 블로그 검색에서 티스토리 (URL, 제목) 추출"""
+        response = self.http.get(
+            "https://search.daum.net/search",
+            params={"w": "blog", "q": f"{keyword} tistory", "p": page},
+            headers=self.SEARCH_HEADERS,
+        )
+        soup = BeautifulSoup(response.text, "html.parser")
+
+        # Daum 검색 결과 파싱
+        urls = []
+        seen = set()
+        for item in soup.select("div.wrap_tit a, a.f_link_b"):
+            href = item.get("href", "")
+            if "tistory.com" in href and href.startswith("http"):
+                if href not in seen:
+                    seen.add(href)
+                    urls.append((href, item.get_text(strip=True)))
+                if len(urls) >= 10:
+                    break
+        return urls
+
+    def _search_naver(self, keyword, page=1):
+        """Naver 블로그 검색에서 티스토리 (URL, 제목) 추출"""
+        response = self.http.get(
+            "https://search.naver.com/search.naver",
+            params={
+                "where": "blog",
+                "query": f"{keyword} tistory",
+                "start": (page - 1) * 10 + 1,
+            },
+            headers=self.SEARCH_HEADERS,
+        )
+        soup = BeautifulSoup(response.text, "html.parser")
+
+        # Naver 검색 결과 파싱
+        urls = []
+        seen = set()
+        for item in soup.select("a.link_bf_title, a.api_txt_lines"):
+            href = item.get("href", "")
+            if "tistory.com" in href and href.startswith("http"):
+                if href not in seen:
+                    seen.add(href)
+                    urls.append((href, item.get_text(strip=True)))
+                if len(urls) >= 10:
+                    break
+        return urls
 
     def search_tistory_direct(self, keyword, page=1):
         """티스토리 직접 검색 (대체 방법)"""
@@ -331,32 +413,7 @@ class TistoryCrawler:
 
             # Daum 검색 API 사용
             try:
-                daum_url = "https://search.daum.net/search"
-                params = {"w": "blog", "q": f"{keyword} tistory", "p": page}
-
-                headers = {
-                    "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36",
-                    "Accept": "text/html,application/xhtml+xml,application/xml;q=0.9,*/*;q=0.8",
-                    "Accept-Language": "ko-KR,ko;q=0.9",
-                }
-
-                response = self.session.get(
-                    daum_url,
-                    params=params,
-                    headers=headers,
-                    timeout=self.config.REQUEST_TIMEOUT,
-                )
-                soup = BeautifulSoup(response.text, "html.parser")
-
-                # Daum 검색 결과 파싱
-                for item in soup.select("div.wrap_tit a, a.f_link_b"):
-                    href = item.get("href", "")
-                    if "tistory.com" in href and href.startswith("http"):
-                        if href not in urls:
-                            urls.append(href)
-                        if len(urls) >= 10:
-                            break
-
+                urls.extend(href for href, _ in self._search_daum(keyword, page))
                 print(f"  Daum 검색에서 {len(urls)}개 URL 발견")
             except Exception as e:
                 print(f"  Daum 검색 오류: {e}")
@@ -364,33 +421,12 @@ class TistoryCrawler:
             # Naver 검색도 시도
             if len(urls) < 10:
                 try:
-                    naver_url = "https://search.naver.com/search.naver"
-                    params = {
-                        "where": "blog",
-                        "query": f"{keyword} tistory",
-                        "start": (page - 1) * 10 + 1,
-                    }
-
-                    response = self.session.get(
-                        naver_url,
-                        params=params,
-                        headers=headers,
-                        timeout=self.config.REQUEST_TIMEOUT,
-                    )
-                    soup = BeautifulSoup(response.text, "html.parser")
-
-                    # Naver 검색 결과 파싱
-                    for item in soup.select("a.link_bf_title, a.api_txt_lines"):
-                        href = item.get("href", "")
-                        if "tistory.com" in href and href.startswith("http"):
-                            if href not in urls:
-                                urls.append(href)
-                            if len(urls) >= 20:
-                                break
-
-                    print(
-                        f"  Naver 검색에서 추가로 {len(urls) - len(urls[:10])}개 URL 발견"
-                    )
+                    found = 0
+                    for href, _ in self._search_naver(keyword, page):
+                        if href not in urls:
+                            urls.append(href)
+                            found += 1
+                    print(f"  Naver 검색에서 추가로 {found}개 URL 발견")
                 except Exception as e:
                     print(f"  Naver 검색 오류: {e}")
 
@@ -411,10 +447,10 @@ class TistoryCrawler:
                 for blog_base in fashion_blogs:
                     try:
                         # 블로그 메인 페이지 접속
-                        response = self.session.get(blog_base, timeout=5)
+                        response = self.http.get(blog_base, timeout=5)
                         if (
                             response.status_code == 200
-                            and "tistory.com" in response.url
+                            and "tistory.com" in str(response.url)
                         ):
                             soup = BeautifulSoup(response.text, "html.parser")
                             # 최근 포스트 링크 추출
@@ -422,7 +458,7 @@ class TistoryCrawler:
                                 href = link.get("href", "")
                                 text = link.get_text().lower()
                                 if keyword.lower() in text or "유니폼" in text:
-                                    full_url = urljoin(response.url, href)
+                                    full_url = urljoin(str(response.url), href)
                                     if (
                                         "tistory.com" in full_url
                                         and full_url not in urls
@@ -438,6 +474,37 @@ class TistoryCrawler:
             print(f"직접 검색 오류: {e}")
             return []
 
+    def _fetch_post_html(self, url):
+        """포스트 HTML을 스트리밍으로 받으며 2단계 필터 적용 (거부 시 None)"""
+        if not self.config.PREFILTER:
+            response = self.http.get(url)
+            response.raise_for_status()
+            return response.text
+
+        scanner = self.quality_filter.stream_scanner()
+        with self.http.stream("GET", url) as response:
+            response.raise_for_status()
+            decoder = codecs.getincrementaldecoder(response.encoding or "utf-8")(
+                errors="replace"
+            )
+            parts = []
+            for chunk in response.iter_bytes(chunk_size=self.config.STREAM_CHUNK_SIZE):
+                text = decoder.decode(chunk)
+                parts.append(text)
+                if not scanner.feed(text):
+                    # 나머지 본문은 받지 않고 연결 종료
+                    break
+            else:
+                parts.append(decoder.decode(b"", final=True))
+                scanner.finish()
+
+        if scanner.reason:
+            self.quality_filter.reject("stream")
+            print(f"  -> 본문 스트리밍 필터 제외: {scanner.reason}")
+            self.logger.info(f"스트리밍 필터 제외: {url} ({scanner.reason})")
+            return None
+        return "".join(parts)
+
     def get_post_content(self, url):
         """티스토리 포스트 상세 내용 가져오기"""
         try:
@@ -445,10 +512,11 @@ class TistoryCrawler:
             if "/m/" in url or "/m." in url:
                 url = url.replace("/m/", "/").replace("/m.", ".")
 
-            response = self.session.get(url, timeout=self.config.REQUEST_TIMEOUT)
-            response.raise_for_status()
+            html = self._fetch_post_html(url)
+            if html is None:
+                return None
 
-            soup = BeautifulSoup(response.text, "html.parser")
+            soup = BeautifulSoup(html, "html.parser")
 
             # 제목 추출
             title = None
@@ -557,6 +625,7 @@ class TistoryCrawler:
 
             # 키워드 필터링 적용
             if not self._check_content_quality(title, content_text):
+                self.quality_filter.reject("parse")
                 self.logger.info(f"콘텐츠 품질 기준 미달: {url}")
                 return None
 
@@ -641,55 +710,98 @@ class TistoryCrawler:
             return False
 
 
-    def save_to_database(self, brand_official_name, url, post_data):
-        """데이터베이스에 저장 (테이블 컬럼에 맞춤)"""
-        try:
+    def find_saved_posts(self, urls):
+        """검색 결과 중 이미 저장된 (blog_name, entry_id) 조회 (한 번의 IN 쿼리)"""
+        keys = []
+        for url in urls:
             blog_name, entry_id = self.extract_blog_info(url)
+            if blog_name and entry_id:
+                keys.append((blog_name, entry_id))
+        try:
+            return DataQueries.find_existing_keys(
+                Tables.RAW_TISTORY_DATA, DataQueries.RAW_TISTORY_KEY, keys
+            )
+        except Exception as e:
+            print(f"중복 체크 오류: {e}")
+            return set()
 
-            # 중복 체크 (entry_id가 없으면 blog_url까지 전달)
-            if self.check_duplicate(blog_name, entry_id, url):
-                print(f"  -> 이미 저장된 포스트입니다: {blog_name}/{entry_id if entry_id else url}")
-                return False
-
-            # 데이터 준비 (05_raw_tistory_data 테이블 컬럼에 맞게)
-            data = {
-                "brand_name": brand_official_name,
-                "blog_name": blog_name,
-                "entry_id": entry_id,
-                "blog_url": url,
-                "post_title": post_data.get("title", ""),
-                "post_content": post_data.get("content_html", ""),
-                "author_name": post_data.get("author", ""),
-                "category": post_data.get("category", ""),
-                "tags": post_data.get("tags", []),
-                "images": post_data.get("images", []),
-                "posted_at": post_data.get("posted_at"),
-                "crawled_at": datetime.now(),
-            }
+    def load_known_posts(self, brand_official_name):
+        """브랜드의 저장된 (blog_name, entry_id) 전체를 메모리로 로드 (증분 크롤링용)"""
+        try:
+            known = DataQueries.get_known_post_keys(
+                Tables.RAW_TISTORY_DATA, DataQueries.RAW_TISTORY_KEY, brand_official_name
+            )
+            print(f"저장된 포스트 {len(known)}개 로드 (증분 모드)")
+            return known
+        except Exception as e:
+            print(f"저장된 포스트 로드 실패: {e}")
+            return set()
 
-            # 필수값 체크
-            if not blog_name or not entry_id:
-                print(f"  -> 저장 스킵: blog_name 또는 entry_id 없음 | url: {url}")
-                return False
-            if not data["post_title"] or not data["post_content"]:
-                print(f"  -> 저장 스킵: 제목/본문 없음 | url: {url}")
-                return False
-
-            # 데이터베이스에 저장
-            DataQueries.insert_raw_tistory_data(data)
-            print(f"  -> 저장 완료: {post_data.get('title', 'Untitled')[:40]}...")
-            return True
+    def save_to_database(self, brand_official_name, url, post_data):
+        """저장할 행을 버퍼에 추가 (테이블 컬럼에 맞춤, 실제 저장은 flush_to_database)"""
+        blog_name, entry_id = self.extract_blog_info(url)
 
-        except Exception as e:
-            print(f"  -> 저장 실패: {e}")
+        # 데이터 준비 (05_raw_tistory_data 테이블 컬럼에 맞게)
+        data = {
+            "brand_name": brand_official_name,
+            "blog_name": blog_name,
+            "entry_id": entry_id,
+            "blog_url": url,
+            "post_title": post_data.get("title", ""),
+            "post_content": post_data.get("content_html", ""),
+            "author_name": post_data.get("author", ""),
+            "category": post_data.get("category", ""),
+            "tags": post_data.get("tags", []),
+            "images": post_data.get("images", []),
+            "posted_at": post_data.get("posted_at"),
+            "crawled_at": datetime.now(),
+        }
+
+        # 필수값 체크
+        if not blog_name or not entry_id:
+            print(f"  -> 저장 스킵: blog_name 또는 entry_id 없음 | url: {url}")
             return False
+        if not data["post_title"] or not data["post_content"]:
+            print(f"  -> 저장 스킵: 제목/본문 없음 | url: {url}")
+            return False
+
+        self.pending_rows.append(data)
+        return True
 
-    def crawl_brand_blogs(self, brand_official_name, max_pages=10):
-        """브랜드 티스토리 블로그 크롤링 (brand_official_name 기반)"""
+    def flush_to_database(self):
+        """버퍼에 쌓인 행을 중복 제거 후 한 트랜잭션으로 일괄 저장"""
+        if not self.pending_rows:
+            return 0
+
+        rows, self.pending_rows = self.pending_rows, []
+        try:
+            inserted = DataQueries.bulk_insert_raw_tistory_data(rows)
+        except Exception as e:
+            print(f"  -> 일괄 저장 실패 ({len(rows)}개): {e}")
+            self.logger.error(f"일괄 저장 실패 ({len(rows)}개): {e}")
+            return 0
+
+        print(f"  -> 일괄 저장 완료: {len(inserted)}개 저장, {len(rows) - len(inserted)}개 중복 건너뜀")
+        return len(inserted)
+
+    def crawl_brand_blogs(self, brand_official_name, max_pages=10,
+                          incremental=False, stop_after_known=None):
+        """브랜드 티스토리 블로그 크롤링 (brand_official_name 기반)
+
+        incremental=True이면 저장된 포스트 키를 한 번에 로드해 본문 요청 전에 건너뛰고,
+        이미 본 포스트가 stop_after_known개 연속되면 다음 검색 페이지를 요청하지 않는다.
+        """
+        if stop_after_known is None:
+            stop_after_known = self.config.INCREMENTAL_STOP_AFTER
         print(f"\n브랜드 '{brand_official_name}' 티스토리 블로그 크롤링 시작...")
 
         saved_count = 0
         crawled_count = 0
+        skipped_known = 0
+        # 증분 모드: 저장된 포스트 키 (watermark)와 연속으로 이미 본 결과 수
+        known_keys = self.load_known_posts(brand_official_name) if incremental else None
+        known_run = 0
+        self.quality_filter.reset_stats()
 
         for page in range(1, max_pages + 1):
             print(f"\n페이지 {page} 검색 중...")
@@ -702,11 +814,38 @@ class TistoryCrawler:
 
             print(f"  {len(urls)}개 URL 발견")
 
+            # 이미 저장된 포스트는 본문 요청 전에 제외
+            saved_keys = known_keys if incremental else self.find_saved_posts(urls)
+
             # 각 URL 크롤링
             for url in urls:
                 crawled_count += 1
                 print(f"\n크롤링 중 [{crawled_count}]: {url[:70]}...")
 
+                blog_name, entry_id = self.extract_blog_info(url)
+                if (blog_name, entry_id) in saved_keys:
+                    known_run += 1
+                    skipped_known += 1
+                    print(f"  -> 이미 저장된 포스트입니다: {blog_name}/{entry_id}")
+                    continue
+                known_run = 0
+                if incremental and blog_name and entry_id:
+                    # 같은 실행에서 다시 나오면 건너뛰도록 watermark에 추가
+                    known_keys.add((blog_name, entry_id))
+
+                # 1단계 필터: 검색 결과 제목/URL slug (본문 요청 전)
+                if self.config.PREFILTER:
+                    title = (
+                        self.search_federation.title_for(url)
+                        if self.search_federation is not None
+                        else ""
+                    )
+                    reason = self.quality_filter.check_snippet(url, title)
+                    if reason:
+                        print(f"  -> 검색 결과 필터 제외: {reason}")
+                        self.logger.info(f"검색 결과 필터 제외: {url} ({reason})")
+                        continue
+
                 # 포스트 내용 가져오기
                 post_data = self.get_post_content(url)
                 if not post_data:
@@ -715,26 +854,47 @@ class TistoryCrawler:
 
                 # 이미지 개수 체크
                 if len(post_data.get("images", [])) < self.config.MIN_IMAGES:
+                    self.quality_filter.reject("images")
                     print(f"  -> 이미지 부족 ({len(post_data.get('images', []))}개)")
                     self.logger.info(
                         f"이미지 부족: {url} ({len(post_data.get('images', []))}개)"
                     )
                     continue
 
-                # 데이터베이스 저장
-                if self.save_to_database(brand_official_name, url, post_data):
-                    saved_count += 1
+                # 저장 버퍼에 추가
+                self.quality_filter.accept()
+                self.save_to_database(brand_official_name, url, post_data)
 
                 # 크롤링 간격 (랜덤)
                 self.random_delay()
 
+            # 페이지 단위 일괄 저장
+            saved_count += self.flush_to_database()
+
+            # 증분 모드: 이미 본 포스트가 연속으로 이어지면 이후 페이지는 검색하지 않음
+            if incremental and known_run >= stop_after_known:
+                print(f"이미 저장된 포스트가 {known_run}개 연속 - 페이지 탐색 중단")
+                self.logger.info(f"증분 크롤링 중단: 연속 {known_run}개 기존 포스트 (페이지 {page})")
+                break
+
             # 페이지 간 대기 (랜덤)
             self.random_delay(self.config.PAGE_DELAY, self.config.PAGE_DELAY * 2)
 
+        # 남은 버퍼 저장
+        saved_count += self.flush_to_database()
+
         print(f"\n크롤링 완료!")
         print(f"- 크롤링한 포스트: {crawled_count}개")
         print(f"- 저장된 포스트: {saved_count}개")
 
+        filter_stats = self.quality_filter.summary()
+        print(
+            f"- 품질 필터: 후보 {filter_stats['candidates']}개 -> "
+            f"검색결과 {filter_stats['rejected_snippet']} / 스트리밍 {filter_stats['rejected_stream']} / "
+            f"파싱 {filter_stats['rejected_parse']} / 이미지 {filter_stats['rejected_images']}개 제외, "
+            f"통과 {filter_stats['passed']}개"
+        )
+
         self.logger.info(
             f"브랜드 '{brand_official_name}' 크롤링 완료 - 크롤링: {crawled_count}, 저장: {saved_count}"
         )
@@ -743,4 +903,6 @@ class TistoryCrawler:
             "brand_name": brand_official_name,
             "crawled_count": crawled_count,
             "saved_count": saved_count,
+            "skipped_known": skipped_known,
+            "filter_stats": filter_stats,
         }
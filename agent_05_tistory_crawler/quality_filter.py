@@ -0,0 +1,329 @@
+"""
+Tistory Post Quality Filter
+본문 전체를 파싱하기 전에 단계적으로 후보를 걸러내는 필터
+
+1. snippet: 검색 결과 제목과 URL slug에 네거티브 키워드가 있으면 요청하지 않음
+2. stream: 본문을 스트리밍으로 읽으면서 get_post_content와 같은 우선순위로 본문 컨테이너를
+   고르고, 그 텍스트(script/style/iframe/광고 제외)에서만 네거티브 키워드를 검사함.
+   최우선 컨테이너(entry-content)면 즉시 중단하고, 그보다 낮은 컨테이너는 더 높은 컨테이너가
+   열리지 않은 채 스트림이 끝날 때 거부함. 포지티브 키워드와 최소 이미지 수가 확인되면
+   더 이상 검사하지 않음 (컨테이너 밖의 사이드바/푸터/위젯은 검사하지 않음)
+3. parse: 통과한 후보만 BeautifulSoup으로 전체 파싱 (기존 품질 체크 적용)
+
+키워드 검사는 키워드 목록을 하나의 정규식으로 컴파일해 한 번만 훑는다.
+"""
+import re
+from collections import Counter
+from html.parser import HTMLParser
+from typing import Dict, Iterable, Optional
+from urllib.parse import unquote, urlparse
+
+# get_post_content의 content_selectors (우선순위 순): (태그, 속성, 값)
+CONTENT_SELECTORS = (
+    ("div", "class", "entry-content"),
+    ("div", "class", "tt_article_useless_p_margin"),
+    ("div", "class", "contents_style"),
+    ("div", "class", "article_view"),
+    ("article", "class", "article"),
+    ("div", "class", "post-content"),
+    ("div", "id", "content"),
+    ("div", "class", "area_view"),
+)
+CONTAINER_TAG_RE = re.compile(r"<(div|article)\b([^>]*)>", re.IGNORECASE)
+SELECTOR_ATTR_RE = re.compile(r"""(?<![\w-])(class|id)\s*=\s*["']([^"']*)["']""", re.IGNORECASE)
+IMG_TAG_RE = re.compile(r"<img\b", re.IGNORECASE)
+IMG_TAG_LENGTH = len("<img")
+# 컨테이너 시작 태그가 조각 경계에 걸쳐도 찾을 수 있을 만큼 꼬리를 남김
+MARKER_CARRY = 256
+# get_post_content가 본문에서 제거하는 요소 (script, style, iframe, .adsbygoogle)
+STRIPPED_TAGS = {"script", "style", "iframe"}
+STRIPPED_CLASS = "adsbygoogle"
+VOID_TAGS = {
+    "area", "base", "br", "col", "embed", "hr", "img", "input",
+    "link", "meta", "source", "track", "wbr",
+}
+
+
+def container_priority(tag: str, attrs: str) -> Optional[int]:
+    """시작 태그가 해당하는 content_selectors 중 가장 높은 우선순위 (0이 최우선, 해당 없으면 None)"""
+    values = {name.lower(): value.split() for name, value in SELECTOR_ATTR_RE.findall(attrs)}
+    tag = tag.lower()
+    for priority, (selector_tag, attr, value) in enumerate(CONTENT_SELECTORS):
+        if tag == selector_tag and value in values.get(attr, ()):
+            return priority
+    return None
+
+
+class KeywordMatcher:
+    """여러 키워드를 하나의 alternation 정규식으로 검사"""
+
+    def __init__(self, keywords: Iterable[str]):
+        self.keywords = [k for k in dict.fromkeys(keywords) if k]
+        # 긴 키워드를 먼저 두어 겹치는 키워드 중 가장 구체적인 것이 잡히도록
+        ordered = sorted(self.keywords, key=len, reverse=True)
+        self.pattern = re.compile("|".join(map(re.escape, ordered))) if ordered else None
+        self.max_length = max((len(k) for k in self.keywords), default=0)
+
+    def find(self, text: str) -> Optional[str]:
+        """처음 발견된 키워드 반환 (없으면 None)"""
+        if not self.pattern or not text:
+            return None
+        match = self.pattern.search(text)
+        return match.group(0) if match else None
+
+
+class ContainerTextParser(HTMLParser):
+    """본문 컨테이너 태그 하나의 텍스트만 증분 추출 (제거 대상 요소 제외, 컨테이너가 닫히면 종료)
+
+    첫 시작 태그를 컨테이너로 보고, 같은 이름의 태그 중첩 수로 닫힘을 판단한다.
+    """
+
+    def __init__(self):
+        super().__init__(convert_charrefs=True)
+        self.root = None
+        self.depth = 0
+        self.closed = False
+        self.pieces = []
+        self._skip_tag = None
+        self._skip_depth = 0
+
+    def handle_starttag(self, tag, attrs):
+        if self.closed:
+            return
+        if self.root is None:
+            self.root = tag
+            self.depth = 1
+            return
+        if tag == self.root and tag not in VOID_TAGS:
+            self.depth += 1
+        if self._skip_tag is not None:
+            if tag == self._skip_tag:
+                self._skip_depth += 1
+        elif tag in STRIPPED_TAGS or STRIPPED_CLASS in (dict(attrs).get("class") or "").split():
+            if tag not in VOID_TAGS:
+                self._skip_tag = tag
+                self._skip_depth = 1
+
+    def handle_endtag(self, tag):
+        if self.closed:
+            return
+        if self._skip_tag is not None and tag == self._skip_tag:
+            self._skip_depth -= 1
+            if self._skip_depth == 0:
+                self._skip_tag = None
+        if tag == self.root:
+            self.depth -= 1
+            if self.depth == 0:
+                self.closed = True
+
+    def handle_data(self, data):
+        if not self.closed and self._skip_tag is None and self.depth > 0:
+            data = data.strip()
+            if data:
+                self.pieces.append(data)
+
+    def take_text(self) -> str:
+        """지난 호출 이후 추출된 텍스트 (get_text(separator="\\n")처럼 줄바꿈으로 연결)"""
+        text = "\n".join(self.pieces)
+        self.pieces = []
+        return text
+
+
+class StreamScanner:
+    """스트리밍으로 들어오는 HTML 조각을 본문 시작 이후부터 검사
+
+    get_post_content는 content_selectors를 우선순위대로 select_one 하므로, 더 높은 우선순위의
+    컨테이너가 열리면 (중첩 여부와 관계없이) 그 컨테이너로 전환해 텍스트를 다시 모은다.
+    """
+
+    def __init__(self, quality_filter: "QualityFilter"):
+        self.filter = quality_filter
+        self.in_body = False
+        self.settled = False  # 통과 근거 확보 -> 이후 조각은 검사하지 않음
+        self.positive_found = False
+        self.image_count = 0
+        self.reason = None
+        self.priority = None  # 현재 본문 컨테이너의 content_selectors 우선순위
+        self._carry = ""  # 조각 경계에 걸친 키워드/시작 태그를 위해 남겨 둔 꼬리
+        self._content = None  # 본문 컨테이너 텍스트 파서 (컨테이너가 닫히거나 실패하면 None)
+        self._text_carry = ""  # 컨테이너 텍스트 조각 경계에 걸친 키워드용 꼬리
+        self._pending = None  # 더 높은 컨테이너가 열리지 않으면 스트림 종료 시 적용할 거부 사유
+        self._keep = max(
+            quality_filter.negative.max_length,
+            quality_filter.positive.max_length,
+            IMG_TAG_LENGTH,
+            MARKER_CARRY + 1,
+        ) - 1
+
+    def feed(self, text: str) -> bool:
+        """조각 하나를 검사. 거부해야 하면 False"""
+        if self.settled or self.reason:
+            return not self.reason
+
+        window = self._carry + text
+        carried = len(self._carry)
+
+        body_start, switch_at = self._find_containers(window, carried)
+        if not self.in_body:
+            if body_start is None:
+                self._carry = window[-self._keep:]
+                return True
+            self.in_body = True
+
+        if switch_at is not None:
+            self._content = ContainerTextParser()
+            self._text_carry = ""
+            self._pending = None
+            content_html = window[switch_at:]
+        else:
+            content_html = text
+
+        if body_start is not None:
+            # 본문 시작 전 부분은 포지티브/이미지 검사에서 제외
+            window = window[body_start:]
+            carried = 0
+
+        # 네거티브 키워드는 본문 컨테이너의 텍스트에서만 검사 (나머지는 parse 단계에 맡김)
+        if self._content is not None:
+            negative = self._scan_content(content_html)
+            if negative:
+                reason = f"네거티브 키워드: {negative}"
+                if self.priority == 0:
+                    # 최우선 컨테이너는 다른 컨테이너로 바뀌지 않으므로 즉시 거부
+                    self.reason = reason
+                    return False
+                self._pending = self._pending or reason
+
+        if not self.positive_found:
+            self.positive_found = self.filter.positive.find(window.lower()) is not None
+        # 이전 조각에서 이미 센 <img는 제외
+        self.image_count += sum(
+            1 for m in IMG_TAG_RE.finditer(window) if m.end() > carried
+        )
+
+        if self.positive_found and self.image_count >= self.filter.min_images and not self._pending:
+            self.settled = True
+        self._carry = window[-self._keep:]
+        return True
+
+    def _find_containers(self, window: str, carried: int):
+        """새로 들어온 부분에서 본문 컨테이너 시작 태그 탐색
+
+        Returns:
+            (본문이 처음 시작된 위치 또는 None,
+             현재보다 우선순위가 높은 컨테이너 중 마지막으로 전환할 위치 또는 None)
+        """
+        body_start = None
+        switch_at = None
+        if self.priority == 0:
+            return body_start, switch_at
+        for match in CONTAINER_TAG_RE.finditer(window):
+            if match.end() <= carried:
+                continue  # 이전 조각에서 이미 처리한 태그
+            priority = container_priority(match.group(1), match.group(2))
+            if priority is None:
+                continue
+            if not self.in_body and body_start is None:
+                body_start = match.start()
+            if self.priority is None or priority < self.priority:
+                self.priority = priority
+                switch_at = match.start()
+                if priority == 0:
+                    break
+        return body_start, switch_at
+
+    def _scan_content(self, html: str) -> Optional[str]:
+        """컨테이너 HTML 조각을 파서에 넣고 새로 추출된 텍스트에서 네거티브 키워드 검색"""
+        try:
+            self._content.feed(html)
+        except Exception:
+            # 파싱할 수 없는 마크업은 parse 단계에서 판정
+            self._content = None
+            return None
+        text = self._content.take_text()
+        negative = None
+        if text:
+            combined = self._text_carry + "\n" + text if self._text_carry else text
+            negative = self.filter.negative.find(combined)
+            self._text_carry = combined[-self._keep:] if self._keep > 0 else ""
+        if self._content.closed:
+            self._content = None
+        return negative
+
+    def finish(self) -> bool:
+        """스트림 종료 후 판정. 최종 컨테이너에 네거티브 키워드가 있거나 본문 안의 <img> 태그가
+        최소 개수보다 적으면 거부"""
+        if self.reason:
+            return False
+        if self._pending:
+            # 끝까지 더 높은 우선순위의 컨테이너가 없었으므로 parse 단계도 이 컨테이너를 고름
+            self.reason = self._pending
+            return False
+        if self.in_body and not self.settled and self.image_count < self.filter.min_images:
+            # 원시 <img> 수는 실제 추출될 이미지 수의 상한이므로 안전하게 거부 가능
+            self.reason = f"이미지 부족 ({self.image_count}개)"
+            return False
+        return True
+
+
+class QualityFilter:
+    """단계별 콘텐츠 품질 필터와 단계별 거부 통계"""
+
+    STAGES = ("snippet", "stream", "parse", "images")
+
+    def __init__(self, negative_keywords: Iterable[str], positive_keywords: Iterable[str],
+                 min_images: int = 0, min_content_length: int = 0):
+        self.negative = KeywordMatcher(negative_keywords)
+        self.positive = KeywordMatcher(positive_keywords)
+        self.min_images = min_images
+        self.min_content_length = min_content_length
+        self.stats = Counter()
+
+    def reset_stats(self):
+        self.stats = Counter()
+
+    def reject(self, stage: str):
+        """단계별 거부 수 집계"""
+        self.stats[f"rejected_{stage}"] += 1
+
+    def accept(self):
+        """모든 단계를 통과한 후보 집계"""
+        self.stats["passed"] += 1
+
+    def check_snippet(self, url: str, title: str = "") -> Optional[str]:
+        """1단계: 검색 결과 제목과 URL slug 검사. 거부 사유 또는 None"""
+        self.stats["candidates"] += 1
+        slug = unquote(urlparse(url).path)
+        negative = self.negative.find(title) or self.negative.find(slug)
+        if negative:
+            self.reject("snippet")
+            return f"네거티브 키워드: {negative}"
+        return None
+
+    def stream_scanner(self) -> StreamScanner:
+        """2단계: 본문 스트리밍 검사기"""
+        return StreamScanner(self)
+
+    def check_content(self, title: str, content: str) -> bool:
+        """3단계: 파싱된 제목/본문 검사 (기존 _check_content_quality와 동일한 기준)"""
+        if not title or not content:
+            return False
+
+        # 콘텐츠 길이 체크
+        if len(content) < self.min_content_length:
+            return False
+
+        # 네거티브 키워드 체크
+        if self.negative.find(title) or self.negative.find(content):
+            return False
+
+        # 포지티브 키워드 체크 (최소 하나는 포함되어야 함)
+        return bool(self.positive.find(title.lower()) or self.positive.find(content.lower()))
+
+    def summary(self) -> Dict[str, int]:
+        """후보 수, 단계별 거부 수, 최종 통과 수"""
+        result = {"candidates": self.stats["candidates"]}
+        for stage in self.STAGES:
+            result[f"rejected_{stage}"] = self.stats[f"rejected_{stage}"]
+        result["passed"] = self.stats["passed"]
+        return result
@@ -32,6 +32,7 @@ def crawl_single_brand(brand_official_name, crawler=None):
     result = crawler.crawl_brand_blogs(
         brand_official_name=brand["brand_official_name"],
         max_pages=Config.MAX_PAGES_PER_BRAND,
+        incremental=Config.INCREMENTAL,
     )
     return result
 
@@ -83,6 +84,9 @@ def main():
   # 모든 브랜드 크롤링
   python run_crawler.py --all
   
+  # 새 글만 증분 크롤링
+  python run_crawler.py --all --incremental
+  
   # 커스텀 설정으로 크롤링
   python run_crawler.py --brand-id 1 --max-pages 5
         """,
@@ -101,11 +105,18 @@ def main():
         default=Config.MAX_PAGES_PER_BRAND,
         help=f"브랜드당 최대 크롤링 페이지 수 (기본: {Config.MAX_PAGES_PER_BRAND})",
     )
+    parser.add_argument(
+        "--incremental",
+        action="store_true",
+        default=Config.INCREMENTAL,
+        help=f"증분 크롤링: 저장된 포스트를 건너뛰고 {Config.INCREMENTAL_STOP_AFTER}개 연속으로 이미 본 결과가 나오면 중단",
+    )
 
     args = parser.parse_args()
 
     # 설정 확인
     Config.ensure_directories()
+    Config.INCREMENTAL = args.incremental
 
     print("🚀 티스토리 블로그 크롤러 시작")
     print(f"⏰ 시작 시간: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}")
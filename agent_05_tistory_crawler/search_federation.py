@@ -0,0 +1,219 @@
+"""
+Tistory Search Federation
+구글/다음/네이버 검색을 동시에 실행하고 결과 URL을 병합하는 검색 계층
+
+엔진별 검색 결과 페이지는 (keyword, engine, page) 단위로 TTL 캐시에 저장되어
+재실행이나 재시도 시 검색 엔진을 다시 호출하지 않는다. 엔진이 (url, title)
+쌍을 돌려주면 검색 결과 제목도 함께 보관해 본문 요청 전 필터에 사용한다.
+"""
+import json
+import time
+import sqlite3
+import logging
+import threading
+from concurrent.futures import ThreadPoolExecutor, as_completed, TimeoutError
+from pathlib import Path
+from typing import Callable, Dict, List, Optional, Sequence, Union
+from urllib.parse import urlparse
+
+logger = logging.getLogger("TistoryCrawler")
+
+# 엔진 결과 항목: URL 문자열 또는 (URL, 검색 결과 제목)
+SearchEntry = Union[str, Sequence[str]]
+
+
+def _split_entry(entry: SearchEntry):
+    """검색 결과 항목을 (url, title)로 분리"""
+    if isinstance(entry, str):
+        return entry, ""
+    url, title = (list(entry) + [""])[:2]
+    return url, title or ""
+
+
+def canonicalize_tistory_url(url: str) -> Optional[str]:
+    """티스토리 포스트 URL 정규화 (모바일 URL -> 데스크톱, 쿼리/프래그먼트 제거)
+
+    티스토리 포스트가 아니거나 카테고리/태그 페이지이면 None 반환
+    """
+    if not url or not url.startswith("http"):
+        return None
+
+    # 모바일 URL을 데스크톱 URL로 변경 (get_post_content와 동일한 규칙)
+    if "/m/" in url or "/m." in url:
+        url = url.replace("/m/", "/").replace("/m.", ".")
+
+    parsed = urlparse(url)
+    netloc = parsed.netloc.lower()
+    if not netloc.endswith(".tistory.com"):
+        return None
+
+    path = parsed.path.rstrip("/")
+    if not path or "/category" in path or "/tag" in path:
+        return None
+
+    return f"https://{netloc}{path}"
+
+
+class SearchResultCache:
+    """(keyword, engine, page)별 검색 결과 [url, title] 목록을 저장하는 SQLite TTL 캐시"""
+
+    def __init__(self, path: str, ttl_seconds: int = 6 * 3600):
+        self.path = path
+        self.ttl_seconds = ttl_seconds
+        self.hits = 0
+        self.misses = 0
+        self._lock = threading.Lock()
+
+        Path(path).parent.mkdir(parents=True, exist_ok=True)
+        self._conn = sqlite3.connect(path, check_same_thread=False, timeout=30)
+        with self._lock:
+            self._conn.execute("PRAGMA journal_mode=WAL")
+            self._conn.execute("""
+                CREATE TABLE IF NOT EXISTS search_cache (
+                    keyword TEXT NOT NULL,
+                    engine TEXT NOT NULL,
+                    page INTEGER NOT NULL,
+                    urls TEXT NOT NULL,
+                    created_at REAL NOT NULL,
+                    PRIMARY KEY (keyword, engine, page)
+                )
+            """)
+            self._conn.commit()
+
+    def get(self, keyword: str, engine: str, page: int) -> Optional[List[SearchEntry]]:
+        """캐시된 검색 결과 반환 (없거나 만료되면 None)"""
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT urls, created_at FROM search_cache "
+                "WHERE keyword = ? AND engine = ? AND page = ?",
+                (keyword, engine, page)
+            ).fetchone()
+            if row is None or time.time() - row[1] > self.ttl_seconds:
+                self.misses += 1
+                return None
+            self.hits += 1
+        return json.loads(row[0])
+
+    def set(self, keyword: str, engine: str, page: int, urls: List[SearchEntry]):
+        """검색 결과 저장 및 만료된 항목 정리"""
+        now = time.time()
+        with self._lock:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO search_cache (keyword, engine, page, urls, created_at) "
+                "VALUES (?, ?, ?, ?, ?)",
+                (keyword, engine, page, json.dumps(urls, ensure_ascii=False), now)
+            )
+            self._conn.execute(
+                "DELETE FROM search_cache WHERE created_at < ?", (now - self.ttl_seconds,)
+            )
+            self._conn.commit()
+
+    def close(self):
+        with self._lock:
+            self._conn.close()
+
+
+class SearchFederation:
+    """여러 검색 엔진을 동시에 호출해 중복 없는 티스토리 URL을 모으는 검색기
+
+    Args:
+        engines: 엔진 이름 -> search(keyword, page) 함수 (URL 또는 (URL, 제목) 목록 반환)
+        cache: 엔진별 결과 캐시 (None이면 캐시 사용 안 함)
+        min_candidates: 이 개수 이상 모이면 남은 엔진을 기다리지 않고 반환
+        timeout: 엔진 응답을 기다리는 최대 시간 (초)
+        max_results: 반환할 최대 URL 수
+    """
+
+    def __init__(self, engines: Dict[str, Callable[[str, int], List[str]]],
+                 cache: Optional[SearchResultCache] = None,
+                 min_candidates: int = 10, timeout: float = 30,
+                 max_results: int = 20):
+        self.engines = engines
+        self.cache = cache
+        self.min_candidates = min_candidates
+        self.timeout = timeout
+        self.max_results = max_results
+        self.titles: Dict[str, str] = {}  # 정규화 URL -> 검색 결과 제목
+        self._pool = ThreadPoolExecutor(
+            max_workers=max(1, len(engines)), thread_name_prefix="tistory-search"
+        )
+
+    def _run_engine(self, name: str, keyword: str, page: int) -> List[List[str]]:
+        """엔진 하나를 실행하고 정규화된 [url, title] 목록을 캐시에 저장"""
+        try:
+            raw_entries = self.engines[name](keyword, page) or []
+        except Exception as e:
+            logger.error(f"{name} 검색 오류: {e}")
+            return []
+
+        urls = []
+        seen = set()
+        for entry in raw_entries:
+            url, title = _split_entry(entry)
+            canonical = canonicalize_tistory_url(url)
+            if canonical and canonical not in seen:
+                seen.add(canonical)
+                urls.append([canonical, title])
+
+        # 빈 결과는 차단/일시 오류일 수 있으므로 캐시하지 않음
+        if urls and self.cache is not None:
+            try:
+                self.cache.set(keyword, name, page, urls)
+            except sqlite3.Error as e:
+                logger.warning(f"검색 결과 캐시 저장 실패: {e}")
+        return urls
+
+    def search(self, keyword: str, page: int = 1) -> List[str]:
+        """모든 엔진을 동시에 검색해 병합된 URL 목록 반환"""
+        merged: List[str] = []
+        seen = set()
+
+        def merge(entries):
+            for entry in entries:
+                url, title = _split_entry(entry)
+                canonical = canonicalize_tistory_url(url)
+                if canonical and canonical not in seen:
+                    seen.add(canonical)
+                    merged.append(canonical)
+                    if title:
+                        self.titles[canonical] = title
+
+        # 캐시된 엔진 결과 먼저 병합
+        pending = []
+        for name in self.engines:
+            cached = self.cache.get(keyword, name, page) if self.cache is not None else None
+            if cached is None:
+                pending.append(name)
+            else:
+                print(f"  {name} 검색 결과 캐시 사용 ({len(cached)}개)")
+                merge(cached)
+
+        if pending and len(merged) < self.min_candidates:
+            futures = {
+                self._pool.submit(self._run_engine, name, keyword, page): name
+                for name in pending
+            }
+            try:
+                for future in as_completed(futures, timeout=self.timeout):
+                    urls = future.result()
+                    print(f"  {futures[future]} 검색에서 {len(urls)}개 URL 발견")
+                    merge(urls)
+                    if len(merged) >= self.min_candidates:
+                        # 나머지 엔진은 백그라운드에서 끝나면 캐시에만 반영
+                        break
+            except TimeoutError:
+                slow = [name for future, name in futures.items() if not future.done()]
+                logger.warning(f"검색 엔진 응답 지연: {', '.join(slow)}")
+
+        print(f"  통합 검색에서 {len(merged)}개 URL 확보")
+        return merged[:self.max_results]
+
+    def title_for(self, url: str) -> str:
+        """검색 결과에서 본 제목 (없으면 빈 문자열)"""
+        return self.titles.get(canonicalize_tistory_url(url) or url, "")
+
+    def close(self):
+        """진행 중인 검색은 기다리지 않고 풀 종료"""
+        self._pool.shutdown(wait=False)
+        if self.cache is not None:
+            self.cache.close()
@@ -3,11 +3,16 @@ Content analysis tools for Instagram posts
 """
 
 import os
+import sys
 import json
 import re
-from openai import OpenAI
 from dotenv import load_dotenv
 
+# 공용 모듈(shared) 접근을 위해 저장소 루트 추가
+sys.path.append(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+
+from shared.llm_client import get_llm_client
+
 load_dotenv()
 
 
@@ -22,7 +27,7 @@ def analyze_single_file(filename):
         return False
     
     print(f"✅ OpenAI API 키 확인됨: {api_key[:10]}...")
-    client = OpenAI(api_key=api_key)
+    client = get_llm_client(api_key)
     
     if not os.path.exists(filename):
         print(f"⚠️ {filename} 파일이 존재하지 않습니다.")
@@ -8,15 +8,17 @@ import sys
 # 프로젝트 루트를 Python 경로에 추가
 project_root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
 sys.path.insert(0, project_root)
+# 공용 모듈(shared) 접근을 위해 저장소 루트 추가
+sys.path.append(os.path.dirname(project_root))
 
-from openai import OpenAI
+from shared.llm_client import get_llm_client
 from utils.file_utils import load_json_data, save_json_data
 from utils.text_utils import parse_key_value_output
 
 
 class EEATAnalyzer:
     def __init__(self, api_key):
-        self.client = OpenAI(api_key=api_key)
+        self.client = get_llm_client(api_key)
     
     def analyze_posts(self, input_files):
         """게시물 분석 실행"""
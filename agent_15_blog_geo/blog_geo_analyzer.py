@@ -9,11 +9,12 @@ import os
 import logging
 import logging.handlers
 from datetime import datetime
-from typing import Dict, Any, Optional, List, Literal
+from typing import Dict, Any, Iterable, Optional, List, Literal
 
 from .workflow.blog_geo_workflow import create_blog_geo_workflow
 from .workflow.state import create_initial_state
 from .database.queries import BlogGEOQueries
+from .tools.streaming_selector import SpilledResults
 
 
 class BlogGEOAnalyzer:
@@ -107,8 +108,13 @@ class BlogGEOAnalyzer:
         final_state = self.workflow.run(initial_state)
         end_time = datetime.utcnow()
 
-        # 결과 처리
-        results = self._process_results(final_state, start_time, end_time)
+        # 결과 처리 (디스크 기반 분석 결과는 집계 후 임시 파일 삭제)
+        try:
+            results = self._process_results(final_state, start_time, end_time)
+        finally:
+            all_analyses = final_state.get("all_analysis_results")
+            if isinstance(all_analyses, SpilledResults):
+                all_analyses.remove()
 
         # 요청 시 데이터베이스에 저장
         if save_to_database and results["success"]:
@@ -126,13 +132,18 @@ class BlogGEOAnalyzer:
         success = len(errors) == 0 and len(final_state.get("final_reports", [])) > 0
 
         # 메트릭 계산
+        # all_analysis_results는 디스크 기반(SpilledResults)일 수 있으므로 리스트로 만들지 않고 순회
         all_analyses = final_state.get("all_analysis_results", [])
-        valid_analyses = [
-            a for a in all_analyses if "error" not in a and a.get("analysis_report")
-        ]
+
+        def iter_valid_analyses():
+            return (
+                a for a in all_analyses if "error" not in a and a.get("analysis_report")
+            )
+
+        valid_count = sum(1 for _ in iter_valid_analyses())
 
         # 평균 점수 계산
-        avg_scores = self._calculate_average_scores(valid_analyses)
+        avg_scores = self._calculate_average_scores(iter_valid_analyses())
 
         # 컨설팅 결과 추출
         consulting_results = self._extract_consulting_results(
@@ -145,7 +156,7 @@ class BlogGEOAnalyzer:
             "brand_id": final_state["brand_id"],
             "brand_name": final_state["brand_name"],
             "total_posts_analyzed": len(final_state.get("posts_to_analyze", [])),
-            "valid_analyses": len(valid_analyses),
+            "valid_analyses": valid_count,
             "posts_consulted": len(consulting_results),
             "average_scores": avg_scores,
             "analysis_report_path": final_state.get("analysis_report_file"),
@@ -155,7 +166,7 @@ class BlogGEOAnalyzer:
             "errors": errors,
         }
 
-    def _calculate_average_scores(self, analyses: List[Dict]) -> Dict[str, float]:
+    def _calculate_average_scores(self, analyses: Iterable[Dict]) -> Dict[str, float]:
         """모든 분석에 대한 평균 점수 계산"""
         if not analyses:
             return {}
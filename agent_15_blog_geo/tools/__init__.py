@@ -16,9 +16,21 @@ from .api_utils import (
     call_openai_api,
     call_api_with_retry,
     generate_dalle_image,
+    generate_dalle_image_to_file,
     create_chat_completion,
 )
 
+from .concurrent_executor import (
+    RateLimitState,
+    ConcurrentExecutor,
+    create_rate_limited_client,
+)
+
+from .streaming_selector import (
+    SpilledResults,
+    StreamingSelector,
+)
+
 __all__ = [
     # Prompts
     "SYSTEM_PROMPT_ANALYZER",
@@ -32,5 +44,12 @@ __all__ = [
     "call_openai_api",
     "call_api_with_retry",
     "generate_dalle_image",
+    "generate_dalle_image_to_file",
     "create_chat_completion",
+    # Concurrency
+    "RateLimitState",
+    "ConcurrentExecutor",
+    "create_rate_limited_client",
+    "SpilledResults",
+    "StreamingSelector",
 ]
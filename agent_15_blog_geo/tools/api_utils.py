@@ -5,8 +5,10 @@ Handles OpenAI API calls with retry logic and JSON repair.
 """
 
 import json
+import os
 import time
 from typing import List, Dict, Any, Optional
+import httpx
 import openai
 from openai import OpenAI
 
@@ -14,6 +16,8 @@ from openai import OpenAI
 # Configuration
 MAX_RETRIES = 10
 RETRY_DELAY = 10
+IMAGE_DOWNLOAD_TIMEOUT = 60
+IMAGE_DOWNLOAD_CHUNK_SIZE = 64 * 1024
 
 
 def repair_json_with_llm(
@@ -109,7 +113,8 @@ def call_api_with_retry(
     max_tokens: int = 2048,
     temperature: float = 0.3,
     max_retries: int = MAX_RETRIES,
-    retry_delay: int = RETRY_DELAY
+    retry_delay: int = RETRY_DELAY,
+    rate_limiter=None
 ) -> Dict[str, Any]:
     """
     Call API with retry logic for rate limits
@@ -121,7 +126,9 @@ def call_api_with_retry(
         max_tokens: Maximum tokens
         temperature: Temperature setting
         max_retries: Maximum retry attempts
-        retry_delay: Delay between retries in seconds
+        retry_delay: Delay between retries in seconds (without rate_limiter)
+        rate_limiter: Shared RateLimitState; when given, waits for its pause
+            before each attempt and backs off using x-ratelimit-* headers
         
     Returns:
         API response as dictionary
@@ -130,6 +137,8 @@ def call_api_with_retry(
         Exception if all retries fail
     """
     for attempt in range(max_retries):
+        if rate_limiter is not None:
+            rate_limiter.wait()
         try:
             return call_openai_api(
                 client=client,
@@ -143,8 +152,9 @@ def call_api_with_retry(
             
             if '429' in error_message or 'Rate limit' in error_message:
                 if attempt < max_retries - 1:
-                    print(f"  - [경고] Rate limit 발생. {retry_delay}초 후 재시도... (시도 {attempt + 1}/{max_retries})")
-                    time.sleep(retry_delay)
+                    delay = rate_limiter.backoff(attempt, e) if rate_limiter is not None else retry_delay
+                    print(f"  - [경고] Rate limit 발생. {delay:.1f}초 후 재시도... (시도 {attempt + 1}/{max_retries})")
+                    time.sleep(delay)
                 else:
                     print(f"  - [오류] 최대 재시도 횟수({max_retries}) 초과. 중단합니다.")
                     raise e
@@ -189,6 +199,58 @@ def generate_dalle_image(
         return None
 
 
+def generate_dalle_image_to_file(
+    client: OpenAI,
+    prompt: str,
+    file_path: str,
+    size: str = "1024x1024",
+    quality: str = "standard"
+) -> Optional[str]:
+    """
+    Generate image using DALL-E 3 and stream it straight to disk
+    
+    Requests a URL instead of b64_json so the image is never held in memory
+    as a base64 string; the body is written chunk by chunk to a temporary
+    file that is renamed into place once complete.
+    
+    Args:
+        client: OpenAI client
+        prompt: Image generation prompt
+        file_path: Destination PNG path
+        size: Image size
+        quality: Image quality
+        
+    Returns:
+        file_path or None if failed
+    """
+    tmp_path = f"{file_path}.part"
+    try:
+        response = client.images.generate(
+            model="dall-e-3",
+            prompt=prompt,
+            n=1,
+            size=size,
+            quality=quality,
+            response_format="url"
+        )
+        image_url = response.data[0].url
+        
+        with httpx.stream("GET", image_url, timeout=IMAGE_DOWNLOAD_TIMEOUT, follow_redirects=True) as r:
+            r.raise_for_status()
+            with open(tmp_path, "wb") as f:
+                for chunk in r.iter_bytes(IMAGE_DOWNLOAD_CHUNK_SIZE):
+                    f.write(chunk)
+        
+        os.replace(tmp_path, file_path)
+        return file_path
+        
+    except Exception as e:
+        print(f"    [오류] DALL-E 이미지 생성 실패: {e}")
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
+        return None
+
+
 def create_chat_completion(
     client: OpenAI,
     system_prompt: str,
@@ -0,0 +1,271 @@
+"""
+Concurrent Executor for Blog GEO Analysis
+
+Runs per-post LLM calls (analysis, consulting) concurrently with:
+- a configurable concurrency limit
+- adaptive backoff driven by OpenAI's x-ratelimit-* response headers, shared
+  by every worker so one 429 pauses all of them instead of each retrying blind
+- results collected in input order, or streamed as they complete
+"""
+
+import os
+import re
+import random
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from typing import Any, Callable, Iterator, List, Optional, Sequence, Tuple
+
+from openai import OpenAI, DefaultHttpxClient
+from shared.llm_client import CachedOpenAI
+
+
+# Configuration
+DEFAULT_MAX_CONCURRENCY = int(os.getenv("BLOG_GEO_MAX_CONCURRENCY", "4"))
+
+_DURATION_PART_RE = re.compile(r"(\d+(?:\.\d+)?)(ms|h|m|s)")
+_DURATION_UNITS = {"ms": 0.001, "s": 1.0, "m": 60.0, "h": 3600.0}
+
+
+def parse_reset_duration(value: Optional[str]) -> Optional[float]:
+    """
+    Parse x-ratelimit-reset-* values such as "1s", "6m0s", "20ms" or "1.5"
+
+    Returns:
+        Seconds, or None if the value is missing or malformed
+    """
+    if not value:
+        return None
+    value = value.strip()
+    try:
+        return float(value)
+    except ValueError:
+        pass
+    parts = _DURATION_PART_RE.findall(value)
+    if not parts:
+        return None
+    return sum(float(number) * _DURATION_UNITS[unit] for number, unit in parts)
+
+
+def _header_int(headers, name: str) -> Optional[int]:
+    try:
+        return int(headers.get(name))
+    except (TypeError, ValueError):
+        return None
+
+
+class RateLimitState:
+    """
+    Shared rate limit state fed by response headers
+
+    observe() is registered as an httpx response hook, so every response
+    (including 429s) updates the remaining request/token budget. When the
+    budget runs low or a 429 arrives, a shared pause is set until the
+    reported reset time; wait() blocks workers until it passes.
+
+    Args:
+        min_remaining_requests: Pause when fewer requests than this remain
+        min_remaining_tokens: Pause when fewer tokens than this remain
+        base_delay: First backoff delay when a 429 carries no reset hint
+        max_delay: Upper bound for any single pause
+    """
+
+    def __init__(
+        self,
+        min_remaining_requests: int = 1,
+        min_remaining_tokens: int = 2000,
+        base_delay: float = 2.0,
+        max_delay: float = 60.0
+    ):
+        self.min_remaining_requests = min_remaining_requests
+        self.min_remaining_tokens = min_remaining_tokens
+        self.base_delay = base_delay
+        self.max_delay = max_delay
+        self.remaining_requests: Optional[int] = None
+        self.remaining_tokens: Optional[int] = None
+        self.throttled = 0
+        self._resume_at = 0.0
+        self._lock = threading.Lock()
+
+    def _pause(self, seconds: float):
+        seconds = min(max(seconds, 0.0), self.max_delay)
+        with self._lock:
+            self._resume_at = max(self._resume_at, time.monotonic() + seconds)
+
+    def observe(self, response) -> float:
+        """
+        Update state from response headers (httpx response hook)
+
+        Returns:
+            Pause in seconds implied by these headers (0 if none)
+        """
+        headers = response.headers
+        remaining_requests = _header_int(headers, "x-ratelimit-remaining-requests")
+        remaining_tokens = _header_int(headers, "x-ratelimit-remaining-tokens")
+        reset_requests = parse_reset_duration(headers.get("x-ratelimit-reset-requests"))
+        reset_tokens = parse_reset_duration(headers.get("x-ratelimit-reset-tokens"))
+
+        retry_after = None
+        if headers.get("retry-after-ms"):
+            retry_after = parse_reset_duration(headers.get("retry-after-ms"))
+            retry_after = retry_after / 1000 if retry_after is not None else None
+        if retry_after is None:
+            retry_after = parse_reset_duration(headers.get("retry-after"))
+
+        with self._lock:
+            if remaining_requests is not None:
+                self.remaining_requests = remaining_requests
+            if remaining_tokens is not None:
+                self.remaining_tokens = remaining_tokens
+
+        pause = 0.0
+        requests_low = remaining_requests is not None and remaining_requests < self.min_remaining_requests
+        tokens_low = remaining_tokens is not None and remaining_tokens < self.min_remaining_tokens
+        if requests_low and reset_requests:
+            pause = max(pause, reset_requests)
+        if tokens_low and reset_tokens:
+            pause = max(pause, reset_tokens)
+
+        if response.status_code == 429 and retry_after:
+            pause = max(pause, retry_after)
+
+        if pause:
+            self._pause(pause)
+        return pause
+
+    def backoff(self, attempt: int, error: Optional[Exception] = None) -> float:
+        """
+        Delay before retrying after a rate limit error
+
+        Uses the header-driven pause when one is known, otherwise exponential
+        backoff with jitter. The delay is shared so other workers wait too.
+        """
+        response = getattr(error, "response", None)
+        if response is not None and getattr(response, "headers", None) is not None:
+            self.observe(response)
+
+        with self._lock:
+            self.throttled += 1
+            header_delay = self._resume_at - time.monotonic()
+        exponential = self.base_delay * (2 ** attempt) * (0.5 + random.random() / 2)
+        delay = min(max(header_delay, exponential), self.max_delay)
+        self._pause(delay)
+        return delay
+
+    def wait(self):
+        """Block until any shared pause has passed"""
+        while True:
+            with self._lock:
+                delay = self._resume_at - time.monotonic()
+            if delay <= 0:
+                return
+            time.sleep(delay)
+
+
+def create_rate_limited_client(api_key: str, rate_limiter: RateLimitState) -> CachedOpenAI:
+    """
+    Cached OpenAI client whose responses feed the given rate limiter
+
+    The SDK's own retries are disabled so 429s surface to call_api_with_retry,
+    which backs off using the shared header-driven state.
+    """
+    client = OpenAI(
+        api_key=api_key,
+        max_retries=0,
+        http_client=DefaultHttpxClient(event_hooks={"response": [rate_limiter.observe]})
+    )
+    return CachedOpenAI(client=client)
+
+
+class ConcurrentExecutor:
+    """
+    Run one function per item on a thread pool and collect results in input order
+
+    Args:
+        max_concurrency: Maximum number of items in flight
+        rate_limiter: Shared rate limit state; workers wait on it before each item
+        name: Label used for thread names and progress output
+    """
+
+    def __init__(
+        self,
+        max_concurrency: int = DEFAULT_MAX_CONCURRENCY,
+        rate_limiter: Optional[RateLimitState] = None,
+        name: str = "llm"
+    ):
+        self.max_concurrency = max(1, max_concurrency)
+        self.rate_limiter = rate_limiter
+        self.name = name
+
+    def _run(self, func: Callable[[Any], Any], item: Any) -> Any:
+        if self.rate_limiter is not None:
+            self.rate_limiter.wait()
+        return func(item)
+
+    def imap(
+        self,
+        func: Callable[[Any], Any],
+        items: Sequence[Any],
+        on_error: Optional[Callable[[Any, Exception], Any]] = None
+    ) -> Iterator[Tuple[int, Any]]:
+        """
+        Apply func to every item concurrently, yielding results as they finish
+
+        Args:
+            func: Called once per item (from a worker thread)
+            items: Inputs
+            on_error: Builds the result for an item whose call raised;
+                if None the first error is re-raised after all items finish
+
+        Yields:
+            (index into items, result) in completion order
+        """
+        if not items:
+            return
+
+        first_error: Optional[Exception] = None
+        start = time.monotonic()
+        workers = min(self.max_concurrency, len(items))
+
+        with ThreadPoolExecutor(max_workers=workers, thread_name_prefix=self.name) as pool:
+            futures = {pool.submit(self._run, func, item): index for index, item in enumerate(items)}
+            for future in as_completed(futures):
+                # Drop finished futures so their results can be freed while streaming
+                index = futures.pop(future)
+                try:
+                    yield index, future.result()
+                except Exception as e:
+                    if on_error is None:
+                        first_error = first_error or e
+                    else:
+                        yield index, on_error(items[index], e)
+
+        if first_error is not None:
+            raise first_error
+
+        elapsed = time.monotonic() - start
+        throttled = self.rate_limiter.throttled if self.rate_limiter is not None else 0
+        print(f"  - [{self.name}] {len(items)}건 처리 완료 (동시 {workers}개, {elapsed:.1f}초, rate limit {throttled}회)")
+
+    def map(
+        self,
+        func: Callable[[Any], Any],
+        items: Sequence[Any],
+        on_error: Optional[Callable[[Any, Exception], Any]] = None
+    ) -> List[Any]:
+        """
+        Apply func to every item concurrently
+
+        Args:
+            func: Called once per item (from a worker thread)
+            items: Inputs
+            on_error: Builds the result for an item whose call raised;
+                if None the first error is re-raised after all items finish
+
+        Returns:
+            Results in the same order as items
+        """
+        results: List[Any] = [None] * len(items)
+        for index, result in self.imap(func, items, on_error=on_error):
+            results[index] = result
+        return results
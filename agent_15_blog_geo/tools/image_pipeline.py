@@ -0,0 +1,288 @@
+"""
+Image Pipeline for Blog GEO Analysis
+
+Runs the consulting image stage as a pipeline instead of three sequential loops:
+- DALL-E requests run concurrently (bounded) and stream straight to disk
+- Blog body text is generated while the images are being generated
+- Pillow composition starts in a worker process as soon as an image and its
+  body text are both ready
+"""
+
+import multiprocessing
+import os
+import uuid
+from concurrent.futures import (
+    Future, ProcessPoolExecutor, ThreadPoolExecutor, as_completed
+)
+from concurrent.futures.process import BrokenProcessPool
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+
+from .prompts import get_dalle_prompt, get_blog_body_prompt
+from .api_utils import generate_dalle_image_to_file, create_chat_completion
+from ..utils.image_utils import create_blog_image
+
+
+# Configuration
+DALLE_MAX_CONCURRENCY = int(os.getenv("DALLE_MAX_CONCURRENCY", "3"))
+BLOG_BODY_MAX_CONCURRENCY = int(os.getenv("BLOG_BODY_MAX_CONCURRENCY", "4"))
+BLOG_IMAGE_COMPOSE_WORKERS = int(os.getenv("BLOG_IMAGE_COMPOSE_WORKERS", "0")) or min(4, os.cpu_count() or 1)
+
+# after_image_file markers for reports without a usable DALL-E image
+NO_IMAGE_IDEA = "NO_IMAGE_IDEA"
+IMAGE_GENERATION_FAILED = "IMAGE_GENERATION_FAILED"
+
+
+def get_image_dir() -> str:
+    """modular_agents/outputs (created if missing)"""
+    modular_agents_dir = Path(__file__).parent.parent.parent  # Go up to modular_agents
+    image_dir = str(modular_agents_dir / "outputs")
+    os.makedirs(image_dir, exist_ok=True)
+    return image_dir
+
+
+def _content_consulting(report: Dict[str, Any]) -> Dict[str, Any]:
+    return report.setdefault("consulting_report", {}).setdefault("content_consulting", {})
+
+
+def _has_usable_image(report: Dict[str, Any]) -> bool:
+    path = report.get("consulting_report", {}).get("content_consulting", {}).get("after_image_file")
+    return bool(path) and path not in (IMAGE_GENERATION_FAILED, NO_IMAGE_IDEA)
+
+
+def generate_idea_image(client, report: Dict[str, Any], image_dir: str) -> str:
+    """
+    Generate the DALL-E image for one consulting report
+
+    Returns:
+        The value stored in content_consulting.after_image_file
+        (file path, NO_IMAGE_IDEA or IMAGE_GENERATION_FAILED)
+    """
+    consulting_report_data = report.get("consulting_report", {})
+    report_id = report.get('id', 'N/A')
+
+    generated_title = (
+        consulting_report_data.get("title_consulting", {})
+        .get("strategy_a", {})
+        .get("example_after", f"제목 없음 {report_id}")
+    )
+    composite_image_idea = (
+        consulting_report_data.get("content_consulting", {})
+        .get("composite_image_idea", "")
+    )
+
+    if not composite_image_idea:
+        print(f"  - [경고] 리포트 ID: {report_id}에 이미지 아이디어가 없습니다. 이미지를 생성하지 않습니다.")
+        _content_consulting(report)["after_image_file"] = NO_IMAGE_IDEA
+        return NO_IMAGE_IDEA
+
+    dalle_prompt = get_dalle_prompt(generated_title, composite_image_idea)
+    print(f"  - 이미지 생성 프롬프트 (ID: {report_id}): {dalle_prompt[:120]}...")
+
+    file_path = os.path.join(image_dir, f"img_{report_id}_{uuid.uuid4().hex[:8]}.png")
+    try:
+        saved_path = generate_dalle_image_to_file(client, dalle_prompt, file_path)
+    except Exception as e:
+        print(f"    [오류] 이미지 생성 중 예외 발생: {e}")
+        saved_path = None
+
+    if saved_path:
+        print(f"    [완료] 이미지 저장: {saved_path}")
+        _content_consulting(report)["after_image_file"] = saved_path
+        return saved_path
+
+    print(f"    [오류] 이미지 생성 실패 (ID: {report_id})")
+    _content_consulting(report)["after_image_file"] = IMAGE_GENERATION_FAILED
+    return IMAGE_GENERATION_FAILED
+
+
+def generate_blog_body(client, report: Dict[str, Any], brand_name: str, model: str) -> str:
+    """Generate blog body text from the content strategies of one report"""
+    content_consulting = report.get('consulting_report', {}).get('content_consulting', {})
+    strategy_a_text = content_consulting.get('strategy_a', {}).get('text_example', "")
+    strategy_b_text = content_consulting.get('strategy_b', {}).get('text_example', "")
+
+    if not (strategy_a_text or strategy_b_text):
+        return "본문 생성 실패."
+
+    try:
+        print(f"  - AI로 블로그 본문 생성 중... (ID: {report.get('id')})")
+        blog_body_prompt = get_blog_body_prompt(brand_name, strategy_a_text, strategy_b_text)
+        generated_blog_body = create_chat_completion(
+            client=client,
+            system_prompt=f"You are a professional fashion blogger for the {brand_name} brand.",
+            user_prompt=blog_body_prompt,
+            model=model,
+            temperature=0.7
+        )
+        if generated_blog_body:
+            print(f"  - 블로그 본문 생성 완료. (ID: {report.get('id')})")
+            return generated_blog_body
+        return "블로그 본문 생성 실패"
+    except Exception as e:
+        print(f"  - [오류] 블로그 본문 생성 실패: {e}")
+        return f"블로그 본문 생성 예외: {e}"
+
+
+def _done_future(value) -> Future:
+    future = Future()
+    future.set_result(value)
+    return future
+
+
+class ImagePipeline:
+    """
+    Pipelined DALL-E generation, body text generation and blog image composition
+
+    Args:
+        client: OpenAI (or CachedOpenAI) client used for images and chat
+        brand_name: Brand name for body text prompts
+        platform: Blog platform (used in composed image filenames)
+        model: Chat model for body text
+        image_dir: Output directory
+        dalle_concurrency: Max concurrent DALL-E requests
+        body_concurrency: Max concurrent body text requests
+        compose_workers: Worker processes for Pillow composition
+    """
+
+    def __init__(
+        self,
+        client,
+        brand_name: str,
+        platform: str,
+        model: str,
+        image_dir: Optional[str] = None,
+        dalle_concurrency: int = DALLE_MAX_CONCURRENCY,
+        body_concurrency: int = BLOG_BODY_MAX_CONCURRENCY,
+        compose_workers: int = BLOG_IMAGE_COMPOSE_WORKERS
+    ):
+        self.client = client
+        self.brand_name = brand_name
+        self.platform = platform
+        self.model = model
+        self.image_dir = image_dir or get_image_dir()
+        self.dalle_concurrency = max(1, dalle_concurrency)
+        self.body_concurrency = max(1, body_concurrency)
+        self.compose_workers = max(1, compose_workers)
+        self._compose_pool: Optional[ProcessPoolExecutor] = None
+
+    def _compose_kwargs(self, report: Dict[str, Any], body_text: str) -> Dict[str, Any]:
+        report_id = report.get('id')
+        consulting_report = report['consulting_report']
+        title_after = (
+            consulting_report.get('title_consulting', {})
+            .get('strategy_a', {})
+            .get('example_after', f"컨설팅 제목 {report_id}")
+        )
+        return dict(
+            title=title_after,
+            body_text=body_text,
+            image_path=consulting_report['content_consulting']['after_image_file'],
+            output_filename=f"{self.platform}_blog_post_consulting_id_{report_id}.png",
+            output_dir=self.image_dir
+        )
+
+    def _submit_compose(self, kwargs: Dict[str, Any]) -> Future:
+        """Start Pillow composition in a worker process (in-thread if the pool is unavailable)"""
+        try:
+            if self._compose_pool is None:
+                # DALL-E/body threads are already running here, so don't fork:
+                # spawn starts clean workers that can't inherit a held lock
+                self._compose_pool = ProcessPoolExecutor(
+                    max_workers=self.compose_workers,
+                    mp_context=multiprocessing.get_context("spawn")
+                )
+            return self._compose_pool.submit(create_blog_image, **kwargs)
+        except (BrokenProcessPool, OSError, RuntimeError) as e:
+            print(f"  - [경고] 합성 프로세스 풀 사용 불가, 현재 프로세스에서 합성: {e}")
+            return _done_future(create_blog_image(**kwargs))
+
+    def _store_composed(self, report: Dict[str, Any], kwargs: Dict[str, Any], future: Future):
+        report_id = report.get('id')
+        try:
+            try:
+                generated_file_path = future.result()
+            except BrokenProcessPool:
+                # Worker crashed (e.g. spawn import failure) - compose in this process
+                generated_file_path = create_blog_image(**kwargs)
+        except Exception as e:
+            print(f"  - [오류] 블로그 이미지 생성 예외: {e}")
+            generated_file_path = None
+
+        if generated_file_path:
+            report['consulting_report']['final_blog_image'] = generated_file_path
+            print(f"[완료] 리포트 ID: {report_id}의 'final_blog_image': '{generated_file_path}' 저장 완료.")
+        else:
+            report['consulting_report']['final_blog_image'] = "BLOG_IMAGE_GENERATION_FAILED_INTERNAL_ERROR"
+
+    def run(
+        self,
+        reports: List[Dict[str, Any]],
+        generate_images: bool = True,
+        compose: bool = True
+    ) -> List[Dict[str, Any]]:
+        """
+        Run the image stage for all reports (reports are updated in place)
+
+        Args:
+            reports: Consulting reports (intermediate_reports)
+            generate_images: Generate DALL-E images (otherwise use existing after_image_file)
+            compose: Compose final blog images (title + image + body)
+
+        Returns:
+            The same reports, in the same order
+        """
+        active = [r for r in reports if "error" not in r.get("consulting_report", {})]
+        if not active:
+            return reports
+
+        with ThreadPoolExecutor(self.dalle_concurrency, thread_name_prefix="dalle") as dalle_pool, \
+             ThreadPoolExecutor(self.body_concurrency, thread_name_prefix="blog-body") as body_pool:
+
+            # 1. Start every DALL-E request and body text request up front
+            image_futures: Dict[Future, Dict[str, Any]] = {}
+            body_futures: Dict[int, Future] = {}
+            for report in active:
+                if generate_images:
+                    future = dalle_pool.submit(generate_idea_image, self.client, report, self.image_dir)
+                else:
+                    future = _done_future(_content_consulting(report).get("after_image_file"))
+                image_futures[future] = report
+
+                # No image idea means no composition, so skip the body text call
+                has_idea = _content_consulting(report).get("composite_image_idea") or not generate_images
+                if compose and has_idea:
+                    body_futures[id(report)] = body_pool.submit(
+                        generate_blog_body, self.client, report, self.brand_name, self.model
+                    )
+
+            if not compose:
+                for future in as_completed(image_futures):
+                    future.result()
+                return reports
+
+            # 2. Compose each post as soon as its image (and body text) is ready
+            compose_futures = []
+            for future in as_completed(image_futures):
+                report = image_futures[future]
+                future.result()
+                if not _has_usable_image(report):
+                    print(f"  - [오류] 리포트 ID: {report.get('id')}에 DALL-E 이미지가 없습니다. 블로그 이미지 생성을 건너뜁니다.")
+                    report['consulting_report']['final_blog_image'] = "BLOG_IMAGE_GENERATION_SKIPPED_OR_FAILED"
+                    continue
+
+                body_future = body_futures.get(id(report))
+                body_text = body_future.result() if body_future else "본문 생성 실패."
+                print(f"\n--- 컨설팅 리포트 ID: {report.get('id')} 블로그 이미지 합성 시작 ---")
+                kwargs = self._compose_kwargs(report, body_text)
+                compose_futures.append((report, kwargs, self._submit_compose(kwargs)))
+
+        try:
+            for report, kwargs, future in compose_futures:
+                self._store_composed(report, kwargs, future)
+        finally:
+            if self._compose_pool is not None:
+                self._compose_pool.shutdown()
+                self._compose_pool = None
+
+        return reports
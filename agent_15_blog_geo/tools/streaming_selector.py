@@ -0,0 +1,236 @@
+"""
+Streaming Top/Bottom Selector for Blog GEO Analysis
+
+Selects the top N and bottom N posts by average score while analysis results
+are still arriving, so consulting can start before the analysis phase ends:
+- two bounded heaps hold only (score, index) keys, O(n_selective) memory
+- full analysis results are spilled to a temporary JSONL file and read back
+  on demand (the file is deleted once the results are no longer referenced)
+- a post is released for consulting once its selection can no longer change
+  (known total), or speculatively after an early-start threshold
+
+Selection matches the original rank-and-select step: posts are ordered by
+(average_score, input index), top N and bottom N are both listed from the
+highest score down, and when fewer than 2N posts have a score all of them
+are selected (highest first).
+"""
+
+import heapq
+import json
+import os
+import tempfile
+import weakref
+from array import array
+from typing import Any, Dict, Iterator, List, Optional, Tuple
+
+
+def result_score(result: Dict[str, Any]) -> Optional[float]:
+    """average_score of an analysis result, or None if it has no usable score"""
+    if "error" in result:
+        return None
+    score = result.get("analysis_report", {}).get("summary", {}).get("average_score")
+    if score is None:
+        return None
+    try:
+        return float(score)
+    except (TypeError, ValueError):
+        return None
+
+
+def _remove_spill(writer, path: str):
+    writer.close()
+    try:
+        os.remove(path)
+    except FileNotFoundError:
+        pass
+
+
+class SpilledResults:
+    """
+    Analysis results stored on disk as JSON lines, addressed by input index
+
+    Only one file offset per post is kept in memory. Iterating yields the
+    stored results in input order, so the object can stand in for the
+    all_analysis_results list.
+
+    Args:
+        total: Number of posts
+        path: JSONL spill file (overwritten and kept); by default a temporary
+            file that is removed by remove() or when the object is collected
+    """
+
+    def __init__(self, total: int, path: Optional[str] = None):
+        self._offsets = array("q", [-1]) * total
+        self._count = 0
+        if path is None:
+            fd, path = tempfile.mkstemp(prefix="blog_geo_analysis_", suffix=".jsonl")
+            self._writer = os.fdopen(fd, "wb")
+            self._cleanup = weakref.finalize(self, _remove_spill, self._writer, path)
+        else:
+            os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+            self._writer = open(path, "wb")
+            self._cleanup = None
+        self.path = path
+
+    def append(self, index: int, result: Dict[str, Any]):
+        """Store the result for one input index"""
+        self._offsets[index] = self._writer.tell()
+        self._writer.write(json.dumps(result, ensure_ascii=False).encode("utf-8") + b"\n")
+        self._count += 1
+
+    def close(self):
+        """Finish writing (results stay readable)"""
+        if not self._writer.closed:
+            self._writer.close()
+
+    def remove(self):
+        """Delete a temporary spill file (results are no longer readable)"""
+        if self._cleanup is not None:
+            self._cleanup()
+
+    def _flush(self):
+        if not self._writer.closed:
+            self._writer.flush()
+
+    def __len__(self) -> int:
+        return self._count
+
+    def __getitem__(self, index: int) -> Dict[str, Any]:
+        offset = self._offsets[index]
+        if offset < 0:
+            raise KeyError(index)
+        self._flush()
+        with open(self.path, "rb") as f:
+            f.seek(offset)
+            return json.loads(f.readline())
+
+    def __iter__(self) -> Iterator[Dict[str, Any]]:
+        self._flush()
+        with open(self.path, "rb") as f:
+            for offset in self._offsets:
+                if offset >= 0:
+                    f.seek(offset)
+                    yield json.loads(f.readline())
+
+    def write_json(self, path: str):
+        """Write all results as one JSON array (input order) without loading them together"""
+        os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+        with open(path, "w", encoding="utf-8") as f:
+            f.write("[")
+            for i, result in enumerate(self):
+                item = json.dumps(result, ensure_ascii=False, indent=4).replace("\n", "\n    ")
+                f.write(("," if i else "") + "\n    " + item)
+            f.write("\n]" if self._count else "]")
+
+
+class StreamingSelector:
+    """
+    Bounded top-N / bottom-N selection over a stream of analysis results
+
+    Args:
+        n_selective: N posts to select from each end
+        total: Number of results that will be added
+        spill: Where full results are stored
+        early_start_ratio: Once this fraction of results has arrived, the
+            current top/bottom candidates are released speculatively
+            (None disables speculation)
+    """
+
+    def __init__(
+        self,
+        n_selective: int,
+        total: int,
+        spill: SpilledResults,
+        early_start_ratio: Optional[float] = None
+    ):
+        self.n = n_selective
+        self.total = total
+        self.spill = spill
+        self.early_start_ratio = early_start_ratio
+        self.seen = 0
+        self.valid = 0
+        self._top: List[Tuple[float, int]] = []      # min-heap: N highest (score, index)
+        self._bottom: List[Tuple[float, int]] = []   # min-heap of (-score, -index): N lowest
+        self._released = set()
+
+    @property
+    def remaining(self) -> int:
+        return self.total - self.seen
+
+    def add(self, index: int, result: Dict[str, Any]) -> List[int]:
+        """
+        Record one analysis result
+
+        Returns:
+            Input indices newly released for consulting
+        """
+        self.seen += 1
+        self.spill.append(index, result)
+
+        score = result_score(result)
+        if score is not None:
+            self.valid += 1
+            self._push(self._top, (score, index))
+            self._push(self._bottom, (-score, -index))
+
+        return self._release(self._candidates(speculative=self._early_started()))
+
+    def _push(self, heap: List[Tuple[float, int]], key: Tuple[float, int]):
+        if len(heap) < self.n:
+            heapq.heappush(heap, key)
+        elif heap and key > heap[0]:
+            heapq.heapreplace(heap, key)
+
+    def _early_started(self) -> bool:
+        return (
+            self.early_start_ratio is not None
+            and self.seen >= self.early_start_ratio * self.total
+        )
+
+    def _ranked_top(self) -> List[Tuple[float, int]]:
+        """Top candidates, highest (score, index) first"""
+        return sorted(self._top, reverse=True)
+
+    def _ranked_bottom(self) -> List[Tuple[float, int]]:
+        """Bottom candidates, lowest (score, index) first"""
+        return [(-s, -i) for s, i in sorted(self._bottom, reverse=True)]
+
+    def _candidates(self, speculative: bool = False) -> List[int]:
+        """Indices certain to be selected (or all current candidates if speculative)"""
+        top = [i for _, i in self._ranked_top()]
+        bottom = [i for _, i in self._ranked_bottom()]
+
+        # Fewer than 2N scored posts possible: every scored post is selected
+        if speculative or self.valid + self.remaining < 2 * self.n:
+            return top + bottom
+
+        # rank + remaining < N: even if every pending post beats it, it stays in
+        return top[:max(0, self.n - self.remaining)] + bottom[:max(0, self.n - self.remaining)]
+
+    def _release(self, indices: List[int]) -> List[int]:
+        released = []
+        for index in indices:
+            if index not in self._released:
+                self._released.add(index)
+                released.append(index)
+        return released
+
+    def is_released(self, index: int) -> bool:
+        return index in self._released
+
+    def selection(self) -> Tuple[List[int], List[int]]:
+        """
+        Final selection (call after all results were added)
+
+        Returns:
+            (top indices, bottom indices), each ordered from the highest score;
+            when fewer than 2N posts have a score, (all scored posts, [])
+        """
+        top = self._ranked_top()
+        bottom = self._ranked_bottom()
+        if self.valid >= 2 * self.n:
+            return [i for _, i in top], [i for _, i in reversed(bottom)]
+
+        everything = {i: s for s, i in top + bottom}
+        ordered = sorted(everything, key=lambda i: (-everything[i], i))
+        return ordered, []
@@ -9,11 +9,8 @@ from langgraph.graph import StateGraph, END
 
 from .state import BlogGEOWorkflowState
 from .nodes.prepare_data import prepare_data_node
-from .nodes.analyze_posts import analyze_posts_node
-from .nodes.rank_and_select import rank_and_select_node
-from .nodes.consult_posts import consult_posts_node
-from .nodes.generate_images import generate_images_node
-from .nodes.generate_blog_images import generate_blog_images_and_enhance_report_node
+from .nodes.stream_consult import analyze_and_consult_node
+from .nodes.generate_images import generate_and_compose_images_node
 from .nodes.finalize_reports import finalize_reports_node
 
 
@@ -39,24 +36,19 @@ class BlogGEOWorkflow:
         
         # Add nodes
         self.workflow.add_node("prepare_data", prepare_data_node)
-        self.workflow.add_node("analyze_posts", analyze_posts_node)
-        self.workflow.add_node("rank_and_select", rank_and_select_node)
-        self.workflow.add_node("consult_posts", consult_posts_node)
-        self.workflow.add_node("generate_idea_images", generate_images_node)
-        self.workflow.add_node("generate_blog_images_and_enhance_report", 
-                              generate_blog_images_and_enhance_report_node)
+        # Analysis, top/bottom selection and consulting stream into each other
+        self.workflow.add_node("analyze_and_consult", analyze_and_consult_node)
+        # DALL-E, body text and blog image composition run as one pipelined stage
+        self.workflow.add_node("generate_images", generate_and_compose_images_node)
         self.workflow.add_node("finalize_reports", finalize_reports_node)
         
         # Set entry point
         self.workflow.set_entry_point("prepare_data")
         
         # Add edges (linear flow)
-        self.workflow.add_edge("prepare_data", "analyze_posts")
-        self.workflow.add_edge("analyze_posts", "rank_and_select")
-        self.workflow.add_edge("rank_and_select", "consult_posts")
-        self.workflow.add_edge("consult_posts", "generate_idea_images")
-        self.workflow.add_edge("generate_idea_images", "generate_blog_images_and_enhance_report")
-        self.workflow.add_edge("generate_blog_images_and_enhance_report", "finalize_reports")
+        self.workflow.add_edge("prepare_data", "analyze_and_consult")
+        self.workflow.add_edge("analyze_and_consult", "generate_images")
+        self.workflow.add_edge("generate_images", "finalize_reports")
         self.workflow.add_edge("finalize_reports", END)
         
         # Compile the workflow
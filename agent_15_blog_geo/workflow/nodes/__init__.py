@@ -3,19 +3,13 @@ Workflow Nodes for Blog GEO Analysis
 """
 
 from .prepare_data import prepare_data_node
-from .analyze_posts import analyze_posts_node
-from .rank_and_select import rank_and_select_node
-from .consult_posts import consult_posts_node
-from .generate_images import generate_images_node
-from .generate_blog_images import generate_blog_images_and_enhance_report_node
+from .stream_consult import analyze_and_consult_node
+from .generate_images import generate_and_compose_images_node
 from .finalize_reports import finalize_reports_node
 
 __all__ = [
     'prepare_data_node',
-    'analyze_posts_node',
-    'rank_and_select_node',
-    'consult_posts_node',
-    'generate_images_node',
-    'generate_blog_images_and_enhance_report_node',
+    'analyze_and_consult_node',
+    'generate_and_compose_images_node',
     'finalize_reports_node'
 ]
\ No newline at end of file
@@ -0,0 +1,56 @@
+"""
+Post Analysis
+
+Evaluates one prepared post with E-E-A-T + GEO criteria
+(used by the analyze_and_consult node).
+"""
+
+from typing import Dict, Any, List
+
+from ..state import BlogGEOWorkflowState
+from ...tools.prompts import get_analyzer_prompt
+from ...tools.api_utils import call_api_with_retry
+from ...tools.concurrent_executor import RateLimitState
+
+
+def analyze_post(
+    client,
+    state: BlogGEOWorkflowState,
+    post: Dict[str, Any],
+    rate_limiter: RateLimitState = None
+) -> Dict[str, Any]:
+    """
+    Analyze one post (text + images)
+    
+    Returns:
+        {"source_post": post, "analysis_report": {...}}
+    """
+    user_content: List[Dict[str, Any]] = [
+        {"type": "text", "text": f"제목: {post['title']}\n\n본문:\n{post['content']}"}
+    ]
+    user_content += [
+        {"type": "image_url", "image_url": {"url": url}}
+        for url in post.get('image_urls', [])
+    ]
+    
+    messages = [
+        {"role": "system", "content": get_analyzer_prompt(state['brand_name'], post['title'])},
+        {"role": "user", "content": user_content}
+    ]
+    
+    analysis_report = call_api_with_retry(
+        client=client,
+        messages=messages,
+        model=state['model'],
+        temperature=state['temperature'],
+        max_tokens=state['max_tokens'],
+        rate_limiter=rate_limiter
+    )
+    
+    return {"source_post": post, "analysis_report": analysis_report}
+
+
+def analysis_error_result(post: Dict[str, Any], e: Exception) -> Dict[str, Any]:
+    """Result entry for a post whose analysis failed"""
+    print(f"  - [오류] 분석 예외 (ID: {post.get('id')}): {e}")
+    return {"source_post": post, "error": str(e)}
@@ -0,0 +1,142 @@
+"""
+Streaming Analysis + Consulting Node
+
+Runs analysis, top/bottom selection and consulting as one streaming stage so
+consulting starts as soon as a post's selection is settled.
+"""
+
+import os
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Dict, Any
+
+from ..state import BlogGEOWorkflowState
+from .analyze_posts import analyze_post, analysis_error_result
+from .consult_posts import consult_post, consulting_error_report
+from .rank_and_select import print_selection
+from ...tools.concurrent_executor import (
+    ConcurrentExecutor, RateLimitState, create_rate_limited_client, DEFAULT_MAX_CONCURRENCY
+)
+from ...tools.streaming_selector import SpilledResults, StreamingSelector
+
+
+def analyze_and_consult_node(state: BlogGEOWorkflowState) -> Dict[str, Any]:
+    """
+    Analyze all posts, select top/bottom performers and consult them, streaming
+
+    This node:
+    1. Analyzes posts concurrently; each result is spilled to a temporary JSONL file
+    2. Keeps only bounded top-N/bottom-N heaps of (score, index) in memory
+    3. Starts consulting a post once it is certain to be selected
+       (or, after early_start_ratio of analyses, speculatively)
+    4. Returns the same selection/order as ranking all results and then consulting them
+
+    Args:
+        state: Current workflow state
+
+    Returns:
+        Updated state with all_analysis_results (disk-backed), posts_for_consulting
+        and intermediate_reports
+    """
+    posts = state['posts_to_analyze']
+    n_selective = state['n_selective']
+    concurrency = state.get('max_concurrency') or DEFAULT_MAX_CONCURRENCY
+
+    print(f"\n--- [2~4단계] 총 {len(posts)}개 포스트 분석 + 상위/하위 {n_selective}개 스트리밍 컨설팅 ---")
+
+    if not posts:
+        return {"all_analysis_results": [], "posts_for_consulting": [], "intermediate_reports": []}
+
+    # Initialize OpenAI client (shared by analysis and consulting workers)
+    api_key = os.getenv('OPENAI_API_KEY')
+    if not api_key:
+        raise ValueError("OPENAI_API_KEY environment variable not set")
+
+    rate_limiter = RateLimitState()
+    client = create_rate_limited_client(api_key, rate_limiter)
+
+    analysis_file = state['analysis_report_file']
+    spill = SpilledResults(len(posts))
+    selector = StreamingSelector(
+        n_selective,
+        total=len(posts),
+        spill=spill,
+        early_start_ratio=state.get('early_start_ratio')
+    )
+
+    def analyze(indexed_post):
+        i, post = indexed_post
+        print(f"  - 분석 중... ({i+1}/{len(posts)}) {post['title'][:30]}...")
+        return analyze_post(client, state, post, rate_limiter)
+
+    def consult(post_data):
+        try:
+            return consult_post(client, state, post_data, rate_limiter)
+        except Exception as e:
+            return consulting_error_report(post_data, e)
+
+    analysis_executor = ConcurrentExecutor(max_concurrency=concurrency, rate_limiter=rate_limiter, name="analyze")
+    consult_futures: Dict[int, Future] = {}
+    started_early = set()
+
+    with ThreadPoolExecutor(max_workers=concurrency, thread_name_prefix="consult") as consult_pool:
+        def start_consulting(index):
+            post_data = spill[index]
+            score = post_data['analysis_report']['summary']['average_score']
+            print(f"  - 컨설팅 시작 (분석 {selector.seen}/{len(posts)}) - (점수: {score}) {post_data['source_post']['title'][:30]}...")
+            consult_futures[index] = consult_pool.submit(consult, post_data)
+            if selector.remaining:
+                started_early.add(index)
+
+        # 1. Analyze, feeding the selector as results arrive
+        for index, result in analysis_executor.imap(
+            analyze,
+            list(enumerate(posts)),
+            on_error=lambda indexed_post, e: analysis_error_result(indexed_post[1], e)
+        ):
+            for released in selector.add(index, result):
+                start_consulting(released)
+        spill.close()
+
+        # 2. Final selection (top N + bottom N, highest score first)
+        top, bottom = selector.selection()
+        selected = top + bottom
+        selected_set = set(selected)
+        posts_for_consulting = [spill[index] for index in selected]
+        if bottom:
+            print(f"  - 상위 {n_selective}개, 하위 {n_selective}개 포스트를 컨설팅 대상으로 선정합니다.")
+        else:
+            print(f"  - 포스트 수가 적어, 전체를 점수순(내림차순)으로 컨설팅 대상으로 선정합니다.")
+        print_selection(posts_for_consulting[:len(top)], posts_for_consulting[len(top):], n_selective)
+        print(f"\n  - 총 {len(selected)}개 포스트가 컨설팅 대상으로 선정되었습니다.")
+
+        # Speculatively started posts that dropped out of the selection
+        discarded = [index for index in consult_futures if index not in selected_set]
+        for index in discarded:
+            consult_futures[index].cancel()
+        if discarded:
+            print(f"  - [정보] 조기 시작 후 선정에서 제외된 컨설팅 {len(discarded)}건은 폐기합니다.")
+
+        # 3. Consult the rest and collect reports in selection order
+        for index, post_data in zip(selected, posts_for_consulting):
+            if index not in consult_futures:
+                consult_futures[index] = consult_pool.submit(consult, post_data)
+        intermediate_reports = [consult_futures[index].result() for index in selected]
+
+    print(f"[완료] 컨설팅 리포트 {len(intermediate_reports)}개 생성 완료 (분석 종료 전 시작 {len(started_early & selected_set)}개).")
+
+    # Save analysis results (streamed from the spill file)
+    try:
+        spill.write_json(analysis_file)
+        print(f"[완료] 분석 리포트 저장! 파일: '{analysis_file}'")
+    except Exception as e:
+        print(f"[오류] 분석 리포트 저장 중 예외 발생: {e}")
+        state.setdefault('errors', []).append({
+            "node": "analyze_and_consult",
+            "error": str(e)
+        })
+
+    return {
+        "all_analysis_results": spill,
+        "posts_for_consulting": posts_for_consulting,
+        "intermediate_reports": intermediate_reports
+    }
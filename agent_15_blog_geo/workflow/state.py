@@ -63,6 +63,8 @@ class BlogGEOWorkflowState(TypedDict):
     model: str  # OpenAI model to use
     temperature: float
     max_tokens: int
+    max_concurrency: int  # Concurrent per-post LLM calls (analysis, consulting)
+    early_start_ratio: Optional[float]  # Speculative consulting after this fraction of analyses
 
     # Error tracking
     errors: List[Dict[str, Any]]
@@ -75,6 +77,8 @@ def create_initial_state(
     total_posts_to_process: Optional[int] = 10,
     n_selective: int = 2,
     output_dir: str = "../outputs",
+    max_concurrency: Optional[int] = None,
+    early_start_ratio: Optional[float] = None,
 ) -> BlogGEOWorkflowState:
     """
     Create initial workflow state
@@ -86,6 +90,11 @@ def create_initial_state(
         total_posts_to_process: Max posts to analyze (None for all)
         n_selective: Number of top/bottom posts for consulting
         output_dir: Directory for output files
+        max_concurrency: Concurrent per-post LLM calls
+            (None reads BLOG_GEO_MAX_CONCURRENCY, default 4)
+        early_start_ratio: Start consulting the current top/bottom candidates
+            once this fraction of analyses is done, before their rank is final
+            (None reads BLOG_GEO_EARLY_START_RATIO, unset disables it)
 
     Returns:
         Initialized workflow state
@@ -123,6 +132,10 @@ def create_initial_state(
         "model": "gpt-4o-mini",
         "temperature": 0.3,
         "max_tokens": 2048,
+        "max_concurrency": max_concurrency or int(os.getenv("BLOG_GEO_MAX_CONCURRENCY", "4")),
+        "early_start_ratio": early_start_ratio if early_start_ratio is not None else (
+            float(os.environ["BLOG_GEO_EARLY_START_RATIO"]) if os.getenv("BLOG_GEO_EARLY_START_RATIO") else None
+        ),
         "errors": [],
     }
 
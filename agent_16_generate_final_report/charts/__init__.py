@@ -2,12 +2,22 @@
 Chart generation module
 """
 
-from .platform_charts import create_platform_comparison_charts
-from .website_charts import create_website_charts  
-from .individual_charts import create_individual_charts
+from .summary import build_platform_summary, print_platform_summary
+from .renderer import ChartRenderer, ChartSpec, render_charts
+from .platform_charts import create_platform_comparison_charts, platform_chart_specs
+from .website_charts import create_website_charts, website_chart_specs
+from .individual_charts import create_individual_charts, individual_chart_specs
 
 __all__ = [
+    'build_platform_summary',
+    'print_platform_summary',
+    'ChartRenderer',
+    'ChartSpec',
+    'render_charts',
     'create_platform_comparison_charts',
+    'platform_chart_specs',
     'create_website_charts',
-    'create_individual_charts'
+    'website_chart_specs',
+    'create_individual_charts',
+    'individual_chart_specs'
 ]
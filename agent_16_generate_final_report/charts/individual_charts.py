@@ -4,111 +4,106 @@ Individual platform charts (Instagram, Blog)
 
 import matplotlib.pyplot as plt
 import numpy as np
+import pandas as pd
+
+from .renderer import ChartSpec, render_charts
+from .summary import (
+    EEAT_KEYS, EEAT_LABELS, GEO_KEYS, GEO_LABELS,
+    build_platform_summary, platform_stats
+)
+
+INSTA_COLORS = ['#4285F4', '#EA4335']
+BLOG_COLORS = ['#34A853', '#F9AB00']
+
+
+def render_eeat_line_chart(payload, path):
+    """플랫폼별 E-E-A-T 최대/평균/최소 선 차트"""
+    colors = payload["colors"]
+    fig, ax = plt.subplots(figsize=(12, 7))
+
+    for i, series in enumerate(payload["series"]):
+        platform = series["platform"]
+        color = colors[i % len(colors)]
+        ax.plot(EEAT_LABELS, series["max"], marker='o', linestyle=':', label=f'{platform} 최대', color=color, alpha=0.5)
+        ax.plot(EEAT_LABELS, series["mean"], marker='s', linestyle='-', label=f'{platform} 평균', linewidth=3, color=color, alpha=0.9)
+        ax.plot(EEAT_LABELS, series["min"], marker='x', linestyle=':', label=f'{platform} 최소', color=color, alpha=0.5)
+
+    ax.set_title(payload["title"], fontsize=20, pad=20)
+    ax.set_ylabel('점수', fontsize=14)
+    ax.legend(fontsize=12)
+    ax.grid(True, axis='y', linestyle='--', alpha=0.6)
+    ax.set_ylim(0, 105)
+    ax.spines['top'].set_visible(False)
+    ax.spines['right'].set_visible(False)
+
+    plt.tight_layout()
+    plt.savefig(path)
+    plt.close(fig)
+
+
+def render_geo_radar_chart(payload, path):
+    """플랫폼별 GEO 평균 레이더 차트"""
+    colors = payload["colors"]
+    angles = np.linspace(0, 2 * np.pi, len(GEO_LABELS), endpoint=False).tolist()
+    angs = angles + angles[:1]
+
+    fig, ax = plt.subplots(figsize=(10, 10), subplot_kw=dict(polar=True))
+    for i, series in enumerate(payload["series"]):
+        geo_stats = series["mean"] + series["mean"][:1]
+        color = colors[i % len(colors)]
+        ax.plot(angs, geo_stats, 'o-', linewidth=3, color=color, label=series["platform"])
+        ax.fill(angs, geo_stats, color=color, alpha=0.15)
+
+    ax.set_thetagrids(np.degrees(angles), GEO_LABELS, fontsize=14)
+    ax.set_title(payload["title"], fontsize=20, y=1.1, pad=20)
+    ax.set_rlim(0, 100)
+    ax.set_rlabel_position(22.5)
+    ax.tick_params(axis='y', labelsize=10)
+    ax.legend(fontsize=13, loc='upper right', bbox_to_anchor=(1.2, 1.1))
+
+    plt.savefig(path, bbox_inches='tight')
+    plt.close(fig)
+
+
+def _channel_specs(summary, platforms, brand_name, prefix, title, colors):
+    """채널 하나(Instagram 또는 Blog)의 E-E-A-T/GEO 차트 명세"""
+    platforms = [p for p in platforms if p in summary.index]
+    if not platforms:
+        return []
+
+    eeat_series = [
+        {"platform": str(p), **{stat: platform_stats(summary, p, EEAT_KEYS, stat) for stat in ("max", "mean", "min")}}
+        for p in platforms
+    ]
+    geo_series = [
+        {"platform": str(p), "mean": platform_stats(summary, p, GEO_KEYS, "mean")}
+        for p in platforms
+    ]
+    return [
+        ChartSpec(f"{brand_name}_{prefix}_eeat_line_chart.png", render_eeat_line_chart,
+                  {"title": f"{title} E-E-A-T 세부항목 점수 분포", "colors": colors, "series": eeat_series}),
+        ChartSpec(f"{brand_name}_{prefix}_geo_radar_chart.png", render_geo_radar_chart,
+                  {"title": f"{title} GEO 세부항목 평균 점수", "colors": colors, "series": geo_series}),
+    ]
+
+
+def individual_chart_specs(summary, insta_platforms, blog_platforms, brand_name):
+    """Instagram/Blog 개별 차트 명세 (플랫폼 요약 테이블 재사용)"""
+    if summary.empty:
+        return []
+    return (
+        _channel_specs(summary, insta_platforms, brand_name, "insta", "Instagram", INSTA_COLORS)
+        + _channel_specs(summary, blog_platforms, brand_name, "blog", "Blog", BLOG_COLORS)
+    )
+
+
+def _platforms_of(df):
+    return list(df['platform'].unique()) if df is not None and not df.empty else []
+
 
 def create_individual_charts(df_insta, df_blog, output_folder, brand_name):
     """개별 플랫폼 차트 생성 (Instagram, Blog 별도)"""
-    
-    # Instagram 개별 차트
-    if df_insta is not None and not df_insta.empty:
-        # Instagram E-E-A-T
-        fig, ax = plt.subplots(figsize=(12, 7))
-        colors = ['#4285F4', '#EA4335']
-        eeat_labels = ["Experience", "Expertise", "Authoritativeness", "Trustworthiness"]
-        eeat_keys = ["experience_avg", "expertise_avg", "authoritativeness_avg", "trustworthiness_avg"]
-        
-        for i, platform in enumerate(df_insta['platform'].unique()):
-            sub = df_insta[df_insta['platform'] == platform].head(10)
-            stats = sub[eeat_keys].agg(['max', 'mean', 'min']).round(2)
-            
-            ax.plot(eeat_labels, stats.loc['max'], marker='o', linestyle=':', label=f'{platform} 최대', color=colors[i%len(colors)], alpha=0.5)
-            ax.plot(eeat_labels, stats.loc['mean'], marker='s', linestyle='-', label=f'{platform} 평균', linewidth=3, color=colors[i%len(colors)], alpha=0.9)
-            ax.plot(eeat_labels, stats.loc['min'], marker='x', linestyle=':', label=f'{platform} 최소', color=colors[i%len(colors)], alpha=0.5)
-        
-        ax.set_title('Instagram E-E-A-T 세부항목 점수 분포', fontsize=20, pad=20)
-        ax.set_ylabel('점수', fontsize=14)
-        ax.legend(fontsize=12)
-        ax.grid(True, axis='y', linestyle='--', alpha=0.6)
-        ax.set_ylim(0, 105)
-        ax.spines['top'].set_visible(False)
-        ax.spines['right'].set_visible(False)
-        
-        plt.tight_layout()
-        plt.savefig(f'{output_folder}/{brand_name}_insta_eeat_line_chart.png')
-        plt.close()
-        print(f"차트 생성: {brand_name}_insta_eeat_line_chart.png")
-
-        # Instagram GEO 레이더
-        fig, ax = plt.subplots(figsize=(10, 10), subplot_kw=dict(polar=True))
-        geo_labels = ["명료성", "구조성", "맥락성", "일치성", "적시성", "독창성"]
-        geo_keys = ["clarity_avg", "structure_avg", "context_avg", "alignment_avg", "timeliness_avg", "originality_avg"]
-        angles = np.linspace(0, 2 * np.pi, len(geo_labels), endpoint=False).tolist()
-        
-        for i, platform in enumerate(df_insta['platform'].unique()):
-            sub = df_insta[df_insta['platform'] == platform].head(10)
-            geo_stats = sub[geo_keys].mean().tolist()
-            geo_stats += geo_stats[:1]
-            angs = angles + angles[:1]
-            
-            ax.plot(angs, geo_stats, 'o-', linewidth=3, color=colors[i%len(colors)], label=platform)
-            ax.fill(angs, geo_stats, color=colors[i%len(colors)], alpha=0.15)
-            
-        ax.set_thetagrids(np.degrees(angles), geo_labels, fontsize=14)
-        ax.set_title('Instagram GEO 세부항목 평균 점수', fontsize=20, y=1.1, pad=20)
-        ax.set_rlim(0, 100)
-        ax.set_rlabel_position(22.5)
-        ax.tick_params(axis='y', labelsize=10)
-        ax.legend(fontsize=13, loc='upper right', bbox_to_anchor=(1.2, 1.1))
-        
-        plt.savefig(f'{output_folder}/{brand_name}_insta_geo_radar_chart.png', bbox_inches='tight')
-        plt.close()
-        print(f"차트 생성: {brand_name}_insta_geo_radar_chart.png")
-
-    # Blog 개별 차트
-    if df_blog is not None and not df_blog.empty:
-        # Blog E-E-A-T
-        fig, ax = plt.subplots(figsize=(12, 7))
-        blog_colors = ['#34A853', '#F9AB00']
-        
-        for i, platform in enumerate(df_blog['platform'].unique()):
-            sub = df_blog[df_blog['platform'] == platform].head(10)
-            stats = sub[eeat_keys].agg(['max', 'mean', 'min']).round(2)
-            
-            ax.plot(eeat_labels, stats.loc['max'], marker='o', linestyle=':', label=f'{platform} 최대', color=blog_colors[i%len(blog_colors)], alpha=0.5)
-            ax.plot(eeat_labels, stats.loc['mean'], marker='s', linestyle='-', label=f'{platform} 평균', linewidth=3, color=blog_colors[i%len(blog_colors)], alpha=0.9)
-            ax.plot(eeat_labels, stats.loc['min'], marker='x', linestyle=':', label=f'{platform} 최소', color=blog_colors[i%len(blog_colors)], alpha=0.5)
-        
-        ax.set_title('Blog E-E-A-T 세부항목 점수 분포', fontsize=20, pad=20)
-        ax.set_ylabel('점수', fontsize=14)
-        ax.legend(fontsize=12)
-        ax.grid(True, axis='y', linestyle='--', alpha=0.6)
-        ax.set_ylim(0, 105)
-        ax.spines['top'].set_visible(False)
-        ax.spines['right'].set_visible(False)
-        
-        plt.tight_layout()
-        plt.savefig(f'{output_folder}/{brand_name}_blog_eeat_line_chart.png')
-        plt.close()
-        print(f"차트 생성: {brand_name}_blog_eeat_line_chart.png")
-
-        # Blog GEO 레이더
-        fig, ax = plt.subplots(figsize=(10, 10), subplot_kw=dict(polar=True))
-        
-        for i, platform in enumerate(df_blog['platform'].unique()):
-            sub = df_blog[df_blog['platform'] == platform].head(10)
-            geo_stats = sub[geo_keys].mean().tolist()
-            geo_stats += geo_stats[:1]
-            angs = angles + angles[:1]
-            
-            ax.plot(angs, geo_stats, 'o-', linewidth=3, color=blog_colors[i%len(blog_colors)], label=platform)
-            ax.fill(angs, geo_stats, color=blog_colors[i%len(blog_colors)], alpha=0.15)
-            
-        ax.set_thetagrids(np.degrees(angles), geo_labels, fontsize=14)
-        ax.set_title('Blog GEO 세부항목 평균 점수', fontsize=20, y=1.1, pad=20)
-        ax.set_rlim(0, 100)
-        ax.set_rlabel_position(22.5)
-        ax.tick_params(axis='y', labelsize=10)
-        ax.legend(fontsize=13, loc='upper right', bbox_to_anchor=(1.2, 1.1))
-        
-        plt.savefig(f'{output_folder}/{brand_name}_blog_geo_radar_chart.png', bbox_inches='tight')
-        plt.close()
-        print(f"차트 생성: {brand_name}_blog_geo_radar_chart.png")
+    frames = [df for df in (df_insta, df_blog) if df is not None and not df.empty]
+    summary = build_platform_summary(pd.concat(frames, ignore_index=True) if frames else None)
+    specs = individual_chart_specs(summary, _platforms_of(df_insta), _platforms_of(df_blog), brand_name)
+    render_charts(specs, output_folder)
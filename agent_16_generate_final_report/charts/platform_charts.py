@@ -5,47 +5,25 @@ Platform comparison charts
 import matplotlib.pyplot as plt
 import numpy as np
 
-def create_platform_comparison_charts(df_all, output_folder, brand_name):
-    """플랫폼별 비교 차트 생성"""
-    
-    # 차트 데이터 콘솔 출력
-    colors = ['#4285F4', '#EA4335', '#34A853', '#F9AB00', '#A142F4', '#00B7C3']
-    eeat_labels = ["Experience", "Expertise", "Authoritativeness", "Trustworthiness"]
-    eeat_keys = ["experience_avg", "expertise_avg", "authoritativeness_avg", "trustworthiness_avg"]
-    geo_labels = ["명료성", "구조성", "맥락성", "일치성", "적시성", "독창성"]
-    geo_keys = ["clarity_avg", "structure_avg", "context_avg", "alignment_avg", "timeliness_avg", "originality_avg"]
-    
-    platforms = df_all['platform'].unique()
-    
-    print("\n" + "="*60)
-    print("📊 E-E-A-T 차트 데이터")
-    print("="*60)
-    for i, platform in enumerate(platforms):
-        sub = df_all[df_all['platform'] == platform].head(10)
-        stats = sub[eeat_keys].agg(['max', 'mean', 'min']).round(2)
-        print(f"\n🔹 {platform}:")
-        print(f"   최대값: {dict(zip(eeat_labels, stats.loc['max']))}")
-        print(f"   평균값: {dict(zip(eeat_labels, stats.loc['mean']))}")
-        print(f"   최소값: {dict(zip(eeat_labels, stats.loc['min']))}")
-    
-    print("\n" + "="*60)
-    print("📊 GEO 레이더 차트 데이터")
-    print("="*60)
-    for i, platform in enumerate(platforms):
-        sub = df_all[df_all['platform'] == platform].head(10)
-        geo_stats = sub[geo_keys].mean().round(2)
-        print(f"\n🔹 {platform}:")
-        print(f"   GEO 평균: {dict(zip(geo_labels, geo_stats))}")
-        print(f"   데이터 개수: {len(sub)}")
-    print("="*60)
-
-    # 플랫폼별 Overall Score
-    plat_stats = df_all.groupby('platform')[['overall_score']].mean().round(2)
+from .renderer import ChartSpec, render_charts
+from .summary import SYNERGY_KEY, build_platform_summary, print_platform_summary
+
+PLATFORM_COLORS = ['#4285F4', '#EA4335', '#34A853', '#F9AB00', '#A142F4', '#00B7C3']
+SYNERGY_STAT_LABELS = ['최대값', '최소값', '평균값']
+SYNERGY_STAT_KEYS = ['max', 'min', 'mean']
+
+
+def render_platform_score_chart(payload, path):
+    """플랫폼별 Overall Score 평균 막대 차트"""
+    # 점수 오름차순 (가로 막대는 아래부터 쌓이므로 최고점이 맨 위)
+    order = sorted(range(len(payload["platforms"])), key=lambda i: payload["scores"][i])
+    labels = [payload["platforms"][i] for i in order]
+    scores = [payload["scores"][i] for i in order]
+
     fig, ax = plt.subplots(figsize=(12, 8))
-    data_to_plot = plat_stats['overall_score'].sort_values()
-    colors_bar = plt.cm.summer(np.linspace(0.4, 1, len(data_to_plot)))
-    
-    bars = ax.barh(data_to_plot.index, data_to_plot, color=colors_bar)
+    colors_bar = plt.cm.summer(np.linspace(0.4, 1, len(scores)))
+
+    bars = ax.barh(labels, scores, color=colors_bar)
     ax.bar_label(bars, fmt='%.1f', padding=-40, color='white', fontsize=16, weight='bold')
     ax.set_title('플랫폼별 Overall Score 평균', fontsize=20, pad=20)
     ax.set_xlabel('평균 점수', fontsize=14)
@@ -55,37 +33,28 @@ def create_platform_comparison_charts(df_all, output_folder, brand_name):
     ax.spines['top'].set_visible(False)
     ax.spines['right'].set_visible(False)
     ax.spines['left'].set_visible(False)
-    
+
     plt.tight_layout()
-    plt.savefig(f'{output_folder}/{brand_name}_platform_score_chart.png')
-    plt.close()
-    print(f"차트 생성: {brand_name}_platform_score_chart.png")
-
-    # Synergy 점수 통계
-    stat_labels = ['최대값', '최소값', '평균값']
-    stat_keys = ['max', 'min', 'mean']
-    
-    synergy_data = []
-    for platform in platforms:
-        sub = df_all[df_all['platform'] == platform].head(10)
-        stats = sub['synergy_avg'].agg(stat_keys).round(2)
-        vals = [stats[k] for k in stat_keys]
-        synergy_data.append(vals)
-        
-    synergy_data = np.array(synergy_data)
+    plt.savefig(path)
+    plt.close(fig)
+
+
+def render_platform_synergy_chart(payload, path):
+    """플랫폼별 Synergy 점수 통계 (최대/최소/평균) 묶음 막대 차트"""
+    platforms = payload["platforms"]
+    synergy_data = np.array(payload["synergy"])
     n_platforms = len(platforms)
-    n_stats = len(stat_labels)
-    x = np.arange(n_stats)
+    x = np.arange(len(SYNERGY_STAT_LABELS))
     bar_width = 0.8 / n_platforms
-    
+
     fig, ax = plt.subplots(figsize=(12, 8))
     for i, (platform, vals) in enumerate(zip(platforms, synergy_data)):
         bar_position = x + i * bar_width - (bar_width * (n_platforms - 1) / 2)
-        bars = ax.bar(bar_position, vals, width=bar_width, label=platform, color=colors[i % len(colors)])
+        bars = ax.bar(bar_position, vals, width=bar_width, label=platform, color=PLATFORM_COLORS[i % len(PLATFORM_COLORS)])
         ax.bar_label(bars, fmt='%.2f', padding=3, fontsize=11)
-            
+
     ax.set_xticks(x)
-    ax.set_xticklabels(stat_labels, fontsize=15)
+    ax.set_xticklabels(SYNERGY_STAT_LABELS, fontsize=15)
     ax.set_title('플랫폼별 Synergy 점수 통계 (최대/최소/평균)', fontsize=20, pad=20)
     ax.set_ylabel('Synergy 점수', fontsize=15)
     ax.set_ylim(0, 115)
@@ -94,8 +63,31 @@ def create_platform_comparison_charts(df_all, output_folder, brand_name):
     ax.spines['right'].set_visible(False)
     ax.spines['left'].set_visible(False)
     ax.legend(fontsize=14)
-    
+
     plt.tight_layout()
-    plt.savefig(f'{output_folder}/{brand_name}_platform_synergy_chart.png')
-    plt.close()
-    print(f"차트 생성: {brand_name}_platform_synergy_chart.png")
+    plt.savefig(path)
+    plt.close(fig)
+
+
+def platform_chart_specs(summary, brand_name):
+    """플랫폼 비교 차트 명세 (요약 테이블에서 필요한 값만 추출)"""
+    if summary.empty:
+        return []
+
+    platforms = [str(p) for p in summary.index]
+    scores = [float(v) for v in summary[('overall_score', 'mean')]]
+    synergy = summary[[(SYNERGY_KEY, k) for k in SYNERGY_STAT_KEYS]].astype(float).values.tolist()
+
+    return [
+        ChartSpec(f"{brand_name}_platform_score_chart.png", render_platform_score_chart,
+                  {"platforms": platforms, "scores": scores}),
+        ChartSpec(f"{brand_name}_platform_synergy_chart.png", render_platform_synergy_chart,
+                  {"platforms": platforms, "synergy": synergy}),
+    ]
+
+
+def create_platform_comparison_charts(df_all, output_folder, brand_name):
+    """플랫폼별 비교 차트 생성"""
+    summary = build_platform_summary(df_all)
+    print_platform_summary(summary)
+    render_charts(platform_chart_specs(summary, brand_name), output_folder)
@@ -0,0 +1,157 @@
+"""
+Chart rendering subsystem
+
+차트는 (파일명, 렌더 함수, 입력 데이터) 명세로 선언하고, 렌더링은 Agg 백엔드를
+사용하는 프로세스 풀에서 실행한다. 입력 데이터 해시가 마지막 렌더링과 같고
+파일이 남아 있으면 다시 그리지 않는다. submit()은 바로 반환하므로 메인 스레드는
+그동안 LLM 섹션 생성 등 다른 작업을 진행할 수 있다.
+"""
+
+import hashlib
+import json
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from dataclasses import dataclass, field
+from typing import Any, Callable, Dict, List, Optional
+
+import matplotlib
+
+# 렌더 함수나 스타일을 바꾸면 올려서 기존 해시를 무효화
+CHART_CACHE_VERSION = 1
+MANIFEST_FILENAME = ".chart_manifest.json"
+
+
+@dataclass
+class ChartSpec:
+    """렌더링할 차트 하나. render(payload, path)는 모듈 최상위 함수여야 함 (프로세스 간 전달)"""
+
+    filename: str
+    render: Callable[[Dict[str, Any], str], None]
+    payload: Dict[str, Any] = field(default_factory=dict)
+
+    def digest(self) -> str:
+        """입력 데이터 + 렌더 함수 + 캐시 버전 해시"""
+        source = json.dumps({
+            "version": CHART_CACHE_VERSION,
+            "render": f"{self.render.__module__}.{self.render.__qualname__}",
+            "payload": self.payload,
+        }, sort_keys=True, ensure_ascii=False, default=str)
+        return hashlib.sha256(source.encode("utf-8")).hexdigest()
+
+
+def _init_worker():
+    """워커 프로세스: 비대화형 백엔드와 한글 폰트 설정"""
+    matplotlib.use("Agg")
+    from utils.font_utils import setup_matplotlib_fonts
+    setup_matplotlib_fonts()
+
+
+def _render_chart(render, payload, path):
+    """워커에서 차트 하나를 그리고 소요 시간 반환"""
+    start = time.monotonic()
+    render(payload, path)
+    return time.monotonic() - start
+
+
+class ChartRenderer:
+    """차트 명세를 프로세스 풀에서 병렬 렌더링하고 변경 없는 차트는 건너뜀"""
+
+    def __init__(self, output_folder: str, max_workers: Optional[int] = None):
+        self.output_folder = output_folder
+        self.max_workers = max_workers
+        self.manifest_path = os.path.join(output_folder, MANIFEST_FILENAME)
+        self.manifest = self._load_manifest()
+        self.skipped: List[str] = []
+        self._pending: Dict[str, Any] = {}  # filename -> (future, digest)
+        self._executor: Optional[ProcessPoolExecutor] = None
+        self._started = None
+
+    def _load_manifest(self) -> Dict[str, str]:
+        try:
+            with open(self.manifest_path, "r", encoding="utf-8") as f:
+                return json.load(f)
+        except (OSError, ValueError):
+            return {}
+
+    def _save_manifest(self):
+        try:
+            with open(self.manifest_path, "w", encoding="utf-8") as f:
+                json.dump(self.manifest, f, ensure_ascii=False, indent=2, sort_keys=True)
+        except OSError as e:
+            print(f"⚠️ 차트 해시 기록 저장 실패: {e}")
+
+    def _is_fresh(self, spec: ChartSpec, digest: str) -> bool:
+        path = os.path.join(self.output_folder, spec.filename)
+        return self.manifest.get(spec.filename) == digest and os.path.exists(path)
+
+    def submit(self, specs: List[ChartSpec]) -> "ChartRenderer":
+        """변경된 차트만 워커에 넘기고 즉시 반환"""
+        if self._started is None:
+            self._started = time.monotonic()
+
+        todo = []
+        for spec in specs:
+            digest = spec.digest()
+            if self._is_fresh(spec, digest):
+                self.skipped.append(spec.filename)
+            else:
+                todo.append((spec, digest))
+
+        if not todo:
+            return self
+
+        if self._executor is None:
+            workers = self.max_workers or min(len(todo), os.cpu_count() or 1)
+            self._executor = ProcessPoolExecutor(max_workers=max(1, workers), initializer=_init_worker)
+
+        for spec, digest in todo:
+            path = os.path.join(self.output_folder, spec.filename)
+            future = self._executor.submit(_render_chart, spec.render, spec.payload, path)
+            self._pending[spec.filename] = (future, digest, spec)
+        return self
+
+    def _render_in_process(self, spec: ChartSpec, path: str) -> float:
+        """프로세스 풀을 쓸 수 없을 때 현재 프로세스에서 렌더링"""
+        matplotlib.use("Agg")
+        return _render_chart(spec.render, spec.payload, path)
+
+    def wait(self) -> Dict[str, Any]:
+        """제출한 차트가 모두 끝날 때까지 기다리고 결과 요약 반환"""
+        rendered, failed = {}, {}
+        for filename, (future, digest, spec) in self._pending.items():
+            path = os.path.join(self.output_folder, filename)
+            try:
+                try:
+                    rendered[filename] = future.result()
+                except BrokenProcessPool:
+                    rendered[filename] = self._render_in_process(spec, path)
+                self.manifest[filename] = digest
+                print(f"차트 생성: {filename} ({rendered[filename]:.1f}초)")
+            except Exception as e:
+                failed[filename] = str(e)
+                self.manifest.pop(filename, None)
+                print(f"❌ 차트 생성 실패: {filename} - {e}")
+        self._pending.clear()
+
+        if self._executor is not None:
+            self._executor.shutdown()
+            self._executor = None
+        self._save_manifest()
+
+        for filename in self.skipped:
+            print(f"차트 유지 (입력 데이터 변경 없음): {filename}")
+        elapsed = time.monotonic() - self._started if self._started else 0.0
+        print(f"📊 차트 {len(rendered)}개 렌더링, {len(self.skipped)}개 재사용, "
+              f"{len(failed)}개 실패 ({elapsed:.1f}초)")
+
+        result = {"rendered": rendered, "skipped": list(self.skipped), "failed": failed}
+        self.skipped = []
+        self._started = None
+        return result
+
+
+def render_charts(specs: List[ChartSpec], output_folder: str, max_workers: Optional[int] = None):
+    """차트 명세를 렌더링하고 끝날 때까지 대기 (동기 호출용)"""
+    return ChartRenderer(output_folder, max_workers).submit(specs).wait()
@@ -0,0 +1,63 @@
+"""
+Per-platform summary table shared by all charts
+"""
+
+import pandas as pd
+
+EEAT_LABELS = ["Experience", "Expertise", "Authoritativeness", "Trustworthiness"]
+EEAT_KEYS = ["experience_avg", "expertise_avg", "authoritativeness_avg", "trustworthiness_avg"]
+GEO_LABELS = ["명료성", "구조성", "맥락성", "일치성", "적시성", "독창성"]
+GEO_KEYS = ["clarity_avg", "structure_avg", "context_avg", "alignment_avg", "timeliness_avg", "originality_avg"]
+SYNERGY_KEY = "synergy_avg"
+STATS = ["max", "mean", "min"]
+
+# 차트는 플랫폼별 상위 N개 게시물 기준 (overall_score 평균만 전체 게시물 기준)
+TOP_N = 10
+
+
+def build_platform_summary(df, top_n=TOP_N):
+    """플랫폼별 통계를 한 번의 groupby로 계산
+
+    Returns:
+        플랫폼(첫 등장 순서) 인덱스, (지표, 통계) MultiIndex 컬럼의 DataFrame.
+        ('overall_score', 'mean')은 전체 게시물, ('rows', 'count')는 상위 N개 게시물 수
+    """
+    if df is None or df.empty:
+        return pd.DataFrame()
+
+    metrics = EEAT_KEYS + GEO_KEYS + [SYNERGY_KEY]
+    top = df.groupby('platform', sort=False).head(top_n)
+    grouped = top.groupby('platform', sort=False)
+
+    summary = grouped[metrics].agg(STATS).round(2)
+    summary[('overall_score', 'mean')] = (
+        df.groupby('platform', sort=False)['overall_score'].mean().round(2)
+    )
+    summary[('rows', 'count')] = grouped.size()
+    return summary
+
+
+def platform_stats(summary, platform, keys, stat):
+    """요약 테이블에서 지표 목록의 통계값을 float 리스트로 반환"""
+    return [float(summary.at[platform, (key, stat)]) for key in keys]
+
+
+def print_platform_summary(summary):
+    """차트 데이터 콘솔 출력"""
+    print("\n" + "="*60)
+    print("📊 E-E-A-T 차트 데이터")
+    print("="*60)
+    for platform in summary.index:
+        print(f"\n🔹 {platform}:")
+        print(f"   최대값: {dict(zip(EEAT_LABELS, platform_stats(summary, platform, EEAT_KEYS, 'max')))}")
+        print(f"   평균값: {dict(zip(EEAT_LABELS, platform_stats(summary, platform, EEAT_KEYS, 'mean')))}")
+        print(f"   최소값: {dict(zip(EEAT_LABELS, platform_stats(summary, platform, EEAT_KEYS, 'min')))}")
+
+    print("\n" + "="*60)
+    print("📊 GEO 레이더 차트 데이터")
+    print("="*60)
+    for platform in summary.index:
+        print(f"\n🔹 {platform}:")
+        print(f"   GEO 평균: {dict(zip(GEO_LABELS, platform_stats(summary, platform, GEO_KEYS, 'mean')))}")
+        print(f"   데이터 개수: {int(summary.at[platform, ('rows', 'count')])}")
+    print("="*60)
@@ -25,7 +25,10 @@ dotenv.load_dotenv()
 from utils import CONFIG, setup_matplotlib_fonts
 from utils.file_utils import load_all_data, save_markdown_file
 from analyzers import preprocess_instagram_data, preprocess_blog_data, extract_website_data
-from charts import create_platform_comparison_charts, create_website_charts, create_individual_charts
+from charts import (
+    ChartRenderer, build_platform_summary, print_platform_summary,
+    platform_chart_specs, website_chart_specs, individual_chart_specs
+)
 from reports import create_comprehensive_report
 
 def save_report_to_db(file_path):
@@ -127,17 +130,27 @@ def main():
     
     print(f"✅ 통합 데이터: {len(df_all)}개 레코드, {len(df_all['platform'].unique())}개 플랫폼")
     
-    # 3. 차트 생성
+    # 3. 차트 생성 (플랫폼별 통계는 한 번만 계산, 렌더링은 백그라운드 프로세스에서 진행)
     print("\n📊 차트 생성 중...")
     brand_name = os.getenv("BRAND_NAME", "BRAND")
 
-    create_platform_comparison_charts(df_all, CONFIG["output_folder"], brand_name)
-    create_website_charts(df_website, CONFIG["output_folder"], brand_name)
-    create_individual_charts(df_insta, df_blog, CONFIG["output_folder"], brand_name)
+    summary = build_platform_summary(df_all)
+    print_platform_summary(summary)
+    chart_specs = (
+        platform_chart_specs(summary, brand_name)
+        + website_chart_specs(df_website, brand_name)
+        + individual_chart_specs(
+            summary,
+            df_insta['platform'].unique() if not df_insta.empty else [],
+            df_blog['platform'].unique() if not df_blog.empty else [],
+            brand_name,
+        )
+    )
+    chart_renderer = ChartRenderer(CONFIG["output_folder"], CONFIG["chart_workers"]).submit(chart_specs)
     
-    # 4. 보고서 생성
+    # 4. 보고서 생성 (LLM 섹션 생성과 차트 렌더링을 동시에 진행)
     print("\n📝 보고서 생성 중...")
-    report_content = create_comprehensive_report(CONFIG, all_data)
+    report_content = create_comprehensive_report(CONFIG, all_data, charts=chart_renderer)
     
     # 5. 보고서 저장
     output_path = os.path.join(CONFIG["output_folder"], CONFIG["output_filename"])
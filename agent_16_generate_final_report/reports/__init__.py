@@ -2,10 +2,15 @@
 Report generation module
 """
 
-from .llm_generator import generate_text_with_llm
+from .llm_generator import generate_text_with_llm, agenerate_text_with_llm
+from .section_builder import ReportSection, SectionResult, generate_sections
 from .report_generator import create_comprehensive_report
 
 __all__ = [
     'generate_text_with_llm',
+    'agenerate_text_with_llm',
+    'ReportSection',
+    'SectionResult',
+    'generate_sections',
     'create_comprehensive_report'
 ]
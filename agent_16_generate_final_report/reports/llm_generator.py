@@ -3,9 +3,14 @@ LLM text generation utilities
 """
 
 import os
-from openai import OpenAI
+import sys
 from utils.config import CONFIG
 
+# 공용 모듈(shared) 접근을 위해 저장소 루트 추가
+sys.path.append(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+
+from shared.llm_client import CachedAsyncOpenAI, get_llm_client
+
 _SYSTEM_PROMPT = """
 당신은 전문 디지털 마케팅 분석가입니다. 
 주어진 데이터를 바탕으로 비즈니스 보고서의 각 섹션을 작성하는 임무를 맡았습니다.
@@ -14,15 +19,18 @@ _SYSTEM_PROMPT = """
 결과는 반드시 마크다운 형식으로만 출력해 주세요. 제목(헤딩)은 제외하고 본문 내용만 작성하세요.
 """
 
+def _build_messages(prompt, context_data_str):
+    return [
+        {"role": "system", "content": _SYSTEM_PROMPT},
+        {"role": "user", "content": f"{prompt}\n\n컨텍스트 데이터:\n{context_data_str}"}
+    ]
+
 def generate_text_with_llm(prompt, context_data_str):
     try:
-        client = OpenAI(api_key=os.getenv('OPENAI_API_KEY'))
+        client = get_llm_client(os.getenv('OPENAI_API_KEY'))
         response = client.chat.completions.create(
             model=CONFIG["llm_model"],
-            messages=[
-                {"role": "system", "content": _SYSTEM_PROMPT},
-                {"role": "user", "content": f"{prompt}\n\n컨텍스트 데이터:\n{context_data_str}"}
-            ],
+            messages=_build_messages(prompt, context_data_str),
             temperature=0.3,
             max_tokens=2000
         )
@@ -30,3 +38,25 @@ def generate_text_with_llm(prompt, context_data_str):
     except Exception as e:
         print(f"LLM 생성 오류: {e}")
         return f"LLM 분석 결과를 생성할 수 없습니다. 오류: {e}"
+
+def create_async_llm_client(api_key=None):
+    """보고서 1회 생성 동안 모든 섹션이 공유할 비동기 클라이언트 (캐시는 동기 클라이언트와 공용)"""
+    return CachedAsyncOpenAI(api_key=api_key)
+
+async def agenerate_text_with_llm(client, prompt, context_data_str):
+    """generate_text_with_llm의 비동기 버전. (본문, 사용량 dict) 반환"""
+    try:
+        response = await client.chat.completions.create(
+            model=CONFIG["llm_model"],
+            messages=_build_messages(prompt, context_data_str),
+            temperature=0.3,
+            max_tokens=2000
+        )
+        usage = getattr(response, "usage", None)
+        return response.choices[0].message.content, {
+            "total_tokens": getattr(usage, "total_tokens", 0) if usage else 0,
+            "cached": getattr(response, "cached", False),
+        }
+    except Exception as e:
+        print(f"LLM 생성 오류: {e}")
+        return f"LLM 분석 결과를 생성할 수 없습니다. 오류: {e}", {"total_tokens": 0, "error": str(e)}
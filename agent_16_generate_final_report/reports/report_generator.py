@@ -8,53 +8,25 @@ from utils.markdown_utils import (
     md_heading, md_image_with_fallback, md_horizontal_rule, 
     md_blockquote, md_centered_image_with_caption
 )
-from .llm_generator import generate_text_with_llm
+from .section_builder import ReportSection, generate_sections
 
-def create_comprehensive_report(config, all_data):
-    """종합 보고서 생성"""
-    parts = []
+def _build_llm_sections(config, all_data):
+    """보고서의 LLM 섹션 목록 (문서 순서). 모든 섹션이 서로 독립적이라 한 번에 동시 생성됨"""
     brand_name = config["brand_name"]
-    # output_folder = config["output_folder"]
-    # image_folder = config["image_folder"]
-    
-    # 실제 차트 저장 경로 (output 폴더 내에 저장)
-    chart_path_prefix = config["output_folder"]  # 실제 저장 경로
-    # 보고서에서 참조하는 이미지 경로 (markdown 내 참조용)
-    input_image_path_prefix = "data/images"  # 보고서 참조 경로
-    
-    # 제목 섹션
-    parts.append(md_heading(f"🏢 KIJUN 브랜드 디지털 채널 최적화 보고서", 1))
-    parts.append(f"**작성일**: {config['report_date']}\n**수신**: {config['recipient']}")
-    parts.append(md_horizontal_rule())
 
     # I. 보고서 요약
-    parts.append(md_heading("📜 I. 보고서 요약 (Executive Summary)", 2))
     summary_prompt = f"아래 분석 데이터를 종합하여 '{brand_name}' 브랜드의 디지털 채널 현황에 대한 '주요 분석 결과'와 '핵심 권장 전략'을 요약해 주세요. 웹사이트 SEO/GEO 문제점과 소셜미디어 최적화 방안을 중심으로 15줄 이상 작성해 주세요."
     summary_context = json.dumps({
         "platform_performance": "Instagram > Naver Blog > Tistory 순 성과",
         "website_issues": "SEO/GEO 점수 낮음, 메타데이터 부재",
         "ugc_potential": "UGC 활용도 높음, 시너지 편차 존재"
     }, ensure_ascii=False, indent=2)
-    summary_text = generate_text_with_llm(summary_prompt, summary_context)
-    parts.append(md_blockquote(summary_text))
-    parts.append(md_horizontal_rule())
 
     # II. 공식 웹사이트 분석
-    parts.append(md_heading("🌐 II. 공식 웹사이트 분석 및 개선안", 2))
-    
-    parts.append(md_heading("**II-1. SEO(검색엔진 최적화) 분석**", 3))
     website_seo_prompt = f"웹사이트 SEO 분석 결과를 바탕으로 현황 진단과 개선 전략을 제시해주세요. 메타 설명 부재, 이미지 ALT 속성 부재 등 핵심 문제점을 명시하고 개선 방안을 구체적으로 제안해주세요."
     website_seo_context = json.dumps(all_data.get("website_analysis", {}).get("site_analysis", {}).get("seo", {}), ensure_ascii=False, indent=2)
-    parts.append(generate_text_with_llm(website_seo_prompt, website_seo_context))
-    parts.append(md_centered_image_with_caption("웹사이트 최적화 전후 비교", f"{chart_path_prefix}/{brand_name}_website_optimization_chart.png", f"{input_image_path_prefix}/{brand_name}_website_optimization_chart.png",500, "웹사이트 최적화 전후 비교"))
-    
-    parts.append("\n" + md_heading("**II-2. GEO(생성형 엔진 최적화) 분석**", 3))
     website_geo_prompt = f"웹사이트 GEO 분석 데이터를 해석하고, {brand_name} 웹사이트가 생성형 AI 검색 결과에 더 잘 노출되기 위한 대응 전략을 제시해주세요. GEO 6가지 평가 항목별로 현재 점수를 진단하고 개선 방안을 제안해주세요."
     website_geo_context = json.dumps(all_data.get("website_analysis", {}).get("metadata", {}), ensure_ascii=False, indent=2)
-    parts.append(generate_text_with_llm(website_geo_prompt, website_geo_context))
-    parts.append(md_centered_image_with_caption("웹사이트 GEO 분석", f"{chart_path_prefix}/{brand_name}_website_geo_radar_chart.png", f"{input_image_path_prefix}/{brand_name}_website_geo_radar_chart.png", 400, "웹사이트 GEO 분석 레이더 차트"))
-    
-    parts.append("\n" + md_heading("**II-3. 로컬 SEO 진단 (지도 서비스 최적화)**", 3))
     map_prompt = f"'{brand_name} {config.get('brand_location', '')}' 의 로컬 SEO 강화를 위한 지도 서비스 최적화 컨설팅 내용을 작성해줘. Google Maps와 Bing Maps 각각에 대해, 사용자가 직접 검색 결과를 확인할 수 있는 링크를 먼저 제공하고, '브랜드가 등록되지 않은 경우'를 위한 신규 등록 가이드와 '이미 등록된 경우'를 위한 프로필 최적화 가이드를 모두 상세히 안내해줘."
     query = f"{brand_name} {config.get('brand_location', '')}"
     map_context = json.dumps({
@@ -63,13 +35,8 @@ def create_comprehensive_report(config, all_data):
         "google_register_url": "https://www.google.com/business/",
         "bing_register_url": "https://www.bingplaces.com/",
     }, ensure_ascii=False, indent=2)
-    parts.append(generate_text_with_llm(map_prompt, map_context))
-    
-    parts.append(md_horizontal_rule())
 
     # III. 채널별 종합 분석
-    parts.append(md_heading("📊 III. 채널별 종합 분석 (Overall Channel Analysis)", 2))
-    
     channel_prompt = """
 4개 채널(Instagram 공식, Instagram UGC, Naver Blog, Tistory) 분석 결과를 바탕으로:
 1. 아래 표 형식으로 각 채널의 주요 강점과 약점을 요약해주세요.
@@ -83,7 +50,83 @@ def create_comprehensive_report(config, all_data):
 | **Tistory** | (내용 입력) | (내용 입력) |
 """
     channel_context = "Instagram 공식 계정 점수가 가장 높고, UGC는 시너지 편차가 큼. Naver/Tistory 블로그는 중간 수준."
-    parts.append(generate_text_with_llm(channel_prompt, channel_context))
+
+    # IV. 소셜 채널 (Instagram) 분석
+    insta_analysis_prompt = "인스타그램 공식 계정과 UGC의 분석 데이터를 바탕으로 차이점을 분석하고, 콘텐츠 전략 개선 방안을 제시해주세요."
+    insta_analysis_context = json.dumps({"instagram_performance": "공식 계정 우수, UGC 시너지 편차 존재"}, ensure_ascii=False, indent=2)
+
+    # V. 블로그 채널 분석
+    blog_analysis_prompt = "Naver 블로그와 Tistory 분석 결과를 바탕으로 각 플랫폼의 특성과 개선 방안을 제시해주세요. 블로그 SEO와 콘텐츠 전략을 중심으로 설명해주세요."
+    blog_analysis_context = json.dumps({"blog_performance": "Naver > Tistory, 콘텐츠 최적화 필요"}, ensure_ascii=False, indent=2)
+
+    # VI. 종합 권장사항
+    recommendation_prompt = f"{brand_name} 브랜드의 디지털 채널 최적화를 위한 종합 권장사항과 단계별 실행 계획을 제시해주세요. 우선순위별로 구체적인 액션 아이템을 나열해주세요."
+    recommendation_context = "전체 분석 결과 종합"
+
+    return [
+        ReportSection("summary", summary_prompt, summary_context),
+        ReportSection("website_seo", website_seo_prompt, website_seo_context),
+        ReportSection("website_geo", website_geo_prompt, website_geo_context),
+        ReportSection("local_map", map_prompt, map_context),
+        ReportSection("channel", channel_prompt, channel_context),
+        ReportSection("instagram", insta_analysis_prompt, insta_analysis_context),
+        ReportSection("blog", blog_analysis_prompt, blog_analysis_context),
+        ReportSection("recommendations", recommendation_prompt, recommendation_context),
+    ]
+
+
+def create_comprehensive_report(config, all_data, charts=None):
+    """종합 보고서 생성
+
+    charts: 렌더링 중인 ChartRenderer. LLM 섹션 생성이 끝난 뒤 차트 완료를 기다렸다가
+    이미지 존재 여부를 확인하며 조립한다.
+    """
+    parts = []
+    brand_name = config["brand_name"]
+    # output_folder = config["output_folder"]
+    # image_folder = config["image_folder"]
+    
+    # 실제 차트 저장 경로 (output 폴더 내에 저장)
+    chart_path_prefix = config["output_folder"]  # 실제 저장 경로
+    # 보고서에서 참조하는 이미지 경로 (markdown 내 참조용)
+    input_image_path_prefix = "data/images"  # 보고서 참조 경로
+    
+    # LLM 섹션은 먼저 모두 선언해 동시에 생성하고, 아래에서 문서 순서대로 조립
+    sections = _build_llm_sections(config, all_data)
+    texts = {key: result.text for key, result in generate_sections(sections).items()}
+    if charts is not None:
+        charts.wait()
+
+    # 제목 섹션
+    parts.append(md_heading(f"🏢 KIJUN 브랜드 디지털 채널 최적화 보고서", 1))
+    parts.append(f"**작성일**: {config['report_date']}\n**수신**: {config['recipient']}")
+    parts.append(md_horizontal_rule())
+
+    # I. 보고서 요약
+    parts.append(md_heading("📜 I. 보고서 요약 (Executive Summary)", 2))
+    parts.append(md_blockquote(texts["summary"]))
+    parts.append(md_horizontal_rule())
+
+    # II. 공식 웹사이트 분석
+    parts.append(md_heading("🌐 II. 공식 웹사이트 분석 및 개선안", 2))
+    
+    parts.append(md_heading("**II-1. SEO(검색엔진 최적화) 분석**", 3))
+    parts.append(texts["website_seo"])
+    parts.append(md_centered_image_with_caption("웹사이트 최적화 전후 비교", f"{chart_path_prefix}/{brand_name}_website_optimization_chart.png", f"{input_image_path_prefix}/{brand_name}_website_optimization_chart.png",500, "웹사이트 최적화 전후 비교"))
+    
+    parts.append("\n" + md_heading("**II-2. GEO(생성형 엔진 최적화) 분석**", 3))
+    parts.append(texts["website_geo"])
+    parts.append(md_centered_image_with_caption("웹사이트 GEO 분석", f"{chart_path_prefix}/{brand_name}_website_geo_radar_chart.png", f"{input_image_path_prefix}/{brand_name}_website_geo_radar_chart.png", 400, "웹사이트 GEO 분석 레이더 차트"))
+    
+    parts.append("\n" + md_heading("**II-3. 로컬 SEO 진단 (지도 서비스 최적화)**", 3))
+    parts.append(texts["local_map"])
+    
+    parts.append(md_horizontal_rule())
+
+    # III. 채널별 종합 분석
+    parts.append(md_heading("📊 III. 채널별 종합 분석 (Overall Channel Analysis)", 2))
+    
+    parts.append(texts["channel"])
     
     # 플랫폼 비교 차트 2열 배치
     platform_score_path = f"{chart_path_prefix}/{brand_name}_platform_score_chart.png"
@@ -101,9 +144,7 @@ def create_comprehensive_report(config, all_data):
     parts.append(md_heading("📱 IV. 소셜 채널 (Instagram) 심층 분석 및 컨설팅", 2))
     parts.append(md_heading("**IV-1. 콘텐츠 및 UGC 분석**", 3))
     
-    insta_analysis_prompt = "인스타그램 공식 계정과 UGC의 분석 데이터를 바탕으로 차이점을 분석하고, 콘텐츠 전략 개선 방안을 제시해주세요."
-    insta_analysis_context = json.dumps({"instagram_performance": "공식 계정 우수, UGC 시너지 편차 존재"}, ensure_ascii=False, indent=2)
-    parts.append(generate_text_with_llm(insta_analysis_prompt, insta_analysis_context))
+    parts.append(texts["instagram"])
     
     # Instagram 차트들
     parts.append(md_centered_image_with_caption("인스타그램 E-E-A-T 분석", f"{chart_path_prefix}/{brand_name}_insta_eeat_line_chart.png", f"{input_image_path_prefix}/{brand_name}_insta_eeat_line_chart.png", 600, "인스타그램 E-E-A-T 분석"))
@@ -128,9 +169,7 @@ def create_comprehensive_report(config, all_data):
     # V. 블로그 채널 분석
     parts.append(md_heading("📝 V. 블로그 채널 (Naver/Tistory) 분석 및 컨설팅", 2))
     
-    blog_analysis_prompt = "Naver 블로그와 Tistory 분석 결과를 바탕으로 각 플랫폼의 특성과 개선 방안을 제시해주세요. 블로그 SEO와 콘텐츠 전략을 중심으로 설명해주세요."
-    blog_analysis_context = json.dumps({"blog_performance": "Naver > Tistory, 콘텐츠 최적화 필요"}, ensure_ascii=False, indent=2)
-    parts.append(generate_text_with_llm(blog_analysis_prompt, blog_analysis_context))
+    parts.append(texts["blog"])
     
     # 블로그 차트들
     parts.append(md_centered_image_with_caption("블로그 E-E-A-T 분석", f"{chart_path_prefix}/{brand_name}_blog_eeat_line_chart.png", f"{input_image_path_prefix}/{brand_name}_blog_eeat_line_chart.png", 600, "블로그 E-E-A-T 분석"))
@@ -143,8 +182,6 @@ def create_comprehensive_report(config, all_data):
     # VI. 종합 권장사항
     parts.append(md_heading("🎯 VI. 종합 권장사항 및 실행 계획", 2))
     
-    recommendation_prompt = f"{brand_name} 브랜드의 디지털 채널 최적화를 위한 종합 권장사항과 단계별 실행 계획을 제시해주세요. 우선순위별로 구체적인 액션 아이템을 나열해주세요."
-    recommendation_context = "전체 분석 결과 종합"
-    parts.append(generate_text_with_llm(recommendation_prompt, recommendation_context))
+    parts.append(texts["recommendations"])
 
     return "\n\n".join(parts)
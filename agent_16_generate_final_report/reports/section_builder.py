@@ -0,0 +1,153 @@
+"""
+Report section DAG builder
+
+보고서의 LLM 섹션을 의존 관계(DAG)로 선언하고, 서로 독립적인 섹션은
+하나의 공용 비동기 클라이언트로 동시에 생성한다. 결과는 선언 순서(문서 순서)로
+돌려주며 섹션별 지연 시간과 토큰 수를 함께 기록한다.
+"""
+
+import asyncio
+import os
+import time
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from typing import Callable, Dict, List, Optional, Tuple, Union
+
+from utils.config import CONFIG
+from .llm_generator import agenerate_text_with_llm, create_async_llm_client
+
+# 문자열 또는 의존 섹션 결과(key -> text)를 받아 컨텍스트를 만드는 함수
+SectionContext = Union[str, Callable[[Dict[str, str]], str]]
+
+
+@dataclass
+class ReportSection:
+    """LLM으로 생성할 보고서 섹션 하나"""
+
+    key: str
+    prompt: str
+    context: SectionContext
+    depends_on: Tuple[str, ...] = ()
+
+
+@dataclass
+class SectionResult:
+    """섹션 생성 결과와 측정값"""
+
+    key: str
+    text: str
+    latency: float = 0.0
+    tokens: int = 0
+    cached: bool = False
+    error: Optional[str] = None
+
+
+def _validate(sections: List[ReportSection]):
+    """중복 key, 존재하지 않는 의존성, 순환 의존성 검사"""
+    keys = [s.key for s in sections]
+    if len(keys) != len(set(keys)):
+        raise ValueError(f"중복된 섹션 key가 있습니다: {keys}")
+
+    deps = {s.key: s.depends_on for s in sections}
+    for key, parents in deps.items():
+        missing = [p for p in parents if p not in deps]
+        if missing:
+            raise ValueError(f"섹션 '{key}'의 의존 섹션이 없습니다: {missing}")
+
+    visiting, done = set(), set()
+
+    def visit(key):
+        if key in done:
+            return
+        if key in visiting:
+            raise ValueError(f"섹션 의존성에 순환이 있습니다: {key}")
+        visiting.add(key)
+        for parent in deps[key]:
+            visit(parent)
+        visiting.discard(key)
+        done.add(key)
+
+    for key in keys:
+        visit(key)
+
+
+async def generate_sections_async(
+    sections: List[ReportSection],
+    max_concurrency: int = CONFIG["llm_max_concurrency"],
+) -> Dict[str, SectionResult]:
+    """의존 섹션이 끝난 섹션부터 동시성 제한 하에 생성하고 선언 순서대로 반환"""
+    _validate(sections)
+    if not sections:
+        return {}
+
+    semaphore = asyncio.Semaphore(max(1, max_concurrency))
+    try:
+        client = create_async_llm_client(os.getenv('OPENAI_API_KEY'))
+    except Exception as e:
+        # 키 누락 등으로 클라이언트를 만들 수 없으면 섹션마다 오류 문구로 대체됨
+        print(f"LLM 클라이언트 생성 오류: {e}")
+        client = None
+    tasks: Dict[str, asyncio.Task] = {}
+
+    async def run(section: ReportSection) -> SectionResult:
+        parents = [tasks[key] for key in section.depends_on]
+        parent_results = await asyncio.gather(*parents)
+        context = section.context
+        if callable(context):
+            context = context({r.key: r.text for r in parent_results})
+
+        async with semaphore:
+            start = time.monotonic()
+            text, usage = await agenerate_text_with_llm(client, section.prompt, context)
+            latency = time.monotonic() - start
+
+        return SectionResult(
+            key=section.key,
+            text=text,
+            latency=latency,
+            tokens=usage.get("total_tokens", 0),
+            cached=usage.get("cached", False),
+            error=usage.get("error"),
+        )
+
+    try:
+        # 위상 순서와 무관하게 모든 task를 먼저 만들어 두고 의존 task를 await
+        for section in sections:
+            tasks[section.key] = asyncio.ensure_future(run(section))
+        results = await asyncio.gather(*tasks.values())
+    finally:
+        if client is not None:
+            await client.close()
+
+    return {result.key: result for result in results}
+
+
+def print_section_report(results: Dict[str, SectionResult], elapsed: float):
+    """섹션별 지연 시간/토큰 수와 전체 소요 시간 출력"""
+    sequential = sum(r.latency for r in results.values())
+    total_tokens = sum(r.tokens for r in results.values())
+    print(f"   ⏱️ LLM 섹션 {len(results)}개 생성: {elapsed:.1f}초 "
+          f"(순차 실행 시 약 {sequential:.1f}초, 총 {total_tokens:,} 토큰)")
+    for result in results.values():
+        status = "캐시" if result.cached else ("실패" if result.error else "생성")
+        print(f"      - {result.key:<16} {result.latency:>6.1f}초 "
+              f"{result.tokens:>7,} 토큰  [{status}]")
+
+
+def generate_sections(
+    sections: List[ReportSection],
+    max_concurrency: int = CONFIG["llm_max_concurrency"],
+) -> Dict[str, SectionResult]:
+    """동기 호출용 래퍼 (이미 이벤트 루프가 돌고 있으면 별도 스레드에서 실행)"""
+    start = time.monotonic()
+    coro = generate_sections_async(sections, max_concurrency)
+    try:
+        asyncio.get_running_loop()
+    except RuntimeError:
+        results = asyncio.run(coro)
+    else:
+        with ThreadPoolExecutor(max_workers=1) as executor:
+            results = executor.submit(asyncio.run, coro).result()
+
+    print_section_report(results, time.monotonic() - start)
+    return results
@@ -11,6 +11,8 @@ CONFIG = {
     "recipient": "KIJUN 마케팅팀",
     "output_filename": "KIJUN_브랜드_디지털채널_최적화_보고서_통합본.md",
     "llm_model": "gpt-4o-mini",
+    "llm_max_concurrency": 4,  # 동시에 생성할 보고서 섹션 수
+    "chart_workers": None,  # 차트 렌더링 프로세스 수 (None이면 차트 수와 CPU 수 중 작은 값)
     "input_folder": "./input",
     "image_folder": "./input/image",
     "output_folder": "./output",
@@ -4,7 +4,19 @@
 @tool 데코레이터 + LangGraph 워크플로우 + 사용자 인터페이스
 """
 
-from typing import Dict, List, Optional, TypedDict, Literal, Annotated, Set, Any
+from typing import (
+    Dict,
+    List,
+    Optional,
+    TypedDict,
+    Literal,
+    Annotated,
+    Set,
+    Any,
+    Callable,
+    Iterator,
+    Tuple,
+)
 from langgraph.graph import StateGraph, END
 from langgraph.graph.message import add_messages
 from langgraph.checkpoint.memory import MemorySaver
@@ -12,11 +24,18 @@ from langchain_core.messages import HumanMessage, AIMessage, SystemMessage
 from langchain_openai import ChatOpenAI
 from langchain.tools import tool
 from dataclasses import dataclass, asdict
+from collections import Counter, OrderedDict, deque
 import asyncio
 import os
+import io
+import gzip
 import json
+import hashlib
 import time
-import requests
+import threading
+from concurrent.futures import ThreadPoolExecutor, as_completed, wait, FIRST_COMPLETED
+from concurrent.futures import TimeoutError as FuturesTimeoutError
+from contextlib import contextmanager
 from bs4 import BeautifulSoup
 import re
 from urllib.parse import urlparse, urljoin
@@ -26,6 +45,9 @@ from mysql.connector import Error
 from dotenv import load_dotenv
 import os
 
+from shared.llm_client import get_llm_client
+from shared.http_client import CrawlerHTTPClient
+
 # from pathlib import Path
 
 # 환경변수 로드
@@ -54,6 +76,16 @@ except ImportError:
 
     print("⚠️ Selenium이 설치되지 않았습니다. 기본 HTTP 크롤링만 사용됩니다.")
 
+# sitemap 스트리밍 파서 (lxml이 없으면 표준 라이브러리 ElementTree 사용)
+try:
+    from lxml import etree as sitemap_etree
+
+    LXML_AVAILABLE = True
+except ImportError:
+    import xml.etree.ElementTree as sitemap_etree
+
+    LXML_AVAILABLE = False
+
 
 class DatabaseManager:
     """데이터베이스 연결 및 쿼리 관리"""
@@ -279,17 +311,258 @@ BUSINESS_SCHEMA_TEMPLATES = {
 }
 
 
+class _ChunkReader(io.RawIOBase):
+    """바이트 청크 이터레이터를 파일 객체처럼 읽게 해 주는 어댑터"""
+
+    def __init__(self, chunks: Iterator[bytes]):
+        self._chunks = chunks
+        self._buffer = b""
+
+    def readable(self) -> bool:
+        return True
+
+    def readinto(self, b) -> int:
+        while not self._buffer:
+            try:
+                self._buffer = next(self._chunks)
+            except StopIteration:
+                return 0
+        n = min(len(b), len(self._buffer))
+        b[:n] = self._buffer[:n]
+        self._buffer = self._buffer[n:]
+        return n
+
+
+def open_sitemap_stream(chunks: Iterator[bytes]):
+    """응답 바이트 스트림을 파일 객체로 감싸고, gzip(.xml.gz)이면 압축 해제 스트림 반환"""
+    stream = io.BufferedReader(_ChunkReader(chunks), buffer_size=64 * 1024)
+    if stream.peek(2)[:2] == b"\x1f\x8b":
+        return gzip.GzipFile(fileobj=stream)
+    return stream
+
+
+def iter_sitemap_entries(source) -> Iterator[Tuple[str, str]]:
+    """sitemap / sitemap index XML을 스트리밍 파싱해 ("url" | "sitemap", loc)를 순서대로 반환
+
+    요소를 처리한 즉시 비워서 수만 개의 <loc>가 있어도 메모리 사용량이 일정하다.
+    """
+    if LXML_AVAILABLE:
+        events = sitemap_etree.iterparse(
+            source, events=("end",), resolve_entities=False, no_network=True, huge_tree=True
+        )
+    else:
+        events = sitemap_etree.iterparse(source, events=("end",))
+
+    for _, elem in events:
+        kind = elem.tag.rsplit("}", 1)[-1]
+        if kind not in ("url", "sitemap"):
+            continue
+        loc = None
+        for child in elem:
+            if child.tag.rsplit("}", 1)[-1] == "loc":
+                loc = (child.text or "").strip()
+                break
+        elem.clear()
+        if LXML_AVAILABLE:
+            # 이미 처리한 형제 요소도 트리에서 제거
+            while elem.getprevious() is not None:
+                del elem.getparent()[0]
+        if loc:
+            yield kind, loc
+
+
+class _DiscoveryRun:
+    """URL 탐색 1회의 시간 상한/취소 토큰 (해당 탐색의 작업 스레드에만 전달)"""
+
+    def __init__(self, timeout: float):
+        self.deadline = time.monotonic() + timeout
+        self.cancelled = threading.Event()
+
+
+class BrowserPool:
+    """headless Chrome 인스턴스를 재사용하는 브라우저 풀
+
+    - 최대 size개의 Chrome을 띄워 두고 페이지마다 체크아웃/반납
+    - 한 브라우저가 max_pages_per_browser 페이지를 처리하면 재생성(recycle)
+    - 사용 중 예외가 발생한 브라우저는 폐기하고 새로 생성
+    """
+
+    def __init__(
+        self,
+        chrome_options,
+        size: int = 3,
+        max_pages_per_browser: int = 20,
+        checkout_timeout: float = 60.0,
+    ):
+        self.chrome_options = chrome_options
+        self.size = max(1, size)
+        self.max_pages_per_browser = max(1, max_pages_per_browser)
+        self.checkout_timeout = checkout_timeout
+
+        # 유휴 브라우저(LIFO)와 생성 수는 _lock으로 보호하고, 반납/폐기 시 _available로 대기자를 깨움
+        self._idle: List = []
+        self._lock = threading.Lock()
+        self._available = threading.Condition(self._lock)
+        self._created = 0
+        self._use_counts: Dict[int, int] = {}
+        self._closed = False
+
+        self.stats = {
+            "launched": 0,
+            "checkouts": 0,
+            "recycled": 0,
+            "crashed": 0,
+            "launch_time": 0.0,
+        }
+
+    def _launch(self):
+        """새 Chrome 인스턴스 실행"""
+        start = time.monotonic()
+        driver = webdriver.Chrome(options=self.chrome_options)
+        with self._lock:
+            self.stats["launched"] += 1
+            self.stats["launch_time"] += time.monotonic() - start
+            self._use_counts[id(driver)] = 0
+        return driver
+
+    def _launch_reserved(self):
+        """_created에 자리를 잡아 둔 상태에서 브라우저 실행 (실패하면 자리 반환)"""
+        try:
+            return self._launch()
+        except Exception:
+            with self._available:
+                self._created -= 1
+                self._available.notify()
+            raise
+
+    def warm_up(self, count: int = None):
+        """지정한 수만큼 브라우저를 미리 띄워 둠"""
+        count = min(count or self.size, self.size)
+        while True:
+            with self._lock:
+                if self._closed or self._created >= count:
+                    return
+                self._created += 1
+            driver = self._launch_reserved()
+            with self._available:
+                self._idle.append(driver)
+                self._available.notify()
+
+    def _acquire(self):
+        deadline = time.monotonic() + self.checkout_timeout
+        with self._available:
+            while True:
+                if self._closed:
+                    raise RuntimeError("BrowserPool이 이미 종료되었습니다")
+                if self._idle:
+                    return self._idle.pop()
+                # 재생성/크래시로 자리가 비면 기다리던 스레드가 새 브라우저를 띄움
+                if self._created < self.size:
+                    self._created += 1
+                    break
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    raise TimeoutError("사용 가능한 브라우저를 기다리다 시간 초과")
+                self._available.wait(remaining)
+
+        return self._launch_reserved()
+
+    def _discard(self, driver):
+        with self._available:
+            self._created -= 1
+            self._use_counts.pop(id(driver), None)
+            self._available.notify()
+        try:
+            driver.quit()
+        except Exception:
+            pass
+
+    def _release(self, driver, healthy: bool):
+        with self._available:
+            uses = self._use_counts.get(id(driver), 0) + 1
+            self._use_counts[id(driver)] = uses
+            discard = self._closed or not healthy or uses >= self.max_pages_per_browser
+            if not healthy:
+                self.stats["crashed"] += 1
+            elif not self._closed and uses >= self.max_pages_per_browser:
+                self.stats["recycled"] += 1
+            if not discard:
+                self._idle.append(driver)
+                self._available.notify()
+
+        if discard:
+            self._discard(driver)
+
+    @contextmanager
+    def browser(self):
+        """브라우저 체크아웃 (with 블록 안에서 예외 발생 시 해당 브라우저는 폐기)"""
+        driver = self._acquire()
+        with self._lock:
+            self.stats["checkouts"] += 1
+        healthy = True
+        try:
+            yield driver
+        except BaseException:
+            healthy = False
+            raise
+        finally:
+            self._release(driver, healthy)
+
+    def close(self):
+        """풀의 모든 브라우저 종료"""
+        with self._available:
+            self._closed = True
+            idle, self._idle = self._idle, []
+            self._available.notify_all()
+        for driver in idle:
+            self._discard(driver)
+
+
 class StreamlinedSEOGEOCrawler:
     """LLM 분석을 위한 다중 페이지 HTML 수집 크롤러"""
 
-    def __init__(self, base_url: str, max_pages: int = 9):
+    def __init__(
+        self,
+        base_url: str,
+        max_pages: int = 9,
+        max_workers: int = 3,
+        politeness_delay: float = 0.5,
+        browser_pool: Optional[BrowserPool] = None,
+        max_pages_per_browser: int = 20,
+        discovery_workers: int = 8,
+        discovery_timeout: float = 60.0,
+    ):
         self.base_url = base_url.rstrip("/")
         self.max_pages = max_pages
         self.max_product_pages = 3
+        self.max_sitemap_files = 50  # sitemap index 재귀 시 읽을 최대 sitemap 파일 수
         self.parsed_base = urlparse(base_url)
         self.crawled_urls: Set[str] = set()
         self.results: List[Dict[str, Any]] = []
 
+        # 동시 크롤링 설정 (고정 sleep 대신 호스트별 politeness budget 사용)
+        # 페이지 요청 간격은 공용 HTTP 클라이언트의 호스트 리미터 하나로 관리
+        self.max_workers = max(1, max_workers)
+        self.politeness_delay = max(0.0, politeness_delay)
+        self.page_timings: List[Dict[str, Any]] = []
+        self._state_lock = threading.Lock()
+
+        # URL 탐색 설정 (keep-alive 공유 세션 + 전체 탐색 시간 상한)
+        self.discovery_workers = max(1, discovery_workers)
+        self.discovery_timeout = discovery_timeout
+        self._discovery_local = threading.local()
+        self._homepage_lock = threading.Lock()
+        self._homepage_html: Optional[str] = None
+
+        # 공용 HTTP 클라이언트 (keep-alive/HTTP2, 재시도, 조건부 GET)
+        self.http = CrawlerHTTPClient(
+            headers={
+                "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36"
+            },
+            max_connections=self.discovery_workers + self.max_workers,
+            max_per_host=self.discovery_workers + self.max_workers,
+        )
+
         # Chrome 옵션 설정 (Selenium 사용 가능한 경우만)
         if SELENIUM_AVAILABLE:
             self.chrome_options = Options()
@@ -304,6 +577,16 @@ class StreamlinedSEOGEOCrawler:
         else:
             self.chrome_options = None
 
+        # 탐색 단계와 크롤링 단계가 공유하는 브라우저 풀
+        self._owns_browser_pool = browser_pool is None
+        if browser_pool is None and SELENIUM_AVAILABLE:
+            browser_pool = BrowserPool(
+                self.chrome_options,
+                size=self.max_workers,
+                max_pages_per_browser=max_pages_per_browser,
+            )
+        self.browser_pool = browser_pool
+
         # 우선순위 페이지 정의
         self.priority_pages = [
             ("main", ["", "/", "/index", "/index.html", "/home", "/main"]),
@@ -404,27 +687,48 @@ class StreamlinedSEOGEOCrawler:
         ]
 
     def discover_priority_urls(self) -> List[str]:
-        """우선순위 기반 URL 발견"""
+        """우선순위 기반 URL 발견 (sitemap / 내부 링크 / 직접 경로 / 상품 페이지 동시 탐색)"""
         print("🔍 우선순위 페이지 발견 중...")
 
-        # 1. Sitemap에서 URL 수집
-        sitemap_urls = self.get_sitemap_urls()
-        # print(f"📋 Sitemap에서 {len(sitemap_urls)}개 URL 발견")
+        run = _DiscoveryRun(self.discovery_timeout)
 
-        # 2. 메인페이지에서 내부 링크 수집
-        main_page_urls = self.get_internal_links_from_page(self.base_url)
-        # print(f"🔗 메인페이지에서 {len(main_page_urls)}개 링크 발견")
+        discovery_steps = {
+            "sitemap": self.get_sitemap_urls,  # 1. Sitemap에서 URL 수집
+            "main_page": lambda: self.get_internal_links_from_page(
+                self.base_url
+            ),  # 2. 메인페이지에서 내부 링크 수집
+            "direct_paths": self.check_direct_paths,  # 3. 직접 경로 확인
+            "products": self.discover_product_pages,  # 4. 상품 페이지 수집
+        }
+        discovered: Dict[str, List[str]] = {}
 
-        # 3. 직접 경로 확인
-        direct_urls = self.check_direct_paths()
-        # print(f"🎯 직접 경로에서 {len(direct_urls)}개 URL 확인")
+        executor = ThreadPoolExecutor(max_workers=len(discovery_steps))
+        futures = {
+            executor.submit(self._bind_discovery_run(step, run)): name
+            for name, step in discovery_steps.items()
+        }
+        try:
+            for future in as_completed(futures, timeout=self.discovery_timeout):
+                try:
+                    discovered[futures[future]] = future.result()
+                except Exception as e:
+                    print(f"⚠️ {futures[future]} 탐색 실패: {e}")
+        except FuturesTimeoutError:
+            pending = [name for f, name in futures.items() if not f.done()]
+            print(f"⏱️ 탐색 시간 상한 도달 - 미완료 단계 중단: {', '.join(pending)}")
+        finally:
+            # 남은 작업은 다음 요청 전에 이번 탐색의 취소 토큰을 보고 종료
+            # (토큰은 탐색 스레드에만 있으므로 이후 직접 호출에는 영향 없음)
+            run.cancelled.set()
+            executor.shutdown(wait=False)
 
-        # 4. 상품 페이지 수집
-        product_urls = self.discover_product_pages()
-        # print(f"🛍️ 상품 페이지 {len(product_urls)}개 발견")
+        # print(f"📋 Sitemap에서 {len(discovered.get('sitemap', []))}개 URL 발견")
+        # print(f"🔗 메인페이지에서 {len(discovered.get('main_page', []))}개 링크 발견")
+        # print(f"🎯 직접 경로에서 {len(discovered.get('direct_paths', []))}개 URL 확인")
+        # print(f"🛍️ 상품 페이지 {len(discovered.get('products', []))}개 발견")
 
         # 모든 URL 통합 및 분류
-        all_urls = set(sitemap_urls + main_page_urls + direct_urls + product_urls)
+        all_urls = set(url for urls in discovered.values() for url in urls)
 
         # 🚨 안전장치: URL이 하나도 없으면 최소한 메인 페이지라도 추가
         if not all_urls:
@@ -448,8 +752,52 @@ class StreamlinedSEOGEOCrawler:
 
         return [url for url, _ in final_urls]
 
+    def _bind_discovery_run(self, fn, run: Optional[_DiscoveryRun] = None):
+        """fn을 현재(또는 지정한) 탐색 실행에 묶어 다른 스레드에서도 같은 상한/취소 토큰을 보게 함"""
+        run = run or getattr(self._discovery_local, "run", None)
+
+        def bound(*args, **kwargs):
+            previous = getattr(self._discovery_local, "run", None)
+            self._discovery_local.run = run
+            try:
+                return fn(*args, **kwargs)
+            finally:
+                self._discovery_local.run = previous
+
+        return bound
+
+    def _discovery_cancelled(self) -> bool:
+        run = getattr(self._discovery_local, "run", None)
+        return run is not None and run.cancelled.is_set()
+
+    def _discovery_request_timeout(self, default: float) -> float:
+        """탐색 시간 상한을 넘지 않도록 요청 타임아웃 계산 (상한 초과 시 0, 탐색 밖에서는 default)"""
+        run = getattr(self._discovery_local, "run", None)
+        if run is None:
+            return default
+        if run.cancelled.is_set():
+            return 0
+        return max(0, min(default, run.deadline - time.monotonic()))
+
+    def _get_homepage_html(self) -> Optional[str]:
+        """메인페이지 HTML을 한 번만 받아 탐색 단계들이 공유"""
+        with self._homepage_lock:
+            if self._homepage_html is None:
+                timeout = self._discovery_request_timeout(10)
+                if not timeout:
+                    return None
+                response = self.http.get(self.base_url, timeout=timeout, retries=0)
+                response.raise_for_status()
+                self._homepage_html = response.text
+            return self._homepage_html
+
     def get_sitemap_urls(self) -> List[str]:
-        """sitemap.xml에서 URL 추출"""
+        """sitemap.xml에서 URL 추출
+
+        각 sitemap을 스트리밍으로 파싱하면서 URL을 바로 필터링/분류하고, sitemap index의
+        하위 sitemap은 동시에 따라간다. main/other를 제외한 우선순위 페이지 타입이
+        모두 max_pages개씩 모이면 중단한다 (main은 홈 하나뿐이고 other는 보조 후보).
+        """
         sitemap_candidates = [
             f"{self.base_url}/sitemap.xml",
             f"{self.base_url}/sitemap_index.xml",
@@ -457,21 +805,69 @@ class StreamlinedSEOGEOCrawler:
             f"{self.base_url}/wp-sitemap.xml",
         ]
 
-        urls: Set[str] = set()
-
-        for sitemap_url in sitemap_candidates:
-            try:
-                response = requests.get(sitemap_url, timeout=10)
-                if response.status_code == 200:
-                    soup = BeautifulSoup(response.text, "xml")
-                    for loc in soup.find_all("loc"):
-                        url = loc.get_text().strip()
-                        if self.is_valid_internal_url(url):
-                            urls.add(url)
-            except Exception:
-                continue
+        # 페이지 타입별 후보 (타입당 최대 max_pages개)
+        collected: Dict[str, List[str]] = {
+            page_type: [] for page_type, _ in self.priority_pages
+        }
+        collected["other"] = []
+        # 조기 종료 판단 대상 (main/other 버킷은 다 차지 않아도 됨)
+        target_types = [t for t in collected if t not in ("main", "other")]
+        seen_urls: Set[str] = set()
+        seen_sitemaps: Set[str] = set(sitemap_candidates)
+        lock = threading.Lock()
+        enough = threading.Event()
+
+        def add_url(url: str):
+            if not self.is_valid_internal_url(url):
+                return
+            page_type = self.classify_url(url)
+            with lock:
+                bucket = collected[page_type]
+                if url in seen_urls or len(bucket) >= self.max_pages:
+                    return
+                seen_urls.add(url)
+                bucket.append(url)
+                if all(len(collected[t]) >= self.max_pages for t in target_types):
+                    enough.set()
+
+        def read_sitemap(sitemap_url: str) -> List[str]:
+            """sitemap 하나를 스트리밍으로 읽고 하위 sitemap 목록 반환"""
+            timeout = self._discovery_request_timeout(10)
+            if not timeout or enough.is_set():
+                return []
+            children = []
+            with self.http.stream("GET", sitemap_url, timeout=timeout) as response:
+                if response.status_code != 200:
+                    return []
+                source = open_sitemap_stream(response.iter_bytes())
+                for kind, loc in iter_sitemap_entries(source):
+                    if enough.is_set() or self._discovery_cancelled():
+                        break
+                    if kind == "sitemap":
+                        children.append(loc)
+                    else:
+                        add_url(loc)
+            return children
+
+        read_sitemap = self._bind_discovery_run(read_sitemap)
+        with ThreadPoolExecutor(max_workers=len(sitemap_candidates)) as executor:
+            pending = {executor.submit(read_sitemap, u) for u in sitemap_candidates}
+            while pending:
+                done, pending = wait(pending, return_when=FIRST_COMPLETED)
+                for future in done:
+                    try:
+                        children = future.result()
+                    except Exception:
+                        continue
+                    # sitemap index의 하위 sitemap을 동시에 읽기
+                    for child in children:
+                        if enough.is_set() or len(seen_sitemaps) >= self.max_sitemap_files:
+                            break
+                        if child.startswith("http") and child not in seen_sitemaps:
+                            seen_sitemaps.add(child)
+                            pending.add(executor.submit(read_sitemap, child))
 
-        return list(urls)
+        return [url for urls in collected.values() for url in urls]
 
     def get_internal_links_from_page(self, url: str) -> List[str]:
         """특정 페이지에서 내부 링크 추출"""
@@ -479,43 +875,49 @@ class StreamlinedSEOGEOCrawler:
             # print(f"⚠️ Selenium 없이 {url} 처리 중...")
             return self._get_links_with_requests(url)
 
-        driver = None
         urls: Set[str] = set()
 
         try:
-            driver = webdriver.Chrome(options=self.chrome_options)
-            driver.get(url)
-            time.sleep(3)
+            with self.browser_pool.browser() as driver:
+                driver.get(url)
+                WebDriverWait(driver, 10).until(
+                    lambda d: d.execute_script("return document.readyState")
+                    == "complete"
+                )
 
-            links = driver.find_elements(By.TAG_NAME, "a")
-            for link in links:
-                try:
-                    href = link.get_attribute("href")
-                    if href and self.is_valid_internal_url(href):
-                        urls.add(href)
-                except Exception:
-                    continue
+                links = driver.find_elements(By.TAG_NAME, "a")
+                for link in links:
+                    try:
+                        href = link.get_attribute("href")
+                        if href and self.is_valid_internal_url(href):
+                            urls.add(href)
+                    except Exception:
+                        continue
 
         except Exception as e:
             print(f"⚠️ {url}에서 링크 추출 실패: {e}")
             # Selenium 실패시 requests로 fallback
             return self._get_links_with_requests(url)
-        finally:
-            if driver:
-                driver.quit()
 
         return list(urls)
 
     def _get_links_with_requests(self, url: str) -> List[str]:
         """requests를 사용한 링크 추출 (Selenium 대체)"""
         try:
-            headers = {
-                "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36"
-            }
-            response = requests.get(url, headers=headers, timeout=10)
-            response.raise_for_status()
+            if url == self.base_url:
+                html = self._get_homepage_html()
+            else:
+                timeout = self._discovery_request_timeout(10)
+                if not timeout:
+                    return []
+                response = self.http.get(url, timeout=timeout, retries=0)
+                response.raise_for_status()
+                html = response.text
 
-            soup = BeautifulSoup(response.text, "html.parser")
+            if html is None:
+                return []
+
+            soup = BeautifulSoup(html, "html.parser")
             links = soup.find_all("a", href=True)
 
             urls = set()
@@ -535,22 +937,50 @@ class StreamlinedSEOGEOCrawler:
             return []
 
     def check_direct_paths(self) -> List[str]:
-        """우선순위 경로들을 직접 확인"""
-        valid_urls = []
+        """우선순위 경로들을 직접 확인 (동시 확인, 페이지 타입별로 유효한 경로 중 우선순위가 가장 높은 것 선택)"""
+        best_rank: Dict[str, int] = {}
+        found_lock = threading.Lock()
+
+        def check_path(page_type: str, rank: int, test_url: str) -> bool:
+            # 같은 타입에서 더 우선인 경로가 이미 확인되었거나 탐색이 중단되었으면 요청 생략
+            if best_rank.get(page_type, rank + 1) < rank or self._discovery_cancelled():
+                return False
+            if not self.check_url_exists(test_url):
+                return False
+            with found_lock:
+                best_rank[page_type] = min(best_rank.get(page_type, rank), rank)
+            # print(f"✅ {page_type.upper()} 페이지 발견: {test_url}")
+            return True
 
+        candidates = []
         for page_type, paths in self.priority_pages:
             if page_type == "product":  # 상품 페이지는 별도 처리
                 continue
 
-            for path in paths:
+            for rank, path in enumerate(paths):
                 if path in ["", "/"]:
                     test_url = self.base_url
                 else:
                     test_url = self.base_url + path
+                candidates.append((page_type, rank, test_url))
 
-                if self.check_url_exists(test_url):
-                    valid_urls.append(test_url)
-                    # print(f"✅ {page_type.upper()} 페이지 발견: {test_url}")
+        check_path = self._bind_discovery_run(check_path)
+        with ThreadPoolExecutor(max_workers=self.discovery_workers) as executor:
+            futures = [executor.submit(check_path, *c) for c in candidates]
+            results = []
+            for future in futures:
+                try:
+                    results.append(future.result())
+                except Exception:
+                    results.append(False)
+
+        # 완료 순서와 무관하게 타입별 최우선 유효 경로 선택 (priority_pages 순서 유지)
+        valid_urls = []
+        chosen_types: Set[str] = set()
+        for (page_type, _, test_url), ok in zip(candidates, results):
+            if ok and page_type not in chosen_types:
+                chosen_types.add(page_type)
+                valid_urls.append(test_url)
 
         return valid_urls
 
@@ -559,15 +989,13 @@ class StreamlinedSEOGEOCrawler:
         print("🛍️ 상품 페이지 수집 시작...")
         product_urls = set()
 
-        # Selenium이 없어도 requests로 상품 링크 찾기
+        # Selenium이 없어도 requests로 상품 링크 찾기 (메인페이지 HTML은 탐색 단계 간 공유)
         try:
-            headers = {
-                "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36"
-            }
-            response = requests.get(self.base_url, headers=headers, timeout=10)
-            response.raise_for_status()
+            html = self._get_homepage_html()
+            if html is None:
+                return []
 
-            soup = BeautifulSoup(response.text, "html.parser")
+            soup = BeautifulSoup(html, "html.parser")
 
             # 상품 링크 선택자들로 검색
             product_selectors = [
@@ -617,26 +1045,36 @@ class StreamlinedSEOGEOCrawler:
             pass
             # print(f"⚠️ 메인페이지 상품 링크 수집 실패: {e}")
 
-        # 유효성 검증을 더 관대하게
-        valid_products = []
-        for url in list(product_urls)[: self.max_product_pages * 2]:
+        # 유효성 검증을 더 관대하게 (후보들을 동시에 확인)
+        def check_product(url: str) -> bool:
+            timeout = self._discovery_request_timeout(5)
+            if not timeout:
+                return False
             # check_url_exists 호출을 더 관대하게 처리
             try:
-                response = requests.head(url, timeout=5, allow_redirects=True)
+                response = self.http.head(url, timeout=timeout, retries=0)
                 if response.status_code in [200, 301, 302]:
-                    valid_products.append(url)
-                    if len(valid_products) >= self.max_product_pages:
-                        break
-            except:
+                    return True
+            except Exception:
                 # HEAD 요청 실패시 GET으로 재시도
                 try:
-                    response = requests.get(url, timeout=5, allow_redirects=True)
+                    response = self.http.get(url, timeout=timeout, retries=0)
                     if response.status_code in [200, 301, 302]:
-                        valid_products.append(url)
-                        if len(valid_products) >= self.max_product_pages:
-                            break
-                except:
-                    continue
+                        return True
+                except Exception:
+                    pass
+            return False
+
+        candidates = list(product_urls)[: self.max_product_pages * 2]
+        valid_products = []
+        if candidates:
+            with ThreadPoolExecutor(
+                max_workers=min(self.discovery_workers, len(candidates))
+            ) as executor:
+                checks = list(executor.map(self._bind_discovery_run(check_product), candidates))
+            valid_products = [url for url, ok in zip(candidates, checks) if ok][
+                : self.max_product_pages
+            ]
 
         # print(f"✅ 최종 유효한 상품 페이지: {len(valid_products)}개")
         return valid_products
@@ -652,27 +1090,7 @@ class StreamlinedSEOGEOCrawler:
 
         # URL 분류
         for url in urls:
-            path = urlparse(url).path.lower()
-            query = urlparse(url).query.lower()
-            full_url_lower = url.lower()
-            categorized_flag = False
-
-            # 상품 페이지 우선 확인
-            if self.is_product_url(url):
-                categorized["product"].append(url)
-                categorized_flag = True
-            else:
-                # 기존 로직으로 분류
-                for page_type, keywords in self.priority_pages:
-                    if page_type == "product":  # 상품은 이미 위에서 처리
-                        continue
-                    if self.matches_page_type(path, query, full_url_lower, keywords):
-                        categorized[page_type].append(url)
-                        categorized_flag = True
-                        break
-
-            if not categorized_flag:
-                categorized["other"].append(url)
+            categorized[self.classify_url(url)].append(url)
 
         # 우선순위별로 최적의 URL 선택
         final_urls = []
@@ -698,6 +1116,23 @@ class StreamlinedSEOGEOCrawler:
 
         return final_urls
 
+    def classify_url(self, url: str) -> str:
+        """URL의 페이지 타입 판별 (우선순위 페이지 타입 중 하나 또는 "other")"""
+        # 상품 페이지 우선 확인
+        if self.is_product_url(url):
+            return "product"
+
+        parsed = urlparse(url)
+        path = parsed.path.lower()
+        query = parsed.query.lower()
+        full_url_lower = url.lower()
+        for page_type, keywords in self.priority_pages:
+            if page_type == "product":  # 상품은 이미 위에서 처리
+                continue
+            if self.matches_page_type(path, query, full_url_lower, keywords):
+                return page_type
+        return "other"
+
     def is_product_url(self, url: str) -> bool:
         """상품 페이지 URL인지 확인"""
         for pattern in self.product_url_patterns:
@@ -744,7 +1179,10 @@ class StreamlinedSEOGEOCrawler:
         """URL이 존재하는지 확인 (더 관대한 검증)"""
         try:
             # HEAD 요청 먼저 시도
-            response = requests.head(url, timeout=8, allow_redirects=True)
+            timeout = self._discovery_request_timeout(8)
+            if not timeout:
+                raise TimeoutError("탐색 시간 상한 초과")
+            response = self.http.head(url, timeout=timeout, retries=0)
             if response.status_code in [
                 200,
                 301,
@@ -757,7 +1195,10 @@ class StreamlinedSEOGEOCrawler:
 
         try:
             # GET 요청으로 재시도
-            response = requests.get(url, timeout=8, allow_redirects=True)
+            timeout = self._discovery_request_timeout(8)
+            if not timeout:
+                raise TimeoutError("탐색 시간 상한 초과")
+            response = self.http.get(url, timeout=timeout, retries=0)
             if response.status_code in [200, 301, 302]:
                 return True
         except Exception:
@@ -820,8 +1261,9 @@ class StreamlinedSEOGEOCrawler:
         self, url: str, page_type: str = None
     ) -> Optional[Dict[str, Any]]:
         """단일 페이지 HTML 수집"""
-        if url in self.crawled_urls:
-            return None
+        with self._state_lock:
+            if url in self.crawled_urls:
+                return None
 
         # page_type이 제공되지 않았으면 감지
         if page_type is None:
@@ -833,27 +1275,25 @@ class StreamlinedSEOGEOCrawler:
         if not SELENIUM_AVAILABLE:
             return self._crawl_with_requests(url, page_type)
 
-        driver = None
         try:
-            driver = webdriver.Chrome(options=self.chrome_options)
-            driver.get(url)
+            with self.browser_pool.browser() as driver:
+                with self.http.host_limiter.slot(url, self.politeness_delay):
+                    driver.get(url)
 
-            # 페이지 로딩 대기
-            WebDriverWait(driver, 10).until(
-                EC.presence_of_element_located((By.TAG_NAME, "body"))
-            )
-            time.sleep(3)
+                # 페이지 로딩 대기 (고정 sleep 대신 문서 로딩 완료 시점까지만 대기)
+                WebDriverWait(driver, 10).until(
+                    EC.presence_of_element_located((By.TAG_NAME, "body"))
+                )
+                WebDriverWait(driver, 10).until(
+                    lambda d: d.execute_script("return document.readyState")
+                    == "complete"
+                )
 
-            # 페이지 HTML 전체 가져오기
-            page_source = driver.page_source
+                # 페이지 HTML 전체 가져오기
+                page_source = driver.page_source
 
             # HTML 파일로 저장
-            timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-            filename = f"{page_type}_{timestamp}.html"
-            filepath = f"outputs/{filename}"
-
-            with open(filename, "w", encoding="utf-8") as f:
-                f.write(page_source)
+            filepath = self._save_page_html(page_type, page_source)
 
             # 메타데이터 생성
             metadata = {
@@ -866,15 +1306,13 @@ class StreamlinedSEOGEOCrawler:
             }
 
             print(f"✅ 크롤링 데이터 저장 완료")
-            self.crawled_urls.add(url)
+            with self._state_lock:
+                self.crawled_urls.add(url)
             return metadata
 
         except Exception as e:
             print(f"❌ [{page_type.upper()}] Selenium 크롤링 실패 {url}: {e}")
             return self._crawl_with_requests(url, page_type)
-        finally:
-            if driver:
-                driver.quit()
 
     def _crawl_with_requests(
         self, url: str, page_type: str
@@ -884,18 +1322,15 @@ class StreamlinedSEOGEOCrawler:
             headers = {
                 "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36"
             }
-            response = requests.get(url, headers=headers, timeout=10)
+            response = self.http.get(
+                url, headers=headers, timeout=10, min_interval=self.politeness_delay
+            )
             response.raise_for_status()
 
             page_source = response.text
 
             # HTML 파일로 저장
-            timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-            filename = f"{page_type}_{timestamp}.html"
-            filepath = f"outputs/{filename}"
-
-            with open(filename, "w", encoding="utf-8") as f:
-                f.write(page_source)
+            filepath = self._save_page_html(page_type, page_source)
 
             # 메타데이터 생성
             metadata = {
@@ -908,13 +1343,30 @@ class StreamlinedSEOGEOCrawler:
             }
 
             # print(f"✅ [{page_type.upper()}] requests로 저장 완료: {filename}")
-            self.crawled_urls.add(url)
+            with self._state_lock:
+                self.crawled_urls.add(url)
             return metadata
 
         except Exception as e:
             print(f"❌ [{page_type.upper()}] requests 크롤링도 실패 {url}: {e}")
             return None
 
+    def _save_page_html(self, page_type: str, page_source: str) -> str:
+        """크롤링한 HTML을 파일로 저장하고 메타데이터용 경로 반환"""
+        # 동시 크롤링 시 같은 초에 같은 타입의 페이지가 저장될 수 있으므로 파일명 중복 방지
+        with self._state_lock:
+            timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+            filename = f"{page_type}_{timestamp}.html"
+            suffix = 1
+            while os.path.exists(filename):
+                filename = f"{page_type}_{timestamp}_{suffix}.html"
+                suffix += 1
+
+            with open(filename, "w", encoding="utf-8") as f:
+                f.write(page_source)
+
+        return f"outputs/{filename}"
+
     def detect_page_type(self, url: str) -> str:
         """페이지 타입 감지"""
         if self.is_product_url(url):
@@ -937,48 +1389,190 @@ class StreamlinedSEOGEOCrawler:
         print(f"🚀 {self.base_url}  크롤링 시작")  # 다중 페이지
         # print(f"📊 최대 {self.max_pages}개 페이지 (상품 {self.max_product_pages}개 포함)")
 
-        # URL 발견 및 크롤링
-        urls_to_crawl = self.discover_priority_urls()
+        try:
+            # URL 발견 및 크롤링
+            urls_to_crawl = self.discover_priority_urls()
 
-        if not urls_to_crawl:
-            print("❌ 크롤링할 URL을 찾을 수 없습니다.")
-            return []
+            if not urls_to_crawl:
+                print("❌ 크롤링할 URL을 찾을 수 없습니다.")
+                return []
+
+            return self.crawl_urls(urls_to_crawl)
+        finally:
+            self.close()
+
+    def close(self):
+        """크롤러가 직접 생성한 브라우저 풀과 HTTP 클라이언트 종료"""
+        if self.browser_pool and self._owns_browser_pool:
+            self.browser_pool.close()
+        self.http.close()
 
+    def crawl_urls(self, urls_to_crawl: List[str]) -> List[Dict[str, Any]]:
+        """주어진 URL 목록을 동시에 크롤링"""
         # print(f"\n📋 크롤링 시작 - {len(urls_to_crawl)}개 페이지")
-        print(f"\n📋 크롤링 시작")
+        print(f"\n📋 크롤링 시작 (동시 {self.max_workers}개)")
 
-        # 각 URL 크롤링
-        for i, url in enumerate(urls_to_crawl, 1):
-            # print(f"\n{'='*50}")
-            # print(f"진행률: {i}/{len(urls_to_crawl)}")
-            result = self.crawl_single_page(url)
-            if result:
-                self.results.append(result)
+        crawl_start = time.monotonic()
+        results_by_index: Dict[int, Dict[str, Any]] = {}
+
+        # 각 URL 동시 크롤링 (서버 부하는 호스트별 politeness budget으로 제어)
+        with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
+            futures = {
+                executor.submit(self._timed_crawl_single_page, url): i
+                for i, url in enumerate(urls_to_crawl)
+            }
+            for future in as_completed(futures):
+                try:
+                    result = future.result()
+                except Exception as e:
+                    print(f"❌ 크롤링 작업 실패: {e}")
+                    continue
+                if result:
+                    results_by_index[futures[future]] = result
+
+        # 발견 순서(우선순위)대로 결과 정렬
+        self.results.extend(results_by_index[i] for i in sorted(results_by_index))
 
-            # 서버 부하 방지
-            if i < len(urls_to_crawl):
-                time.sleep(2)
+        total_time = time.monotonic() - crawl_start
+        self.print_crawl_timings(total_time)
 
         # print(f"\n🎉 다중 페이지 크롤링 완료! 총 {len(self.results)}개 페이지 수집")
         print(f"\n🎉 페이지 크롤링 완료!")
         return self.results
 
+    def _timed_crawl_single_page(self, url: str) -> Optional[Dict[str, Any]]:
+        """단일 페이지를 크롤링하고 소요 시간 기록 (요청 간격은 호스트 리미터가 보장)"""
+        start = time.monotonic()
+        result = self.crawl_single_page(url)
+        elapsed = round(time.monotonic() - start, 3)
+
+        timing = {
+            "url": url,
+            "page_type": result["page_type"] if result else self.detect_page_type(url),
+            "fetch_time": elapsed,
+            "success": bool(result),
+        }
+        with self._state_lock:
+            self.page_timings.append(timing)
+
+        if result:
+            result["fetch_time"] = elapsed
+        return result
+
+    def print_crawl_timings(self, total_time: float):
+        """페이지별 크롤링 소요 시간 출력"""
+        if not self.page_timings:
+            return
+
+        fetch_sum = sum(t["fetch_time"] for t in self.page_timings)
+        print(f"⏱️ 페이지별 크롤링 시간:")
+        for timing in self.page_timings:
+            status = "✅" if timing["success"] else "❌"
+            print(
+                f"   {status} [{timing['page_type'].upper()}] {timing['fetch_time']:.2f}초 - {timing['url']}"
+            )
+        print(f"   • 전체 소요: {total_time:.2f}초 (페이지 합계 {fetch_sum:.2f}초)")
+
+
+# ===== 파싱 결과 공유 캐시 =====
+@dataclass
+class ParsedPage:
+    """크롤링된 페이지의 1회 파싱 결과 (분석 노드들이 공유)"""
+
+    url: str
+    content_hash: str
+    soup: BeautifulSoup
+    text: str
+    word_count: int
+    tag_counts: Dict[str, int]
+    links: List[str]
+    geo_features: Optional[Dict[str, Any]] = None
+
+
+PARSED_PAGE_CACHE_SIZE = 64
+_parsed_page_cache: "OrderedDict[tuple, ParsedPage]" = OrderedDict()
+_parsed_page_lock = threading.Lock()
+
+
+def compute_content_hash(html_content: str) -> str:
+    """HTML 콘텐츠 해시 (파싱 캐시 키)"""
+    return hashlib.sha1(html_content.encode("utf-8", "ignore")).hexdigest()
+
+
+def parse_page(html_content: str, url: str = "") -> ParsedPage:
+    """HTML을 한 번 파싱하여 텍스트, 태그 수, 링크 목록까지 추출"""
+    soup = BeautifulSoup(html_content, "html.parser")
+    text = soup.get_text()
+    return ParsedPage(
+        url=url,
+        content_hash=compute_content_hash(html_content),
+        soup=soup,
+        text=text,
+        word_count=len(text.split()),
+        tag_counts=dict(Counter(tag.name for tag in soup.find_all(True))),
+        links=[a.get("href") for a in soup.find_all("a", href=True)],
+    )
+
+
+def get_parsed_page(html_content: str, url: str = "") -> ParsedPage:
+    """(URL, 콘텐츠 해시) 기준으로 캐시된 파싱 결과 반환, 없으면 파싱 후 저장"""
+    key = (url, compute_content_hash(html_content))
+    with _parsed_page_lock:
+        page = _parsed_page_cache.get(key)
+        if page is not None:
+            _parsed_page_cache.move_to_end(key)
+            return page
+
+    page = parse_page(html_content, url)
+    with _parsed_page_lock:
+        page = _parsed_page_cache.setdefault(key, page)
+        _parsed_page_cache.move_to_end(key)
+        while len(_parsed_page_cache) > PARSED_PAGE_CACHE_SIZE:
+            _parsed_page_cache.popitem(last=False)
+    return page
+
+
+def take_parsed_page(html_content: str, url: str = "") -> ParsedPage:
+    """파싱 결과를 캐시에서 꺼내 반환 (soup을 수정하는 마지막 소비자용)"""
+    page = get_parsed_page(html_content, url)
+    with _parsed_page_lock:
+        _parsed_page_cache.pop((url, page.content_hash), None)
+    return page
+
+
+def build_parsed_pages(crawl_results: List[Dict]) -> int:
+    """크롤링 직후 모든 페이지를 한 번씩 파싱하여 캐시에 적재"""
+    for result in crawl_results:
+        html_content = result.get("html_content", "")
+        if not html_content:
+            continue
+        page = get_parsed_page(html_content, result.get("url", ""))
+        result["content_hash"] = page.content_hash
+    return len(crawl_results)
+
+
+def clear_parsed_page_cache():
+    """파싱 결과 캐시 비우기"""
+    with _parsed_page_lock:
+        _parsed_page_cache.clear()
+
 
 # ===== @tool 함수들 =====
 @tool
-def crawl_full_website(base_url: str, max_pages: int = 9) -> dict:
+def crawl_full_website(base_url: str, max_pages: int = 9, max_workers: int = 3) -> dict:
     """
     sitemap.xml 기반으로 전체 웹사이트를 크롤링합니다.
 
     Args:
         base_url: 크롤링할 기본 URL
         max_pages: 최대 크롤링할 페이지 수
+        max_workers: 동시에 크롤링할 최대 페이지 수
 
     Returns:
         크롤링 결과 딕셔너리
     """
     try:
-        crawler = StreamlinedSEOGEOCrawler(base_url, max_pages)
+        crawler = StreamlinedSEOGEOCrawler(base_url, max_pages, max_workers=max_workers)
         crawl_results = crawler.crawl_site()
 
         if not crawl_results:
@@ -999,6 +1593,7 @@ def crawl_full_website(base_url: str, max_pages: int = 9) -> dict:
             "pages_crawled": len(crawl_results),
             "crawl_results": crawl_results,
             "page_types": page_types,
+            "page_timings": crawler.page_timings,
             "success": True,
             "crawl_timestamp": datetime.now().isoformat(),
         }
@@ -1028,32 +1623,29 @@ def analyze_page_from_html(
         페이지 분석 결과
     """
     try:
-        soup = BeautifulSoup(html_content, "html.parser")
+        page = get_parsed_page(html_content, url)
+        soup = page.soup
+        title_tag = soup.find("title")
+        h1_tags = soup.find_all("h1")
 
         # SEO 요소 분석
         analysis = {
             "url": url,
             "page_type": page_type,
             "title": {
-                "content": (
-                    soup.find("title").get_text().strip() if soup.find("title") else ""
-                ),
-                "length": (
-                    len(soup.find("title").get_text().strip())
-                    if soup.find("title")
-                    else 0
-                ),
+                "content": title_tag.get_text().strip() if title_tag else "",
+                "length": len(title_tag.get_text().strip()) if title_tag else 0,
                 "good": False,
             },
             "meta_description": {"content": "", "length": 0, "good": False},
             "headings": {
-                "h1_count": len(soup.find_all("h1")),
-                "h1_content": [h1.get_text().strip() for h1 in soup.find_all("h1")],
-                "h2_count": len(soup.find_all("h2")),
+                "h1_count": len(h1_tags),
+                "h1_content": [h1.get_text().strip() for h1 in h1_tags],
+                "h2_count": page.tag_counts.get("h2", 0),
                 "good": False,
             },
             "images": {
-                "total": len(soup.find_all("img")),
+                "total": page.tag_counts.get("img", 0),
                 "without_alt": 0,
                 "good": False,
             },
@@ -1065,8 +1657,8 @@ def analyze_page_from_html(
                 "good": False,
             },
             "content_quality": {
-                "word_count": len(soup.get_text().split()),
-                "paragraph_count": len(soup.find_all("p")),
+                "word_count": page.word_count,
+                "paragraph_count": page.tag_counts.get("p", 0),
                 "good": False,
             },
         }
@@ -1097,12 +1689,10 @@ def analyze_page_from_html(
 
         # 링크 분석
         domain = urlparse(url).netloc
-        links = soup.find_all("a", href=True)
         internal_links = 0
         external_links = 0
 
-        for link in links:
-            href = link.get("href")
+        for href in page.links:
             if href.startswith("http"):
                 if domain in href:
                     internal_links += 1
@@ -1175,17 +1765,17 @@ def calculate_site_geo_scores(crawl_results: list) -> dict:
             if not html_content:
                 continue
 
-            soup = BeautifulSoup(html_content, "html.parser")
-            page_text = soup.get_text()
+            # GEO 특징은 페이지당 한 번만 추출하여 파싱 결과에 보관
+            page = get_parsed_page(html_content, url)
+            if page.geo_features is None:
+                page.geo_features = extract_geo_features(page.soup, page.text)
 
             # GEO 6가지 기준 평가
             geo_scores = {
-                "clarity": evaluate_clarity(soup, page_text)["score"],
-                "structure": evaluate_structure(soup, page_text)["score"],
-                "context": evaluate_context(soup, page_text)["score"],
-                "alignment": evaluate_alignment(soup, page_text)["score"],
-                "timeliness": evaluate_timeliness(soup, page_text)["score"],
-                "originality": evaluate_originality(soup, page_text)["score"],
+                criterion: result["score"]
+                for criterion, result in evaluate_geo_criteria(
+                    page.geo_features
+                ).items()
             }
 
             page_total = sum(geo_scores.values()) / len(geo_scores)
@@ -1296,26 +1886,169 @@ def calculate_site_average_scores(page_analyses: list) -> dict:
 
 
 # ===== GEO 평가 함수들 =====
-def evaluate_clarity(soup: BeautifulSoup, page_text: str) -> dict:
+# GEO 평가 키워드
+GEO_CLEAR_INDICATORS = ["입니다", "합니다", "제공합니다", "전문", "최고"]
+GEO_RECENT_KEYWORDS = ["최근", "최신", "새로운"]
+GEO_CURRENT_KEYWORDS = ["현재", "지금", "오늘", "이번", "트렌드"]
+GEO_INSIGHT_KEYWORDS = ["경험상", "분석하면", "발견했습니다", "연구"]
+GEO_DATA_INDICATORS = ["조사", "통계", "데이터", "자체"]
+
+GEO_NUMERIC_PATTERN = re.compile(r"\d+[%년도원달러$€₩]|\d+\.\d+")
+GEO_CONTACT_PATTERNS = [
+    re.compile(r"(\d{2,3}-\d{3,4}-\d{4})"),
+    re.compile(r"([a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,})"),
+]
+GEO_TOPIC_PATTERN = re.compile(r"[가-힣]{2,}")
+
+GEO_HEADING_TAGS = {"h1", "h2", "h3", "h4", "h5", "h6"}
+GEO_LIST_TAGS = {"ul", "ol", "dl"}
+GEO_MULTIMEDIA_TAGS = {"img", "video", "iframe"}
+
+
+def build_keyword_scanner(keywords: List[str]) -> tuple:
+    """키워드 목록을 한 번의 정규식 스캔으로 셀 수 있는 패턴과 보정표로 컴파일
+
+    긴 키워드를 먼저 매칭하고, 다른 키워드에 포함된 키워드(예: "제공합니다" 안의
+    "합니다")는 보정표로 개수를 더해 키워드별 str.count() 결과와 동일하게 맞춘다.
+    """
+    keywords = list(dict.fromkeys(keywords))
+    for a in keywords:
+        for b in keywords:
+            # 부분 겹침(접미사=접두사)이 있으면 단일 스캔 결과가 str.count와 달라짐
+            for k in range(1, min(len(a), len(b))):
+                if a[-k:] == b[:k] and not (a in b or b in a):
+                    raise ValueError(f"키워드가 부분적으로 겹칩니다: {a}, {b}")
+
+    containment = {
+        outer: {inner: outer.count(inner) for inner in keywords if inner != outer and inner in outer}
+        for outer in keywords
+    }
+    pattern = re.compile(
+        r"(?P<year>20\d{2}년)|(?P<keyword>"
+        + "|".join(re.escape(k) for k in sorted(keywords, key=len, reverse=True))
+        + ")"
+    )
+    return pattern, {k: v for k, v in containment.items() if v}
+
+
+GEO_KEYWORD_PATTERN, GEO_KEYWORD_CONTAINMENT = build_keyword_scanner(
+    GEO_CLEAR_INDICATORS
+    + GEO_RECENT_KEYWORDS
+    + GEO_CURRENT_KEYWORDS
+    + GEO_INSIGHT_KEYWORDS
+    + GEO_DATA_INDICATORS
+)
+
+
+def extract_geo_features(soup: BeautifulSoup, page_text: str) -> dict:
+    """GEO 6가지 기준에 필요한 모든 카운터를 한 번의 트리 순회 + 텍스트 스캔으로 추출"""
+    features = {
+        "headings": 0,
+        "lists": 0,
+        "schema": 0,
+        "multimedia": 0,
+        "images": 0,
+        "quality_alt": 0,
+        "topics": 0,
+        "title_h1_overlap": False,
+    }
+    unique_topics = set()
+    title = None
+    h1 = None
+
+    # 1. DOM 트리 1회 순회
+    for tag in soup.find_all(True):
+        name = tag.name
+        if name in GEO_HEADING_TAGS:
+            features["headings"] += 1
+            if name == "h1" and h1 is None:
+                h1 = tag
+        elif name in GEO_LIST_TAGS:
+            features["lists"] += 1
+        elif name == "p":
+            unique_topics.update(GEO_TOPIC_PATTERN.findall(tag.get_text()))
+        elif name == "script":
+            if tag.get("type") == "application/ld+json":
+                features["schema"] += 1
+        elif name == "title" and title is None:
+            title = tag
+
+        if name in GEO_MULTIMEDIA_TAGS:
+            features["multimedia"] += 1
+            if name == "img":
+                features["images"] += 1
+                alt = tag.get("alt")
+                if alt and len(alt) >= 5:
+                    features["quality_alt"] += 1
+
+    features["topics"] = len(unique_topics)
+    if title and h1:
+        title_words = set(title.get_text().lower().split())
+        h1_words = set(h1.get_text().lower().split())
+        features["title_h1_overlap"] = bool(title_words.intersection(h1_words))
+
+    # 2. 텍스트 스캔 (키워드 + 연도는 단일 정규식으로 한 번에 집계)
+    keyword_counts: Dict[str, int] = {}
+    year_count = 0
+    for match in GEO_KEYWORD_PATTERN.finditer(page_text):
+        keyword = match.group("keyword")
+        if keyword is None:
+            year_count += 1
+            continue
+        keyword_counts[keyword] = keyword_counts.get(keyword, 0) + 1
+        for inner, times in GEO_KEYWORD_CONTAINMENT.get(keyword, {}).items():
+            keyword_counts[inner] = keyword_counts.get(inner, 0) + times
+
+    def count_keywords(keywords: List[str]) -> int:
+        return sum(keyword_counts.get(k, 0) for k in keywords)
+
+    features.update(
+        {
+            "word_count": len(page_text.split()),
+            "numeric_facts": sum(1 for _ in GEO_NUMERIC_PATTERN.finditer(page_text)),
+            "contact_info": sum(
+                sum(1 for _ in pattern.finditer(page_text))
+                for pattern in GEO_CONTACT_PATTERNS
+            ),
+            "clear_statements": count_keywords(GEO_CLEAR_INDICATORS),
+            "dates": year_count + count_keywords(GEO_RECENT_KEYWORDS),
+            "recent_keywords": count_keywords(GEO_CURRENT_KEYWORDS),
+            "insights": count_keywords(GEO_INSIGHT_KEYWORDS),
+            "data": count_keywords(GEO_DATA_INDICATORS),
+        }
+    )
+    return features
+
+
+def evaluate_geo_criteria(features: dict) -> dict:
+    """추출된 특징으로 GEO 6가지 기준 평가"""
+    return {
+        "clarity": evaluate_clarity(features),
+        "structure": evaluate_structure(features),
+        "context": evaluate_context(features),
+        "alignment": evaluate_alignment(features),
+        "timeliness": evaluate_timeliness(features),
+        "originality": evaluate_originality(features),
+    }
+
+
+def evaluate_clarity(features: dict) -> dict:
     """명확성 평가"""
     score = 0
     details = {"specific_facts": 0, "clear_statements": 0, "contact_info": 0}
 
     # 구체적인 사실/수치 확인
-    numeric_patterns = re.findall(r"\d+[%년도원달러$€₩]|\d+\.\d+", page_text)
-    details["specific_facts"] = len(numeric_patterns)
-    if len(numeric_patterns) >= 10:
+    numeric_count = features["numeric_facts"]
+    details["specific_facts"] = numeric_count
+    if numeric_count >= 10:
         score += 30
-    elif len(numeric_patterns) >= 5:
+    elif numeric_count >= 5:
         score += 20
-    elif len(numeric_patterns) >= 1:
+    elif numeric_count >= 1:
         score += 10
 
     # 명확한 진술문 확인
-    clear_indicators = ["입니다", "합니다", "제공합니다", "전문", "최고"]
-    clear_count = sum(
-        page_text.lower().count(indicator) for indicator in clear_indicators
-    )
+    clear_count = features["clear_statements"]
     details["clear_statements"] = clear_count
     if clear_count >= 20:
         score += 25
@@ -1325,13 +2058,7 @@ def evaluate_clarity(soup: BeautifulSoup, page_text: str) -> dict:
         score += 10
 
     # 연락처 정보
-    contact_patterns = [
-        r"(\d{2,3}-\d{3,4}-\d{4})",
-        r"([a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,})",
-    ]
-    contact_count = sum(
-        len(re.findall(pattern, page_text)) for pattern in contact_patterns
-    )
+    contact_count = features["contact_info"]
     details["contact_info"] = contact_count
     if contact_count >= 2:
         score += 45
@@ -1341,13 +2068,13 @@ def evaluate_clarity(soup: BeautifulSoup, page_text: str) -> dict:
     return {"score": min(score, 100), "details": details}
 
 
-def evaluate_structure(soup: BeautifulSoup, page_text: str) -> dict:
+def evaluate_structure(features: dict) -> dict:
     """구조성 평가"""
     score = 0
     details = {"headings": 0, "lists": 0, "schema": 0}
 
     # 헤딩 구조
-    h_tags = len(soup.find_all(["h1", "h2", "h3", "h4", "h5", "h6"]))
+    h_tags = features["headings"]
     details["headings"] = h_tags
     if h_tags >= 5:
         score += 30
@@ -1357,7 +2084,7 @@ def evaluate_structure(soup: BeautifulSoup, page_text: str) -> dict:
         score += 10
 
     # 리스트 구조
-    lists = len(soup.find_all(["ul", "ol", "dl"]))
+    lists = features["lists"]
     details["lists"] = lists
     if lists >= 3:
         score += 25
@@ -1365,7 +2092,7 @@ def evaluate_structure(soup: BeautifulSoup, page_text: str) -> dict:
         score += 15
 
     # Schema 마크업
-    schema_count = len(soup.find_all("script", {"type": "application/ld+json"}))
+    schema_count = features["schema"]
     details["schema"] = schema_count
     if schema_count >= 1:
         score += 45
@@ -1373,12 +2100,12 @@ def evaluate_structure(soup: BeautifulSoup, page_text: str) -> dict:
     return {"score": min(score, 100), "details": details}
 
 
-def evaluate_context(soup: BeautifulSoup, page_text: str) -> dict:
+def evaluate_context(features: dict) -> dict:
     """맥락성 평가"""
     score = 0
     details = {"word_count": 0, "topics": 0}
 
-    word_count = len(page_text.split())
+    word_count = features["word_count"]
     details["word_count"] = word_count
     if word_count >= 1000:
         score += 40
@@ -1388,22 +2115,17 @@ def evaluate_context(soup: BeautifulSoup, page_text: str) -> dict:
         score += 15
 
     # 주제 다양성
-    paragraphs = soup.find_all("p")
-    unique_topics = set()
-    for p in paragraphs:
-        words = re.findall(r"[가-힣]{2,}", p.get_text())
-        unique_topics.update(words)
-
-    details["topics"] = len(unique_topics)
-    if len(unique_topics) >= 50:
+    topics = features["topics"]
+    details["topics"] = topics
+    if topics >= 50:
         score += 35
-    elif len(unique_topics) >= 25:
+    elif topics >= 25:
         score += 20
-    elif len(unique_topics) >= 10:
+    elif topics >= 10:
         score += 10
 
     # 멀티미디어
-    multimedia = len(soup.find_all(["img", "video", "iframe"]))
+    multimedia = features["multimedia"]
     if multimedia >= 5:
         score += 25
     elif multimedia >= 1:
@@ -1412,45 +2134,35 @@ def evaluate_context(soup: BeautifulSoup, page_text: str) -> dict:
     return {"score": min(score, 100), "details": details}
 
 
-def evaluate_alignment(soup: BeautifulSoup, page_text: str) -> dict:
+def evaluate_alignment(features: dict) -> dict:
     """정합성 평가"""
     score = 0
     details = {"alt_quality": 0, "consistency": 0}
 
     # 이미지 ALT 품질
-    images = soup.find_all("img")
-    quality_alt = sum(
-        1 for img in images if img.get("alt") and len(img.get("alt", "")) >= 5
-    )
+    images = features["images"]
+    quality_alt = features["quality_alt"]
     details["alt_quality"] = quality_alt
-    if images and quality_alt / len(images) >= 0.8:
+    if images and quality_alt / images >= 0.8:
         score += 50
-    elif images and quality_alt / len(images) >= 0.5:
+    elif images and quality_alt / images >= 0.5:
         score += 30
 
     # 용어 일관성
-    title = soup.find("title")
-    h1 = soup.find("h1")
-    if title and h1:
-        title_words = set(title.get_text().lower().split())
-        h1_words = set(h1.get_text().lower().split())
-        if title_words.intersection(h1_words):
-            score += 50
-            details["consistency"] = 1
+    if features["title_h1_overlap"]:
+        score += 50
+        details["consistency"] = 1
 
     return {"score": min(score, 100), "details": details}
 
 
-def evaluate_timeliness(soup: BeautifulSoup, page_text: str) -> dict:
+def evaluate_timeliness(features: dict) -> dict:
     """시의성 평가"""
     score = 0
     details = {"dates": 0, "recent_keywords": 0}
 
     # 날짜 및 최신성 키워드
-    date_patterns = [r"20\d{2}년", r"최근", r"최신", r"새로운"]
-    date_count = sum(
-        len(re.findall(pattern, page_text, re.I)) for pattern in date_patterns
-    )
+    date_count = features["dates"]
     details["dates"] = date_count
     if date_count >= 10:
         score += 60
@@ -1460,10 +2172,7 @@ def evaluate_timeliness(soup: BeautifulSoup, page_text: str) -> dict:
         score += 20
 
     # 시의성 키워드
-    current_keywords = ["현재", "지금", "오늘", "이번", "트렌드"]
-    current_count = sum(
-        page_text.lower().count(keyword) for keyword in current_keywords
-    )
+    current_count = features["recent_keywords"]
     details["recent_keywords"] = current_count
     if current_count >= 5:
         score += 40
@@ -1473,16 +2182,13 @@ def evaluate_timeliness(soup: BeautifulSoup, page_text: str) -> dict:
     return {"score": min(score, 100), "details": details}
 
 
-def evaluate_originality(soup: BeautifulSoup, page_text: str) -> dict:
+def evaluate_originality(features: dict) -> dict:
     """독창성 평가"""
     score = 0
     details = {"insights": 0, "data": 0}
 
     # 독창적 통찰
-    insight_keywords = ["경험상", "분석하면", "발견했습니다", "연구"]
-    insight_count = sum(
-        page_text.lower().count(keyword) for keyword in insight_keywords
-    )
+    insight_count = features["insights"]
     details["insights"] = insight_count
     if insight_count >= 5:
         score += 50
@@ -1492,8 +2198,7 @@ def evaluate_originality(soup: BeautifulSoup, page_text: str) -> dict:
         score += 15
 
     # 고유 데이터/통계
-    data_indicators = ["조사", "통계", "데이터", "자체"]
-    data_count = sum(page_text.lower().count(keyword) for keyword in data_indicators)
+    data_count = features["data"]
     details["data"] = data_count
     if data_count >= 5:
         score += 50
@@ -1844,10 +2549,9 @@ def generate_meta_tags_with_llm(
         생성된 메타태그들
     """
     try:
-        # HTML에서 텍스트 추출
+        # HTML에서 텍스트 추출 (크롤링 직후 파싱된 결과 재사용)
         if "<html" in html_content or "<div" in html_content:
-            soup = BeautifulSoup(html_content, "html.parser")
-            content_text = soup.get_text()
+            content_text = get_parsed_page(html_content, url).text
         else:
             content_text = html_content
 
@@ -1859,8 +2563,6 @@ def generate_meta_tags_with_llm(
             # API 키가 없으면 기본 메타태그 생성
             return generate_basic_meta_tags(seo_analysis, url, page_type, business_type)
 
-        llm = ChatOpenAI(model="gpt-4o-mini", api_key=api_key)
-
         meta_generation_prompt = f"""
         다음 정보를 바탕으로 SEO 최적화된 메타태그들을 생성해주세요.
         
@@ -1900,8 +2602,13 @@ def generate_meta_tags_with_llm(
         ```
         """
 
-        response = llm.invoke([HumanMessage(content=meta_generation_prompt)])
-        response_text = response.content.strip()
+        # 동일 프롬프트 재실행 시 캐시된 응답 재사용
+        response = get_llm_client(api_key).chat.completions.create(
+            model="gpt-4o-mini",
+            messages=[{"role": "user", "content": meta_generation_prompt}],
+            temperature=0.7,
+        )
+        response_text = response.choices[0].message.content.strip()
 
         # JSON 블록 추출
         if "```json" in response_text:
@@ -2010,7 +2717,11 @@ def generate_basic_meta_tags(
 
 @tool
 def generate_intelligent_faq_with_llm(
-    website_content: str, business_type: str, api_key: str, keywords: list
+    website_content: str,
+    business_type: str,
+    api_key: str,
+    keywords: list,
+    url: str = "",
 ) -> dict:
     """
     LLM을 사용하여 지능형 FAQ 생성
@@ -2020,6 +2731,7 @@ def generate_intelligent_faq_with_llm(
         business_type: 비즈니스 타입
         api_key: OpenAI API 키
         keywords: 키워드 리스트
+        url: 페이지 URL (파싱 캐시 조회용)
 
     Returns:
         생성된 FAQ 데이터
@@ -2030,8 +2742,7 @@ def generate_intelligent_faq_with_llm(
             return generate_basic_faq(business_type)
 
         if "<html" in website_content or "<div" in website_content:
-            soup = BeautifulSoup(website_content, "html.parser")
-            content_text = soup.get_text()
+            content_text = get_parsed_page(website_content, url).text
         else:
             content_text = website_content
 
@@ -2039,8 +2750,6 @@ def generate_intelligent_faq_with_llm(
         if len(content_text) > 3000:
             content_text = content_text[:3000] + "..."
 
-        llm = ChatOpenAI(model="gpt-4o-mini", api_key=api_key)
-
         faq_prompt = f"""
         다음 웹사이트 콘텐츠를 바탕으로 {business_type}에 적합한 FAQ를 생성해주세요.
         
@@ -2063,8 +2772,12 @@ def generate_intelligent_faq_with_llm(
         JSON 형식으로만 응답해주세요.
         """
 
-        response = llm.invoke([HumanMessage(content=faq_prompt)])
-        response_text = response.content.strip()
+        response = get_llm_client(api_key).chat.completions.create(
+            model="gpt-4o-mini",
+            messages=[{"role": "user", "content": faq_prompt}],
+            temperature=0.7,
+        )
+        response_text = response.choices[0].message.content.strip()
 
         # JSON 파싱
         if "```json" in response_text:
@@ -2116,6 +2829,174 @@ def generate_basic_faq(business_type: str) -> dict:
     }
 
 
+# ===== LLM 동시 호출 (fan-out) =====
+LLM_MAX_CONCURRENCY = int(os.getenv("LLM_MAX_CONCURRENCY", "6"))
+LLM_TOKENS_PER_MINUTE = int(os.getenv("LLM_TOKENS_PER_MINUTE", "200000"))
+
+
+def estimate_llm_tokens(
+    html_content: str, url: str = "", prompt_overhead: int = 1000, completion_tokens: int = 800
+) -> int:
+    """페이지 기반 프롬프트의 토큰 수 대략 추정
+
+    프롬프트에는 페이지 텍스트가 최대 3000자까지 들어가므로 그 길이에 템플릿 분량을 더하고,
+    한글 위주 텍스트 기준 약 2자당 1토큰 + 응답 예약분으로 계산
+    """
+    content_chars = 0
+    if html_content:
+        content_chars = min(len(get_parsed_page(html_content, url).text), 3000)
+    return (content_chars + prompt_overhead) // 2 + completion_tokens
+
+
+class TokenRateLimiter:
+    """분당 토큰(TPM) 예산을 넘지 않도록 요청 시작을 늦추는 비동기 rate limiter"""
+
+    def __init__(self, tokens_per_minute: int, window: float = 60.0):
+        self.tokens_per_minute = max(1, tokens_per_minute)
+        self.window = window
+        self._events: deque = deque()
+        self._used = 0
+        self._lock = asyncio.Lock()
+
+    async def acquire(self, tokens: int):
+        while True:
+            async with self._lock:
+                now = time.monotonic()
+                while self._events and now - self._events[0][0] >= self.window:
+                    self._used -= self._events.popleft()[1]
+
+                # 예산 초과 요청도 창이 비어 있으면 단독으로 허용
+                if not self._events or self._used + tokens <= self.tokens_per_minute:
+                    self._events.append((now, tokens))
+                    self._used += tokens
+                    return
+
+                wait = self.window - (now - self._events[0][0])
+            await asyncio.sleep(max(wait, 0.05))
+
+
+@dataclass
+class LLMJob:
+    """fan-out으로 실행할 LLM 작업 하나"""
+
+    key: tuple
+    func: Callable[[], dict]
+    fallback: Callable[[], dict]
+    estimated_tokens: int
+
+
+async def run_llm_jobs(
+    jobs: List[LLMJob],
+    max_concurrency: int = LLM_MAX_CONCURRENCY,
+    tokens_per_minute: int = LLM_TOKENS_PER_MINUTE,
+) -> Dict[tuple, dict]:
+    """LLM 작업들을 동시성 제한 + TPM 제한 하에 동시에 실행하고 key별 결과 반환"""
+    if not jobs:
+        return {}
+
+    semaphore = asyncio.Semaphore(max(1, max_concurrency))
+    limiter = TokenRateLimiter(tokens_per_minute)
+    loop = asyncio.get_running_loop()
+    timings: Dict[tuple, float] = {}
+
+    with ThreadPoolExecutor(max_workers=max(1, max_concurrency)) as executor:
+
+        async def run(job: LLMJob) -> dict:
+            async with semaphore:
+                await limiter.acquire(job.estimated_tokens)
+                start = time.monotonic()
+                try:
+                    return await loop.run_in_executor(executor, job.func)
+                except Exception as e:
+                    print(f"⚠️ LLM 작업 실패 {job.key}: {e}")
+                    return job.fallback()
+                finally:
+                    timings[job.key] = time.monotonic() - start
+
+        start = time.monotonic()
+        results = await asyncio.gather(*(run(job) for job in jobs))
+        elapsed = time.monotonic() - start
+
+    slowest = max(timings.values(), default=0.0)
+    print(
+        f"   ⏱️ LLM {len(jobs)}건 동시 처리: {elapsed:.1f}초 (최장 단일 호출 {slowest:.1f}초)"
+    )
+    return {job.key: result for job, result in zip(jobs, results)}
+
+
+def run_coroutine_sync(coro):
+    """동기 노드에서 코루틴 실행 (이미 이벤트 루프가 돌고 있으면 별도 스레드에서 실행)"""
+    try:
+        asyncio.get_running_loop()
+    except RuntimeError:
+        return asyncio.run(coro)
+
+    with ThreadPoolExecutor(max_workers=1) as executor:
+        return executor.submit(asyncio.run, coro).result()
+
+
+def build_meta_jobs(state: MultiPageSEOWorkflowState) -> List[LLMJob]:
+    """페이지별 메타태그 생성 작업 목록"""
+    business_type = state["business_type"]
+    api_key = state["api_key"]
+    analyses_by_url = {p["url"]: p for p in state.get("page_analyses", [])}
+    jobs = []
+
+    for result in state["crawl_results"]:
+        url = result["url"]
+        page_type = result["page_type"]
+        seo_analysis = analyses_by_url.get(url, {}).get("seo_analysis", {})
+        payload = {
+            "html_content": result.get("html_content", ""),
+            "url": url,
+            "page_type": page_type,
+            "seo_analysis": seo_analysis,
+            "business_type": business_type,
+            "api_key": api_key,
+        }
+        jobs.append(
+            LLMJob(
+                key=("meta", url),
+                func=lambda payload=payload: generate_meta_tags_with_llm.invoke(payload),
+                fallback=lambda a=seo_analysis, u=url, t=page_type: generate_basic_meta_tags(
+                    a, u, t, business_type
+                ),
+                estimated_tokens=estimate_llm_tokens(payload["html_content"], url),
+            )
+        )
+    return jobs
+
+
+def build_faq_jobs(state: MultiPageSEOWorkflowState) -> List[LLMJob]:
+    """페이지별 FAQ 생성 작업 목록"""
+    business_type = state["business_type"]
+    api_key = state["api_key"]
+    jobs = []
+
+    for result in state["crawl_results"]:
+        url = result["url"]
+        payload = {
+            "website_content": result.get("html_content", ""),
+            "business_type": business_type,
+            "api_key": api_key,
+            "keywords": [],
+            "url": url,
+        }
+        jobs.append(
+            LLMJob(
+                key=("faq", url),
+                func=lambda payload=payload: generate_intelligent_faq_with_llm.invoke(
+                    payload
+                ),
+                fallback=lambda: generate_basic_faq(business_type),
+                estimated_tokens=estimate_llm_tokens(
+                    payload["website_content"], url, prompt_overhead=500
+                ),
+            )
+        )
+    return jobs
+
+
 # ===== LangGraph 노드 함수들 =====
 # user_input_node를 db_input_node로 변경
 def db_input_node(state: MultiPageSEOWorkflowState) -> MultiPageSEOWorkflowState:
@@ -2212,6 +3093,9 @@ def crawling_node(state: MultiPageSEOWorkflowState) -> MultiPageSEOWorkflowState
         crawl_results = crawl_result["crawl_results"]
         state["crawl_results"] = crawl_results
 
+        # 모든 분석 노드가 공유할 파싱 결과를 한 번만 생성
+        build_parsed_pages(crawl_results)
+
         # 크롤링된 파일 목록 저장
         crawled_files = [
             result["filename"] for result in crawl_results if "filename" in result
@@ -2391,7 +3275,7 @@ def site_geo_analysis_node(
                 print(f"      • {criterion}: {score:.1f}/100")
 
         state["current_stage"] = "geo_analysis_completed"
-        state["next_action"] = "generate_meta"
+        state["next_action"] = "generate_content"
 
         # 메시지 히스토리 업데이트
         if not geo_result.get("error"):
@@ -2427,97 +3311,36 @@ def site_geo_analysis_node(
     return state
 
 
-def meta_tags_generation_node(
+def content_generation_node(
     state: MultiPageSEOWorkflowState,
 ) -> MultiPageSEOWorkflowState:
-    """메타태그 자동 생성 전용 노드"""
-    print("🏷️ 메타태그 자동 생성 중...")
+    """메타태그 + FAQ 동시 생성 노드 (전체 페이지의 LLM 호출을 한 번에 fan-out)"""
+    print("🏷️📋 메타태그 / FAQ 동시 생성 중...")
 
     try:
-        crawl_results = state["crawl_results"]
-        page_analyses = state["page_analyses"]
-        business_type = state["business_type"]
-        api_key = state["api_key"]
-        meta_results = {}
-
-        for result in crawl_results:
-            url = result["url"]
-            page_type = result["page_type"]
-            html_content = result.get("html_content", "")
-
-            page_analysis = next((p for p in page_analyses if p["url"] == url), {})
-
-            # print(f"   🏷️ [{page_type.upper()}] 메타태그 생성 중...")
-
-            meta_result = generate_meta_tags_with_llm.invoke(
-                {
-                    "html_content": html_content,
-                    "url": url,
-                    "page_type": page_type,
-                    "seo_analysis": page_analysis.get("seo_analysis", {}),
-                    "business_type": business_type,
-                    "api_key": api_key,
-                }
-            )
-
-            meta_results[url] = meta_result
-            print(f"      ✅ 메타태그 생성 완료")
-
-        state["meta_results"] = meta_results
-        state["current_stage"] = "meta_generated"
-        state["next_action"] = "generate_faqs"
-
-        # print(f"✅ 메타태그 생성 완료: {len(meta_results)}개 페이지")
-
-        return state
-
-    except Exception as e:
-        print(f"❌ 메타태그 생성 실패: {e}")
-        state["next_action"] = "handle_error"
-        return state
-
-
-def faq_generation_node(state: MultiPageSEOWorkflowState) -> MultiPageSEOWorkflowState:
-    """지능형 FAQ 생성 전용 노드"""
-    print("📋 지능형 FAQ 생성 중...")
+        results = run_coroutine_sync(
+            run_llm_jobs(build_meta_jobs(state) + build_faq_jobs(state))
+        )
 
-    try:
-        crawl_results = state["crawl_results"]
-        business_type = state["business_type"]
-        api_key = state["api_key"]
+        meta_results = {}
         faq_results = {}
+        for (kind, url), result in results.items():
+            if kind == "meta":
+                meta_results[url] = result
+            else:
+                faq_results[url] = result
 
-        for result in crawl_results:
-            url = result["url"]
-            page_type = result["page_type"]
-            html_content = result.get("html_content", "")
-
-            # print(f"   📋 [{page_type.upper()}] FAQ 생성 중...")
-
-            faq_result = generate_intelligent_faq_with_llm.invoke(
-                {
-                    "website_content": html_content,
-                    "business_type": business_type,
-                    "api_key": api_key,
-                    "keywords": [],
-                }
-            )
-
-            faq_results[url] = faq_result
-            # print(f"      ✅ {len(faq_result.get('generated_faqs', []))}개 FAQ 생성")
-
+        state["meta_results"] = meta_results
         state["faq_results"] = faq_results
         state["current_stage"] = "faq_generated"
         state["next_action"] = "final_optimization"
 
-        total_faqs = sum(len(r.get("generated_faqs", [])) for r in faq_results.values())
-        print(f"✅ FAQ 생성 완료")
-        # print(f"✅ FAQ 생성 완료: 총 {total_faqs}개 FAQ")
+        print(f"✅ 메타태그 / FAQ 생성 완료")
 
         return state
 
     except Exception as e:
-        print(f"❌ FAQ 생성 실패: {e}")
+        print(f"❌ 메타태그 / FAQ 생성 실패: {e}")
         state["next_action"] = "handle_error"
         return state
 
@@ -2534,6 +3357,7 @@ def final_optimization_node(
         faq_results = state.get("faq_results", {})
 
         final_html_files = []
+        analyses_by_url = {p["url"]: p for p in state.get("page_analyses", [])}
 
         for result in crawl_results:
             url = result["url"]
@@ -2547,9 +3371,7 @@ def final_optimization_node(
             faq_data = faq_results.get(url, {})
 
             # JSON-LD 데이터는 page_analyses에서 가져오기
-            page_analysis = next(
-                (p for p in state.get("page_analyses", []) if p["url"] == url), {}
-            )
+            page_analysis = analyses_by_url.get(url, {})
             jsonld_data = page_analysis.get("jsonld_schemas", {})
 
             try:
@@ -2620,7 +3442,8 @@ def integrate_all_elements_to_html(
     print(f"🔧 HTML 통합 시작")
 
     try:
-        soup = BeautifulSoup(original_html, "html.parser")
+        # 최종 HTML은 soup을 직접 수정하므로 캐시에서 꺼내어 사용 (재파싱 없음)
+        soup = take_parsed_page(original_html, url).soup
 
         # 1. 메타태그 적용
         if meta_data.get("success"):
@@ -3385,8 +4208,7 @@ def create_optimized_seo_langgraph() -> StateGraph:
     workflow.add_node("crawling", crawling_node)
     workflow.add_node("page_analysis", enhanced_page_analysis_node)
     workflow.add_node("site_geo_analysis", site_geo_analysis_node)
-    workflow.add_node("meta_tags_generation", meta_tags_generation_node)
-    workflow.add_node("faq_generation", faq_generation_node)
+    workflow.add_node("content_generation", content_generation_node)
     workflow.add_node("final_optimization", final_optimization_node)
     workflow.add_node("multi_page_summary", multi_page_summary_node)
     workflow.add_node("error_handler", error_handler_node)
@@ -3423,7 +4245,7 @@ def create_optimized_seo_langgraph() -> StateGraph:
         "site_geo_analysis",
         route_next_action,
         {
-            "generate_meta": "meta_tags_generation",
+            "generate_content": "content_generation",
             "generate_summary": "multi_page_summary",
             "handle_error": "error_handler",
             "end": END,
@@ -3431,17 +4253,7 @@ def create_optimized_seo_langgraph() -> StateGraph:
     )
 
     workflow.add_conditional_edges(
-        "meta_tags_generation",
-        route_next_action,
-        {
-            "generate_faqs": "faq_generation",
-            "handle_error": "error_handler",
-            "end": END,
-        },
-    )
-
-    workflow.add_conditional_edges(
-        "faq_generation",
+        "content_generation",
         route_next_action,
         {
             "final_optimization": "final_optimization",
@@ -3530,6 +4342,9 @@ class CompleteMultiPageSEOOptimizer:
                 "error": str(e),
                 "timestamp": datetime.now().isoformat(),
             }
+        finally:
+            # 실행이 끝나면 이번 사이트의 파싱 결과(soup)를 해제
+            clear_parsed_page_cache()
 
 
 # ===== 사용하기 쉬운 함수들 =====
@@ -3554,39 +4369,42 @@ def interactive_multi_page_optimize():
     print()
 
     # 스트리밍으로 진행상황 표시
-    for chunk in optimizer.app.stream(
-        {
-            "user_url": "",
-            "api_key": "",
-            "user_mode": "full",
-            "max_pages": 9,
-            "messages": [],
-            "current_stage": "starting",
-            "next_action": "start_crawling",
-            "crawl_results": [],
-            "crawled_files": [],
-            "page_analyses": [],
-            "site_seo_analysis": {},
-            "site_geo_analysis": {},
-            "site_performance": {},
-            "site_structured_data": {},
-            "site_keywords": {},
-            "optimized_pages": [],
-            "optimization_summary": {},
-            "meta_results": {},
-            "jsonld_results": {},
-            "faq_results": {},
-            "final_optimization": [],
-            "final_html_files": [],
-            "business_type": "",
-            "target_keywords": "",
-            "output_files": [],
-            "final_summary": {},
-        },
-        {"configurable": {"thread_id": "interactive_session"}},
-    ):
-        stage = list(chunk.keys())[0]
-        print(f"🔄 현재 단계: {stage}")
+    try:
+        for chunk in optimizer.app.stream(
+            {
+                "user_url": "",
+                "api_key": "",
+                "user_mode": "full",
+                "max_pages": 9,
+                "messages": [],
+                "current_stage": "starting",
+                "next_action": "start_crawling",
+                "crawl_results": [],
+                "crawled_files": [],
+                "page_analyses": [],
+                "site_seo_analysis": {},
+                "site_geo_analysis": {},
+                "site_performance": {},
+                "site_structured_data": {},
+                "site_keywords": {},
+                "optimized_pages": [],
+                "optimization_summary": {},
+                "meta_results": {},
+                "jsonld_results": {},
+                "faq_results": {},
+                "final_optimization": [],
+                "final_html_files": [],
+                "business_type": "",
+                "target_keywords": "",
+                "output_files": [],
+                "final_summary": {},
+            },
+            {"configurable": {"thread_id": "interactive_session"}},
+        ):
+            stage = list(chunk.keys())[0]
+            print(f"🔄 현재 단계: {stage}")
+    finally:
+        clear_parsed_page_cache()
 
 
 # ===== 메인 실행 =====
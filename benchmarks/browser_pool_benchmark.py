@@ -0,0 +1,112 @@
+#!/usr/bin/env python3
+"""
+브라우저 풀 벤치마크
+저장소 루트의 샘플 HTML(main_*.html, product_*.html 등)을 로컬 HTTP 서버로 띄워
+cold-start 크롤링(페이지마다 Chrome 실행)과 풀링 크롤링을 비교합니다.
+
+사용법:
+    python benchmarks/browser_pool_benchmark.py [--workers 3] [--rounds 1]
+"""
+
+import argparse
+import functools
+import os
+import sys
+import tempfile
+import threading
+import time
+from http.server import SimpleHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+
+ROOT_DIR = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(ROOT_DIR))
+
+from agent_web import SELENIUM_AVAILABLE, StreamlinedSEOGEOCrawler
+
+
+class QuietHandler(SimpleHTTPRequestHandler):
+    """요청 로그를 출력하지 않는 정적 파일 핸들러"""
+
+    def log_message(self, format, *args):
+        pass
+
+
+def start_fixture_server() -> ThreadingHTTPServer:
+    """저장소 루트를 정적 사이트로 서비스하는 로컬 서버 시작"""
+    handler = functools.partial(QuietHandler, directory=str(ROOT_DIR))
+    server = ThreadingHTTPServer(("127.0.0.1", 0), handler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    return server
+
+
+def fixture_urls(base_url: str) -> list:
+    """루트에 체크인된 샘플 페이지 URL 목록"""
+    return [f"{base_url}/{path.name}" for path in sorted(ROOT_DIR.glob("*_2025*.html"))]
+
+
+def run_crawl(base_url: str, urls: list, workers: int, pages_per_browser: int) -> dict:
+    """지정한 풀 설정으로 URL 목록을 크롤링하고 소요 시간 측정"""
+    crawler = StreamlinedSEOGEOCrawler(
+        base_url,
+        max_pages=len(urls),
+        max_workers=workers,
+        politeness_delay=0,
+        max_pages_per_browser=pages_per_browser,
+    )
+    start = time.monotonic()
+    try:
+        results = crawler.crawl_urls(urls)
+    finally:
+        crawler.close()
+    elapsed = time.monotonic() - start
+
+    pool_stats = crawler.browser_pool.stats
+    return {
+        "elapsed": elapsed,
+        "pages": len(results),
+        "launched": pool_stats["launched"],
+        "launch_time": pool_stats["launch_time"],
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description="cold-start vs 브라우저 풀 크롤링 비교")
+    parser.add_argument("--workers", type=int, default=3, help="동시 크롤링 수")
+    parser.add_argument("--rounds", type=int, default=1, help="반복 횟수")
+    args = parser.parse_args()
+
+    if not SELENIUM_AVAILABLE:
+        print("❌ Selenium이 설치되지 않아 벤치마크를 실행할 수 없습니다.")
+        return
+
+    server = start_fixture_server()
+    base_url = f"http://127.0.0.1:{server.server_address[1]}"
+    urls = fixture_urls(base_url)
+    print(f"🧪 로컬 픽스처 사이트: {base_url} ({len(urls)}개 페이지)")
+
+    # 크롤러가 HTML 파일을 현재 디렉토리에 저장하므로 임시 디렉토리에서 실행
+    original_cwd = os.getcwd()
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        os.chdir(tmp_dir)
+        try:
+            for round_no in range(1, args.rounds + 1):
+                # 페이지당 브라우저 1회 사용 = 기존 cold-start 방식
+                cold = run_crawl(base_url, urls, args.workers, pages_per_browser=1)
+                pooled = run_crawl(base_url, urls, args.workers, pages_per_browser=100)
+
+                print(f"\n📊 Round {round_no}")
+                for label, stats in (("cold-start", cold), ("pooled", pooled)):
+                    print(
+                        f"   • {label:<10} {stats['elapsed']:.2f}초 "
+                        f"({stats['pages']}페이지, Chrome 실행 {stats['launched']}회, "
+                        f"실행 시간 합계 {stats['launch_time']:.2f}초)"
+                    )
+                if pooled["elapsed"] > 0:
+                    print(f"   • 속도 향상: {cold['elapsed'] / pooled['elapsed']:.1f}x")
+        finally:
+            os.chdir(original_cwd)
+            server.shutdown()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,219 @@
+#!/usr/bin/env python3
+"""
+GEO 특징 추출 마이크로 벤치마크
+저장소 루트의 샘플 HTML(main_*.html, product_*.html 등)에 대해
+기존 6개 evaluate_* 방식(기준별 개별 순회/스캔)과 단일 패스 extract_geo_features를 비교하고
+두 방식의 점수가 동일한지 검증합니다.
+
+사용법:
+    python benchmarks/geo_feature_benchmark.py [--repeat 50]
+"""
+
+import argparse
+import re
+import sys
+import time
+from pathlib import Path
+
+from bs4 import BeautifulSoup
+
+ROOT_DIR = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(ROOT_DIR))
+
+from agent_web import evaluate_geo_criteria, extract_geo_features
+
+
+def _tiered(value, tiers) -> int:
+    """(임계값, 점수) 목록에서 value가 처음 넘는 구간의 점수"""
+    for threshold, points in tiers:
+        if value >= threshold:
+            return points
+    return 0
+
+
+def legacy_geo_results(soup: BeautifulSoup, page_text: str) -> dict:
+    """기준별로 soup과 텍스트를 각각 순회하던 기존 6개 evaluate_* 방식의 결과 (비교 기준)
+
+    점수 구간은 기존 evaluate_* 함수와 같습니다. 반환값은 evaluate_geo_criteria와 같은
+    {기준: {"score", "details"}} 형태이며, 세부 카운터에 없는 멀티미디어 수는 "multimedia"로 함께 반환합니다.
+    """
+    lower_text = page_text.lower
+
+    # 명확성
+    specific_facts = len(re.findall(r"\d+[%년도원달러$€₩]|\d+\.\d+", page_text))
+    clear_statements = sum(
+        lower_text().count(k) for k in ["입니다", "합니다", "제공합니다", "전문", "최고"]
+    )
+    contact_info = sum(
+        len(re.findall(p, page_text))
+        for p in [
+            r"(\d{2,3}-\d{3,4}-\d{4})",
+            r"([a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,})",
+        ]
+    )
+    clarity = {
+        "score": min(
+            _tiered(specific_facts, [(10, 30), (5, 20), (1, 10)])
+            + _tiered(clear_statements, [(20, 25), (10, 15), (5, 10)])
+            + _tiered(contact_info, [(2, 45), (1, 25)]),
+            100,
+        ),
+        "details": {
+            "specific_facts": specific_facts,
+            "clear_statements": clear_statements,
+            "contact_info": contact_info,
+        },
+    }
+
+    # 구조성
+    headings = len(soup.find_all(["h1", "h2", "h3", "h4", "h5", "h6"]))
+    lists = len(soup.find_all(["ul", "ol", "dl"]))
+    schema = len(soup.find_all("script", {"type": "application/ld+json"}))
+    structure = {
+        "score": min(
+            _tiered(headings, [(5, 30), (3, 20), (1, 10)])
+            + _tiered(lists, [(3, 25), (1, 15)])
+            + _tiered(schema, [(1, 45)]),
+            100,
+        ),
+        "details": {"headings": headings, "lists": lists, "schema": schema},
+    }
+
+    # 맥락성
+    word_count = len(page_text.split())
+    unique_topics = set()
+    for p in soup.find_all("p"):
+        unique_topics.update(re.findall(r"[가-힣]{2,}", p.get_text()))
+    multimedia = len(soup.find_all(["img", "video", "iframe"]))
+    context = {
+        "score": min(
+            _tiered(word_count, [(1000, 40), (500, 25), (200, 15)])
+            + _tiered(len(unique_topics), [(50, 35), (25, 20), (10, 10)])
+            + _tiered(multimedia, [(5, 25), (1, 15)]),
+            100,
+        ),
+        "details": {"word_count": word_count, "topics": len(unique_topics)},
+    }
+
+    # 정합성
+    images = soup.find_all("img")
+    quality_alt = sum(
+        1 for img in images if img.get("alt") and len(img.get("alt", "")) >= 5
+    )
+    alignment_score = 0
+    if images and quality_alt / len(images) >= 0.8:
+        alignment_score += 50
+    elif images and quality_alt / len(images) >= 0.5:
+        alignment_score += 30
+    consistency = 0
+    title = soup.find("title")
+    h1 = soup.find("h1")
+    if title and h1:
+        title_words = set(title.get_text().lower().split())
+        h1_words = set(h1.get_text().lower().split())
+        if title_words.intersection(h1_words):
+            alignment_score += 50
+            consistency = 1
+    alignment = {
+        "score": min(alignment_score, 100),
+        "details": {"alt_quality": quality_alt, "consistency": consistency},
+    }
+
+    # 시의성
+    dates = sum(
+        len(re.findall(p, page_text, re.I))
+        for p in [r"20\d{2}년", r"최근", r"최신", r"새로운"]
+    )
+    recent_keywords = sum(
+        lower_text().count(k) for k in ["현재", "지금", "오늘", "이번", "트렌드"]
+    )
+    timeliness = {
+        "score": min(
+            _tiered(dates, [(10, 60), (5, 40), (1, 20)])
+            + _tiered(recent_keywords, [(5, 40), (2, 20)]),
+            100,
+        ),
+        "details": {"dates": dates, "recent_keywords": recent_keywords},
+    }
+
+    # 독창성
+    insights = sum(
+        lower_text().count(k) for k in ["경험상", "분석하면", "발견했습니다", "연구"]
+    )
+    data = sum(lower_text().count(k) for k in ["조사", "통계", "데이터", "자체"])
+    originality = {
+        "score": min(
+            _tiered(insights, [(5, 50), (2, 30), (1, 15)])
+            + _tiered(data, [(5, 50), (2, 30), (1, 15)]),
+            100,
+        ),
+        "details": {"insights": insights, "data": data},
+    }
+
+    return {
+        "clarity": clarity,
+        "structure": structure,
+        "context": context,
+        "alignment": alignment,
+        "timeliness": timeliness,
+        "originality": originality,
+        "multimedia": multimedia,
+    }
+
+
+def single_pass_results(soup: BeautifulSoup, page_text: str) -> dict:
+    """단일 패스 extract_geo_features + evaluate_geo_criteria 결과 (legacy_geo_results와 같은 형태)"""
+    features = extract_geo_features(soup, page_text)
+    results = evaluate_geo_criteria(features)
+    results["multimedia"] = features["multimedia"]
+    return results
+
+
+def load_samples() -> list:
+    """샘플 HTML을 파싱하여 (파일명, soup, 텍스트) 목록 반환"""
+    samples = []
+    for path in sorted(ROOT_DIR.glob("*_2025*.html")):
+        soup = BeautifulSoup(path.read_text(encoding="utf-8"), "html.parser")
+        samples.append((path.name, soup, soup.get_text()))
+    return samples
+
+
+def verify_identical(samples: list):
+    """단일 패스 결과(점수, 세부 카운터, 멀티미디어 수)가 기존 방식과 같은지 확인"""
+    for name, soup, text in samples:
+        legacy = legacy_geo_results(soup, text)
+        current = single_pass_results(soup, text)
+        if legacy != current:
+            raise AssertionError(f"{name}: 결과 불일치\n{legacy}\n{current}")
+
+
+def bench(label: str, func, samples: list, repeat: int) -> float:
+    start = time.perf_counter()
+    for _ in range(repeat):
+        for _, soup, text in samples:
+            func(soup, text)
+    elapsed = time.perf_counter() - start
+    per_page = elapsed / (repeat * len(samples)) * 1000
+    print(f"   • {label:<12} {elapsed:.3f}초 (페이지당 {per_page:.3f}ms)")
+    return elapsed
+
+
+def main():
+    parser = argparse.ArgumentParser(description="GEO 특징 추출 마이크로 벤치마크")
+    parser.add_argument("--repeat", type=int, default=50, help="반복 횟수")
+    args = parser.parse_args()
+
+    samples = load_samples()
+    print(f"🧪 샘플 HTML {len(samples)}개, {args.repeat}회 반복")
+
+    verify_identical(samples)
+    print("✅ 기존 방식과 점수/세부 카운터 동일")
+
+    legacy = bench("legacy", legacy_geo_results, samples, args.repeat)
+    single = bench("single-pass", single_pass_results, samples, args.repeat)
+    if single > 0:
+        print(f"   • 속도 향상: {legacy / single:.1f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,118 @@
+#!/usr/bin/env python3
+"""
+Instagram 게시물 상세 추출 벤치마크
+실제 게시물 DOM 구조를 흉내 낸 로컬 HTML에서 선택자별 개별 호출(legacy)과
+page.evaluate 1회 추출(evaluate)의 게시물당 추출 지연을 비교합니다.
+
+사용법:
+    python benchmarks/instagram_extraction_benchmark.py [--posts 30] [--spans 200]
+"""
+
+import argparse
+import asyncio
+import statistics
+import sys
+import time
+from pathlib import Path
+
+ROOT_DIR = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(ROOT_DIR / "agent_03_instagram_crawler"))
+
+try:
+    from playwright.async_api import async_playwright
+
+    # crawler 패키지는 playwright를 import하므로 설치된 경우에만 로드
+    from crawler.post_extractor import extract_post_detail
+
+    PLAYWRIGHT_AVAILABLE = True
+except ImportError:
+    PLAYWRIGHT_AVAILABLE = False
+
+
+def build_fixture(index: int, spans: int) -> str:
+    """캡션이 뒤쪽 선택자에서만 잡히고 span이 많은 무거운 게시물 페이지"""
+    filler = "\n".join(f"<span>텍스트 조각 {i}</span>" for i in range(spans))
+    images = "\n".join(
+        f'<img src="https://cdn.example.com/{index}/{i}.jpg">' for i in range(6)
+    )
+    comments = "\n".join(
+        f'<span class="_ap3a _aaco _aacu _aacx _aad7 _aade">댓글 {i} @user{i}</span>'
+        for i in range(15)
+    )
+    return f"""<!doctype html>
+<html><body>
+<article>
+  <div style="word-wrap: break-word"><span>게시물 {index} 캡션 #브랜드 #신상 @friend</span></div>
+  {images}
+  <img src="data:image/gif;base64,R0lGODlhAQABAAAAACw=">
+  <video src="https://cdn.example.com/{index}/clip.mp4"></video>
+  {filler}
+  <section><span class="_ac2a">좋아요 {1000 + index:,}개</span></section>
+  {comments}
+  <time datetime="2025-07-{(index % 28) + 1:02d}T09:30:00.000Z" title="2025년 7월 1일"></time>
+</article>
+</body></html>"""
+
+
+async def measure(page, fixtures: list, mode: str) -> list:
+    """각 게시물 추출 시간(ms) 측정"""
+    timings = []
+    for html in fixtures:
+        await page.set_content(html)
+        start = time.perf_counter()
+        await extract_post_detail(page, mode)
+        timings.append((time.perf_counter() - start) * 1000)
+    return timings
+
+
+async def main_async(posts: int, spans: int):
+    fixtures = [build_fixture(i, spans) for i in range(posts)]
+
+    async with async_playwright() as p:
+        browser = await p.chromium.launch(headless=True)
+        page = await browser.new_page()
+
+        # 두 모드의 결과가 동일한지 먼저 확인
+        for html in fixtures[:3]:
+            await page.set_content(html)
+            legacy = await extract_post_detail(page, "legacy")
+            fast = await extract_post_detail(page, "evaluate")
+            legacy["media"].sort()
+            fast["media"].sort()
+            assert legacy == fast, f"추출 결과 불일치:\n{legacy}\n{fast}"
+
+        results = {}
+        for mode in ("legacy", "evaluate"):
+            results[mode] = await measure(page, fixtures, mode)
+
+        await browser.close()
+
+    print(f"\n게시물 {posts}개, 게시물당 span {spans}개")
+    print(f"{'mode':<10} {'mean(ms)':>10} {'p50(ms)':>10} {'p95(ms)':>10}")
+    for mode, timings in results.items():
+        ordered = sorted(timings)
+        p95 = ordered[max(0, int(len(ordered) * 0.95) - 1)]
+        print(f"{mode:<10} {statistics.mean(timings):>10.1f} "
+              f"{statistics.median(timings):>10.1f} {p95:>10.1f}")
+
+    speedup = statistics.mean(results["legacy"]) / statistics.mean(results["evaluate"])
+    print(f"\nevaluate 모드가 {speedup:.1f}배 빠름")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Instagram 상세 추출 벤치마크")
+    parser.add_argument("--posts", type=int, default=30, help="측정할 게시물 수")
+    parser.add_argument("--spans", type=int, default=200, help="게시물당 추가 span 수")
+    args = parser.parse_args()
+
+    if not PLAYWRIGHT_AVAILABLE:
+        print("playwright가 설치되어 있지 않아 벤치마크를 실행할 수 없습니다.")
+        print("pip install playwright && playwright install chromium")
+        return 1
+
+    asyncio.run(main_async(args.posts, args.spans))
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,179 @@
+#!/usr/bin/env python3
+"""
+Tistory 스트리밍 품질 필터 벤치마크
+티스토리 레이아웃을 흉내 낸 로컬 HTML에서 stream 단계(StreamScanner)가 parse 단계
+(get_post_content 본문 추출 + check_content)에서 통과할 포스트를 거부하지 않는지 조각 크기별로
+검증하고, 두 단계의 포스트당 처리 시간을 비교합니다.
+
+사용법:
+    python benchmarks/tistory_filter_benchmark.py [--repeat 200]
+"""
+
+import argparse
+import sys
+import time
+from pathlib import Path
+
+from bs4 import BeautifulSoup
+
+ROOT_DIR = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(ROOT_DIR))
+
+from agent_05_tistory_crawler.quality_filter import QualityFilter
+
+NEGATIVE_KEYWORDS = ["부동산", "대출", "카지노"]
+POSITIVE_KEYWORDS = ["패션", "코디", "스타일"]
+MIN_IMAGES = 2
+CHUNK_SIZES = (7, 64, 1024, None)
+
+# get_post_content의 content_selectors (parse 단계 기준)
+PARSE_SELECTORS = [
+    "div.entry-content",
+    "div.tt_article_useless_p_margin",
+    "div.contents_style",
+    "div.article_view",
+    "article.article",
+    "div.post-content",
+    "div#content",
+    "div.area_view",
+]
+
+BODY = """<p>오늘의 패션 코디를 소개합니다.</p>
+<img src="https://img.example.com/1.jpg"><img src="https://img.example.com/2.jpg">
+<p>가을 스타일링 팁 정리</p>"""
+
+
+def page(inner: str, sidebar: str = "") -> str:
+    return f"""<!doctype html>
+<html><head><title>가을 코디</title></head><body>
+<div id="sidebar">{sidebar}</div>
+{inner}
+<footer>인기 글: 카지노 후기</footer>
+</body></html>"""
+
+
+# (이름, HTML, 기대 판정)
+FIXTURES = [
+    (
+        "area_view 안의 tt_article_useless_p_margin + another_category",
+        page(
+            '<div class="area_view"><div class="tt_article_useless_p_margin contents_style">'
+            f"{BODY}</div>"
+            '<div class="another_category"><a href="/1">부동산 시장 전망</a></div></div>'
+        ),
+        True,
+    ),
+    (
+        "entry-content 본문의 네거티브 키워드",
+        page(f'<div class="entry-content"><p>부동산 투자 이야기</p>{BODY}</div>'),
+        False,
+    ),
+    (
+        "area_view만 있고 하위 카테고리에 네거티브 키워드",
+        page(
+            f'<div class="area_view">{BODY}'
+            '<div class="another_category"><a href="/1">부동산 시장 전망</a></div></div>'
+        ),
+        False,
+    ),
+    (
+        "사이드바의 네거티브 키워드",
+        page(f'<div class="entry-content">{BODY}</div>', sidebar="대출 상담 배너"),
+        True,
+    ),
+    (
+        "area_view 뒤에 따로 열리는 entry-content",
+        page(
+            '<div class="area_view"><p>관련 글: 대출 금리 비교</p></div>'
+            f'<div class="entry-content">{BODY}</div>'
+        ),
+        True,
+    ),
+    (
+        "본문 script/광고 안의 네거티브 키워드",
+        page(
+            f'<div class="entry-content">{BODY}<script>var ad = "대출";</script>'
+            '<ins class="adsbygoogle">카지노</ins></div>'
+        ),
+        True,
+    ),
+    (
+        "이미지 부족",
+        page('<div class="entry-content"><p>패션 코디 메모</p><img src="https://img.example.com/1.jpg"></div>'),
+        False,
+    ),
+]
+
+
+def new_filter() -> QualityFilter:
+    return QualityFilter(NEGATIVE_KEYWORDS, POSITIVE_KEYWORDS, min_images=MIN_IMAGES)
+
+
+def stream_verdict(quality_filter: QualityFilter, html: str, chunk_size) -> bool:
+    """_fetch_post_html과 같은 순서로 조각을 넣고 stream 단계 통과 여부 반환"""
+    scanner = quality_filter.stream_scanner()
+    size = chunk_size or len(html)
+    for start in range(0, len(html), size):
+        if not scanner.feed(html[start:start + size]):
+            return False
+    return scanner.finish()
+
+
+def parse_verdict(quality_filter: QualityFilter, html: str) -> bool:
+    """get_post_content의 본문 추출 + check_content/이미지 수 판정"""
+    soup = BeautifulSoup(html, "html.parser")
+    title = soup.title.get_text(strip=True) if soup.title else ""
+    content_elem = None
+    content_text = ""
+    for selector in PARSE_SELECTORS:
+        content_elem = soup.select_one(selector)
+        if content_elem:
+            for elem in content_elem.select("script, style, iframe, .adsbygoogle"):
+                elem.decompose()
+            content_text = content_elem.get_text(separator="\n", strip=True)
+            break
+    images = content_elem.select("img") if content_elem else []
+    return quality_filter.check_content(title, content_text) and len(images) >= MIN_IMAGES
+
+
+def verify(quality_filter: QualityFilter):
+    """stream 단계가 parse 단계에서 통과할 포스트를 거부하지 않는지 확인"""
+    stream_rejected = 0
+    for name, html, expected in FIXTURES:
+        parsed = parse_verdict(quality_filter, html)
+        assert parsed == expected, f"[{name}] parse 판정 {parsed}, 기대값 {expected}"
+        for chunk_size in CHUNK_SIZES:
+            streamed = stream_verdict(quality_filter, html, chunk_size)
+            assert streamed or not parsed, f"[{name}] 조각 {chunk_size}: stream 단계 오거부"
+            stream_rejected += not streamed
+    checks = len(FIXTURES) * len(CHUNK_SIZES)
+    print(f"검증 완료: 픽스처 {len(FIXTURES)}개 x 조각 크기 {len(CHUNK_SIZES)}종, "
+          f"오거부 0건 (stream 단계 거부 {stream_rejected}/{checks})")
+
+
+def bench(label: str, func, repeat: int) -> float:
+    start = time.perf_counter()
+    for _ in range(repeat):
+        for _, html, _ in FIXTURES:
+            func(html)
+    per_post = (time.perf_counter() - start) / (repeat * len(FIXTURES)) * 1000
+    print(f"{label:<8} {per_post:>8.3f} ms/포스트")
+    return per_post
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Tistory 스트리밍 품질 필터 벤치마크")
+    parser.add_argument("--repeat", type=int, default=200, help="픽스처 반복 횟수")
+    args = parser.parse_args()
+
+    quality_filter = new_filter()
+    verify(quality_filter)
+
+    stream_ms = bench("stream", lambda html: stream_verdict(quality_filter, html, 1024), args.repeat)
+    parse_ms = bench("parse", lambda html: parse_verdict(quality_filter, html), args.repeat)
+    print(f"\nstream 단계가 parse 단계보다 {parse_ms / stream_ms:.1f}배 빠름")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
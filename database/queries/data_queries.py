@@ -4,11 +4,14 @@ Data-related database queries for crawling, refining, and content management
 from typing import Dict, List, Optional, Any, Tuple
 import json
 import hashlib
+import logging
 from datetime import datetime, timedelta
 
 from ..utils import get_db
 from ..config import Tables
 
+logger = logging.getLogger(__name__)
+
 class DataQueries:
     """Queries for raw data, refined content, and processing"""
     
@@ -130,6 +133,141 @@ class DataQueries:
         
         return db.execute(query, (platform, brand_id, limit))
     
+    # ========== Bulk Raw Data Ingest ==========
+    
+    # Natural keys backing the unique indexes of the raw data tables
+    RAW_NAVER_KEY = ('blog_id', 'log_no')
+    RAW_TISTORY_KEY = ('blog_name', 'entry_id')
+    RAW_INSTAGRAM_KEY = ('brand_id', 'post_id')
+    
+    RAW_NAVER_JSON_FIELDS = ('images', 'raw_data')
+    RAW_TISTORY_JSON_FIELDS = ('tags', 'images', 'raw_data')
+    RAW_INSTAGRAM_JSON_FIELDS = ('hashtags', 'mentions', 'location_info', 'media_urls',
+                                 'sponsor_tags', 'raw_data')
+    
+    # Max key tuples per IN (...) lookup
+    KEY_LOOKUP_CHUNK = 500
+    
+    @staticmethod
+    def find_existing_keys(table: str, key_columns: Tuple[str, ...],
+                           keys: List[Tuple]) -> set:
+        """Return the subset of natural keys that already exist in a table"""
+        db = get_db()
+        existing = set()
+        keys = list(dict.fromkeys(keys))
+        if not keys:
+            return existing
+        
+        columns = ', '.join(f'`{col}`' for col in key_columns)
+        row_placeholder = '(' + ', '.join(['%s'] * len(key_columns)) + ')'
+        
+        for i in range(0, len(keys), DataQueries.KEY_LOOKUP_CHUNK):
+            chunk = keys[i:i + DataQueries.KEY_LOOKUP_CHUNK]
+            query = (
+                f"SELECT {columns} FROM `{table}` "
+                f"WHERE ({columns}) IN ({', '.join([row_placeholder] * len(chunk))})"
+            )
+            params = tuple(value for key in chunk for value in key)
+            for row in db.execute(query, params):
+                existing.add(tuple(str(row[col]) for col in key_columns))
+        return existing
+    
+    @staticmethod
+    def get_known_post_keys(table: str, key_columns: Tuple[str, ...],
+                            brand_name: str) -> set:
+        """Load every natural key already stored for a brand (seen-post watermark)"""
+        db = get_db()
+        columns = ', '.join(f'`{col}`' for col in key_columns)
+        query = f"SELECT {columns} FROM `{table}` WHERE `brand_name` = %s"
+        return {
+            tuple(str(row[col]) for col in key_columns)
+            for row in db.execute(query, (brand_name,))
+            if all(row[col] is not None for col in key_columns)
+        }
+    
+    @staticmethod
+    def bulk_insert_raw_data(table: str, rows: List[Dict[str, Any]],
+                             key_columns: Tuple[str, ...],
+                             json_fields: Tuple[str, ...] = ()) -> List[Tuple]:
+        """Dedup a batch against the table and insert the new rows in one transaction
+        
+        Duplicates within the batch and rows already stored are skipped.
+        Rows without a complete natural key cannot be deduplicated and are
+        inserted as-is (as before batching). Returns the keys of the rows
+        actually inserted (incomplete keys included).
+        """
+        if not rows:
+            return []
+        
+        # Dedup within the batch
+        batch = {}
+        keyless = []
+        for row in rows:
+            key = tuple(row.get(col) for col in key_columns)
+            if any(value in (None, '') for value in key):
+                keyless.append((key, row))
+                continue
+            batch.setdefault(tuple(str(value) for value in key), row)
+        if keyless:
+            logger.warning(
+                "%s: %d row(s) without a complete %s key inserted without dedup",
+                table, len(keyless), '/'.join(key_columns)
+            )
+        
+        # Dedup against stored rows with a single lookup per chunk
+        existing = DataQueries.find_existing_keys(table, key_columns, list(batch.keys()))
+        new_items = [(key, row) for key, row in batch.items() if key not in existing] + keyless
+        if not new_items:
+            return []
+        
+        columns = list(dict.fromkeys(col for _, row in new_items for col in row))
+        values_list = []
+        for _, row in new_items:
+            values = []
+            for col in columns:
+                value = row.get(col)
+                if col in json_fields and value is not None:
+                    value = json.dumps(value, ensure_ascii=False)
+                values.append(value)
+            values_list.append(tuple(values))
+        
+        # ON DUPLICATE KEY no-op covers rows inserted concurrently since the lookup
+        query = (
+            f"INSERT INTO `{table}` ({', '.join(f'`{col}`' for col in columns)}) "
+            f"VALUES ({', '.join(['%s'] * len(columns))}) "
+            f"ON DUPLICATE KEY UPDATE `id` = `id`"
+        )
+        
+        db = get_db()
+        with db.transaction():
+            db.execute_many(query, values_list)
+        
+        return [key for key, _ in new_items]
+    
+    @staticmethod
+    def bulk_insert_raw_naver_data(rows: List[Dict[str, Any]]) -> List[Tuple]:
+        """Bulk insert raw Naver blog data, skipping stored (blog_id, log_no)"""
+        return DataQueries.bulk_insert_raw_data(
+            Tables.RAW_NAVER_BLOG_DATA, rows,
+            DataQueries.RAW_NAVER_KEY, DataQueries.RAW_NAVER_JSON_FIELDS
+        )
+    
+    @staticmethod
+    def bulk_insert_raw_tistory_data(rows: List[Dict[str, Any]]) -> List[Tuple]:
+        """Bulk insert raw Tistory data, skipping stored (blog_name, entry_id)"""
+        return DataQueries.bulk_insert_raw_data(
+            Tables.RAW_TISTORY_DATA, rows,
+            DataQueries.RAW_TISTORY_KEY, DataQueries.RAW_TISTORY_JSON_FIELDS
+        )
+    
+    @staticmethod
+    def bulk_insert_03_raw_instagram_data(rows: List[Dict[str, Any]]) -> List[Tuple]:
+        """Bulk insert raw Instagram data, skipping stored (brand_id, post_id)"""
+        return DataQueries.bulk_insert_raw_data(
+            Tables.RAW_INSTAGRAM_DATA, rows,
+            DataQueries.RAW_INSTAGRAM_KEY, DataQueries.RAW_INSTAGRAM_JSON_FIELDS
+        )
+    
     # ========== Refined Content Queries ==========
     
     @staticmethod
@@ -7,10 +7,13 @@ from .connection import (
     get_db_cursor,
     close_db
 )
+from .pool import ConnectionPool, PoolTimeoutError
 
 __all__ = [
     'DatabaseConnection',
     'get_db',
     'get_db_cursor',
-    'close_db'
+    'close_db',
+    'ConnectionPool',
+    'PoolTimeoutError'
 ]
\ No newline at end of file
@@ -3,6 +3,7 @@ Database Connection Manager
 """
 import pymysql
 import logging
+import threading
 from contextlib import contextmanager
 from typing import Optional, Dict, Any, List, Tuple
 from pymysql.cursors import DictCursor
@@ -10,16 +11,33 @@ from datetime import datetime
 import time
 
 from ..config import db_config, QUERY_TIMEOUTS
+from .pool import ConnectionPool
+from .query_stats import QueryStats
 
 logger = logging.getLogger(__name__)
 
+# Errors after which a connection must not go back to the pool
+_CONNECTION_ERRORS = (pymysql.err.OperationalError, pymysql.err.InterfaceError)
+
 class DatabaseConnection:
-    """Database connection manager with connection pooling simulation"""
+    """Database connection manager backed by a bounded connection pool
+    
+    Each thread checks out its own connection for the duration of a
+    ``cursor()`` / ``transaction()`` block; nested blocks in the same thread
+    reuse that connection so transactions keep working across helper calls.
+    """
     
     def __init__(self, config=None):
         self.config = config or db_config
-        self._connection: Optional[pymysql.Connection] = None
-        self._transaction_active = False
+        self.pool = ConnectionPool(
+            self.connect,
+            pool_size=self.config.pool_size,
+            max_overflow=self.config.max_overflow,
+            pool_timeout=self.config.pool_timeout,
+            pool_recycle=self.config.pool_recycle,
+        )
+        self._local = threading.local()
+        self.query_stats = QueryStats()
         
     def connect(self) -> pymysql.Connection:
         """Create a database connection"""
@@ -34,90 +52,155 @@ class DatabaseConnection:
                 cursorclass=DictCursor,
                 autocommit=False
             )
-            logger.info(f"Connected to database: {self.config.database}")
+            logger.debug(f"Connected to database: {self.config.database}")
             return connection
         except pymysql.Error as e:
             logger.error(f"Failed to connect to database: {e}")
             raise
     
-    def get_connection(self) -> pymysql.Connection:
-        """Get or create a connection"""
-        if self._connection is None or not self._connection.open:
-            self._connection = self.connect()
-        else:
-            # Ping to check if connection is alive
+    @property
+    def _transaction_active(self) -> bool:
+        return getattr(self._local, 'transaction_active', False)
+    
+    @contextmanager
+    def _checkout(self):
+        """Borrow a pooled connection for the current thread (re-entrant)"""
+        pooled = getattr(self._local, 'pooled', None)
+        if pooled is not None:
+            self._local.depth += 1
             try:
-                self._connection.ping(reconnect=True)
-            except:
-                self._connection = self.connect()
-        return self._connection
+                yield pooled.connection
+            finally:
+                self._local.depth -= 1
+            return
+        
+        pooled = self.pool.acquire()
+        self._local.pooled = pooled
+        self._local.depth = 1
+        broken = False
+        try:
+            yield pooled.connection
+        except _CONNECTION_ERRORS:
+            broken = True
+            raise
+        finally:
+            self._local.depth -= 1
+            if self._local.depth == 0:
+                self._local.pooled = None
+                self.pool.release(pooled, discard=broken)
+    
+    def get_connection(self) -> pymysql.Connection:
+        """Get the connection bound to the current thread
+        
+        Outside a ``cursor()`` / ``transaction()`` block the connection stays
+        checked out until ``release_connection()`` is called.
+        """
+        pooled = getattr(self._local, 'pooled', None)
+        if pooled is None:
+            pooled = self.pool.acquire()
+            self._local.pooled = pooled
+            self._local.depth = 1
+            self._local.pinned = True
+        return pooled.connection
+    
+    def release_connection(self):
+        """Return a connection pinned by get_connection() to the pool"""
+        if getattr(self._local, 'pinned', False):
+            pooled = self._local.pooled
+            self._local.pinned = False
+            self._local.pooled = None
+            self._local.depth = 0
+            self.pool.release(pooled)
     
     def close(self):
-        """Close the connection"""
-        if self._connection:
-            self._connection.close()
-            self._connection = None
-            logger.info("Database connection closed")
+        """Close the pool's connections"""
+        self.release_connection()
+        self.pool.close()
+        logger.info("Database connection pool closed")
+    
+    def pool_metrics(self) -> Dict[str, Any]:
+        """Get connection pool metrics (in-use, waits, wait time, ...)"""
+        return self.pool.metrics()
     
     @contextmanager
     def transaction(self):
         """Transaction context manager"""
-        connection = self.get_connection()
-        try:
-            self._transaction_active = True
-            yield connection
-            connection.commit()
-            logger.debug("Transaction committed")
-        except Exception as e:
-            connection.rollback()
-            logger.error(f"Transaction rolled back: {e}")
-            raise
-        finally:
-            self._transaction_active = False
+        with self._checkout() as connection:
+            outer_active = self._transaction_active
+            try:
+                self._local.transaction_active = True
+                yield connection
+                if not outer_active:
+                    connection.commit()
+                    logger.debug("Transaction committed")
+            except Exception as e:
+                if not outer_active:
+                    connection.rollback()
+                    logger.error(f"Transaction rolled back: {e}")
+                raise
+            finally:
+                self._local.transaction_active = outer_active
     
     @contextmanager
     def cursor(self, cursor_class=DictCursor):
         """Cursor context manager"""
-        connection = self.get_connection()
-        cursor = connection.cursor(cursor_class)
-        try:
-            yield cursor
-            if not self._transaction_active:
-                connection.commit()
-        except Exception as e:
-            if not self._transaction_active:
-                connection.rollback()
-            raise
-        finally:
-            cursor.close()
+        with self._checkout() as connection:
+            cursor = connection.cursor(cursor_class)
+            try:
+                yield cursor
+                if not self._transaction_active:
+                    connection.commit()
+            except Exception as e:
+                if not self._transaction_active:
+                    connection.rollback()
+                raise
+            finally:
+                cursor.close()
+    
+    def _record_query(self, query: str, start_time: float):
+        """Record statement latency and warn on slow queries"""
+        execution_time = time.perf_counter() - start_time
+        self.query_stats.record(query, execution_time)
+        if execution_time > self.config.slow_query_threshold:
+            logger.warning(f"Slow query ({execution_time:.2f}s): {query[:100]}...")
+    
+    def _apply_timeout(self, cursor, timeout: int):
+        """Set MAX_EXECUTION_TIME only when it differs from the connection's current value"""
+        pooled = self._local.pooled
+        timeout_ms = timeout * 1000
+        if pooled.session.get('max_execution_time') != timeout_ms:
+            cursor.execute(f"SET SESSION MAX_EXECUTION_TIME={timeout_ms}")
+            pooled.session['max_execution_time'] = timeout_ms
     
     def execute(self, query: str, params: Optional[Tuple] = None, 
                 timeout: Optional[int] = None) -> List[Dict[str, Any]]:
         """Execute a SELECT query and return results"""
         timeout = timeout or QUERY_TIMEOUTS['default']
-        start_time = time.time()
         
         with self.cursor() as cursor:
-            cursor.execute(f"SET SESSION MAX_EXECUTION_TIME={timeout * 1000}")
+            self._apply_timeout(cursor, timeout)
+            start_time = time.perf_counter()
             cursor.execute(query, params)
             results = cursor.fetchall()
-            
-            execution_time = time.time() - start_time
-            if execution_time > self.config.slow_query_threshold:
-                logger.warning(f"Slow query ({execution_time:.2f}s): {query[:100]}...")
+            self._record_query(query, start_time)
             
             return results
     
     def execute_one(self, query: str, params: Optional[Tuple] = None) -> Optional[Dict[str, Any]]:
         """Execute a SELECT query and return one result"""
         with self.cursor() as cursor:
+            start_time = time.perf_counter()
             cursor.execute(query, params)
-            return cursor.fetchone()
+            result = cursor.fetchone()
+            self._record_query(query, start_time)
+            return result
     
     def execute_many(self, query: str, params_list: List[Tuple]) -> int:
         """Execute many INSERT/UPDATE queries"""
         with self.cursor() as cursor:
+            start_time = time.perf_counter()
             cursor.executemany(query, params_list)
+            self._record_query(query, start_time)
             return cursor.rowcount
     
     def insert(self, table: str, data: Dict[str, Any]) -> int:
@@ -127,7 +210,9 @@ class DatabaseConnection:
         query = f"INSERT INTO `{table}` ({columns}) VALUES ({placeholders})"
         
         with self.cursor() as cursor:
+            start_time = time.perf_counter()
             cursor.execute(query, tuple(data.values()))
+            self._record_query(query, start_time)
             return cursor.lastrowid
     
     def update(self, table: str, data: Dict[str, Any], 
@@ -138,7 +223,9 @@ class DatabaseConnection:
         params = tuple(data.values()) + (where_params or ())
         
         with self.cursor() as cursor:
+            start_time = time.perf_counter()
             cursor.execute(query, params)
+            self._record_query(query, start_time)
             return cursor.rowcount
     
     def delete(self, table: str, where: str, where_params: Optional[Tuple] = None) -> int:
@@ -146,9 +233,15 @@ class DatabaseConnection:
         query = f"DELETE FROM `{table}` WHERE {where}"
         
         with self.cursor() as cursor:
+            start_time = time.perf_counter()
             cursor.execute(query, where_params)
+            self._record_query(query, start_time)
             return cursor.rowcount
     
+    def get_query_stats(self, top: Optional[int] = 20) -> List[Dict[str, Any]]:
+        """Latency histograms per statement fingerprint, slowest total first"""
+        return self.query_stats.snapshot(top)
+    
     def table_exists(self, table_name: str) -> bool:
         """Check if a table exists"""
         query = """
@@ -177,12 +270,15 @@ class DatabaseConnection:
 
 # Global connection instance
 _db_connection = None
+_db_connection_lock = threading.Lock()
 
 def get_db() -> DatabaseConnection:
     """Get the global database connection"""
     global _db_connection
     if _db_connection is None:
-        _db_connection = DatabaseConnection()
+        with _db_connection_lock:
+            if _db_connection is None:
+                _db_connection = DatabaseConnection()
     return _db_connection
 
 @contextmanager
@@ -195,6 +291,7 @@ def get_db_cursor():
 def close_db():
     """Close the global database connection"""
     global _db_connection
-    if _db_connection:
-        _db_connection.close()
-        _db_connection = None
\ No newline at end of file
+    with _db_connection_lock:
+        if _db_connection:
+            _db_connection.close()
+            _db_connection = None
\ No newline at end of file
@@ -0,0 +1,195 @@
+"""
+Database Connection Pool
+"""
+import time
+import logging
+import threading
+from collections import deque
+from typing import Callable, Dict, Any
+
+import pymysql
+
+logger = logging.getLogger(__name__)
+
+
+class PoolTimeoutError(pymysql.err.OperationalError):
+    """Raised when no connection becomes available within pool_timeout"""
+
+
+class PooledConnection:
+    """A pymysql connection plus the bookkeeping the pool needs"""
+
+    def __init__(self, connection: pymysql.Connection):
+        self.connection = connection
+        self.created_at = time.monotonic()
+        self.last_used = self.created_at
+        # Session variables already applied on this connection
+        self.session: Dict[str, Any] = {}
+
+    @property
+    def age(self) -> float:
+        return time.monotonic() - self.created_at
+
+    @property
+    def idle_time(self) -> float:
+        return time.monotonic() - self.last_used
+
+    def close(self):
+        try:
+            self.connection.close()
+        except Exception:
+            pass
+
+
+class ConnectionPool:
+    """Bounded, thread-safe pool of pymysql connections
+
+    Holds up to ``pool_size`` idle connections and allows ``max_overflow``
+    extra connections under load. Borrowers wait up to ``pool_timeout``
+    seconds, connections older than ``pool_recycle`` seconds are replaced,
+    and connections idle longer than ``pre_ping_after`` seconds are pinged
+    before being handed out.
+    """
+
+    def __init__(self, factory: Callable[[], pymysql.Connection],
+                 pool_size: int = 10, max_overflow: int = 20,
+                 pool_timeout: float = 30, pool_recycle: float = 3600,
+                 pre_ping_after: float = 5.0):
+        self._factory = factory
+        self.pool_size = max(1, pool_size)
+        self.max_size = self.pool_size + max(0, max_overflow)
+        self.pool_timeout = pool_timeout
+        self.pool_recycle = pool_recycle
+        self.pre_ping_after = pre_ping_after
+
+        self._idle: deque = deque()
+        self._total = 0
+        self._closed = False
+        self._cond = threading.Condition()
+
+        # Metrics
+        self._checkouts = 0
+        self._waits = 0
+        self._wait_time_total = 0.0
+        self._wait_time_max = 0.0
+        self._timeouts = 0
+        self._created = 0
+        self._recycled = 0
+        self._discarded = 0
+
+    def _create(self) -> PooledConnection:
+        try:
+            pooled = PooledConnection(self._factory())
+        except Exception:
+            with self._cond:
+                self._total -= 1
+                self._cond.notify()
+            raise
+        with self._cond:
+            self._created += 1
+        return pooled
+
+    def _is_usable(self, pooled: PooledConnection) -> bool:
+        """Recycle on age and health-check connections that sat idle"""
+        if not pooled.connection.open:
+            return False
+        if self.pool_recycle and pooled.age > self.pool_recycle:
+            with self._cond:
+                self._recycled += 1
+            return False
+        if pooled.idle_time > self.pre_ping_after:
+            try:
+                pooled.connection.ping(reconnect=False)
+            except Exception:
+                return False
+        return True
+
+    def acquire(self) -> PooledConnection:
+        """Borrow a connection, waiting up to pool_timeout if the pool is exhausted"""
+        deadline = None
+        waited_since = None
+
+        while True:
+            with self._cond:
+                if self._closed:
+                    raise pymysql.err.InterfaceError("Connection pool is closed")
+
+                if self._idle:
+                    pooled = self._idle.pop()
+                elif self._total < self.max_size:
+                    self._total += 1
+                    pooled = None
+                else:
+                    if waited_since is None:
+                        waited_since = time.monotonic()
+                        deadline = waited_since + self.pool_timeout
+                        self._waits += 1
+                    remaining = deadline - time.monotonic()
+                    if remaining <= 0:
+                        self._timeouts += 1
+                        raise PoolTimeoutError(
+                            f"No database connection available within {self.pool_timeout}s "
+                            f"(pool_size={self.pool_size}, max_size={self.max_size})"
+                        )
+                    self._cond.wait(remaining)
+                    continue
+
+            if pooled is None:
+                pooled = self._create()
+            elif not self._is_usable(pooled):
+                pooled.close()
+                pooled = self._create()
+
+            with self._cond:
+                self._checkouts += 1
+                if waited_since is not None:
+                    waited = time.monotonic() - waited_since
+                    self._wait_time_total += waited
+                    self._wait_time_max = max(self._wait_time_max, waited)
+            return pooled
+
+    def release(self, pooled: PooledConnection, discard: bool = False):
+        """Return a connection; broken or surplus connections are closed"""
+        pooled.last_used = time.monotonic()
+        with self._cond:
+            keep = (not discard and not self._closed and pooled.connection.open
+                    and len(self._idle) < self.pool_size)
+            if keep:
+                self._idle.append(pooled)
+            else:
+                self._total -= 1
+                if discard:
+                    self._discarded += 1
+            self._cond.notify()
+
+        if not keep:
+            pooled.close()
+
+    def close(self):
+        """Close idle connections; checked-out ones are closed on release"""
+        with self._cond:
+            self._closed = True
+            idle, self._idle = list(self._idle), deque()
+            self._total -= len(idle)
+            self._cond.notify_all()
+        for pooled in idle:
+            pooled.close()
+
+    def metrics(self) -> Dict[str, Any]:
+        """Pool usage metrics"""
+        with self._cond:
+            return {
+                'pool_size': self.pool_size,
+                'max_size': self.max_size,
+                'open': self._total,
+                'idle': len(self._idle),
+                'in_use': self._total - len(self._idle),
+                'checkouts': self._checkouts,
+                'waits': self._waits,
+                'wait_time_total': round(self._wait_time_total, 4),
+                'wait_time_max': round(self._wait_time_max, 4),
+                'timeouts': self._timeouts,
+                'created': self._created,
+                'recycled': self._recycled,
+                'discarded': self._discarded,
+            }
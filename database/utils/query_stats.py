@@ -0,0 +1,99 @@
+"""
+Query Latency Statistics
+"""
+import re
+import threading
+from bisect import bisect_left
+from typing import Dict, Any, List, Optional
+
+# Histogram bucket upper bounds in milliseconds (last bucket is +inf)
+LATENCY_BUCKETS_MS = (1, 2, 5, 10, 25, 50, 100, 250, 500, 1000, 2500, 5000, 10000)
+
+_STRING_LITERAL = re.compile(r"'(?:[^'\\]|\\.)*'|\"(?:[^\"\\]|\\.)*\"")
+_NUMBER_LITERAL = re.compile(r"\b\d+(?:\.\d+)?\b")
+_PLACEHOLDER_LIST = re.compile(r"\(\s*\?(?:\s*,\s*\?)*\s*\)")
+_WHITESPACE = re.compile(r"\s+")
+
+
+def fingerprint_query(query: str) -> str:
+    """Normalize a statement so queries differing only in values share a key"""
+    fp = query.replace('%s', '?')
+    fp = _STRING_LITERAL.sub('?', fp)
+    fp = _NUMBER_LITERAL.sub('?', fp)
+    fp = _PLACEHOLDER_LIST.sub('(?+)', fp)
+    return _WHITESPACE.sub(' ', fp).strip()
+
+
+class LatencyHistogram:
+    """Fixed-bucket latency histogram"""
+
+    def __init__(self):
+        self.counts = [0] * (len(LATENCY_BUCKETS_MS) + 1)
+        self.count = 0
+        self.total_ms = 0.0
+        self.max_ms = 0.0
+
+    def record(self, elapsed_ms: float):
+        self.counts[bisect_left(LATENCY_BUCKETS_MS, elapsed_ms)] += 1
+        self.count += 1
+        self.total_ms += elapsed_ms
+        self.max_ms = max(self.max_ms, elapsed_ms)
+
+    def percentile(self, pct: float) -> float:
+        """Upper bound of the bucket containing the given percentile"""
+        if not self.count:
+            return 0.0
+        target = self.count * pct / 100.0
+        seen = 0
+        for i, c in enumerate(self.counts):
+            seen += c
+            if seen >= target:
+                return float(LATENCY_BUCKETS_MS[i]) if i < len(LATENCY_BUCKETS_MS) else self.max_ms
+        return self.max_ms
+
+    def as_dict(self) -> Dict[str, Any]:
+        buckets = {f"<={b}ms": c for b, c in zip(LATENCY_BUCKETS_MS, self.counts)}
+        buckets[f">{LATENCY_BUCKETS_MS[-1]}ms"] = self.counts[-1]
+        return {
+            'count': self.count,
+            'avg_ms': round(self.total_ms / self.count, 3) if self.count else 0.0,
+            'p50_ms': self.percentile(50),
+            'p95_ms': self.percentile(95),
+            'p99_ms': self.percentile(99),
+            'max_ms': round(self.max_ms, 3),
+            'buckets': buckets,
+        }
+
+
+class QueryStats:
+    """Thread-safe latency histograms keyed by statement fingerprint"""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._histograms: Dict[str, LatencyHistogram] = {}
+        self._fingerprints: Dict[str, str] = {}
+
+    def record(self, query: str, elapsed_seconds: float):
+        fp = self._fingerprints.get(query)
+        if fp is None:
+            fp = fingerprint_query(query)
+            # Queries are mostly built from a fixed set of templates
+            if len(self._fingerprints) < 10000:
+                self._fingerprints[query] = fp
+        with self._lock:
+            histogram = self._histograms.get(fp)
+            if histogram is None:
+                histogram = self._histograms[fp] = LatencyHistogram()
+            histogram.record(elapsed_seconds * 1000.0)
+
+    def snapshot(self, top: Optional[int] = None) -> List[Dict[str, Any]]:
+        """Per-fingerprint stats sorted by total time spent"""
+        with self._lock:
+            items = [(fp, h.total_ms, h.as_dict()) for fp, h in self._histograms.items()]
+        items.sort(key=lambda item: item[1], reverse=True)
+        return [dict(fingerprint=fp, total_ms=round(total, 3), **stats)
+                for fp, total, stats in items[:top]]
+
+    def reset(self):
+        with self._lock:
+            self._histograms.clear()
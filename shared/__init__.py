@@ -0,0 +1,22 @@
+"""
+Shared infrastructure modules used across agents
+"""
+from .llm_client import (
+    CachedOpenAI,
+    LLMCacheConfig,
+    SQLiteLLMCache,
+    RedisLLMCache,
+    get_llm_cache,
+    get_llm_client,
+    make_cache_key,
+)
+
+__all__ = [
+    'CachedOpenAI',
+    'LLMCacheConfig',
+    'SQLiteLLMCache',
+    'RedisLLMCache',
+    'get_llm_cache',
+    'get_llm_client',
+    'make_cache_key',
+]
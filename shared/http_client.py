@@ -0,0 +1,382 @@
+"""
+Shared Crawler HTTP Client
+
+httpx-based client used by the web, Naver and Tistory crawlers. It provides
+pooled keep-alive connections (HTTP/2 when the h2 package is installed),
+gzip/brotli decoding, one retry/backoff policy, per-host concurrency and
+spacing limits, and ETag/Last-Modified conditional GETs backed by a local
+SQLite response cache, so unchanged pages cost a 304 instead of a download.
+"""
+import os
+import json
+import time
+import random
+import sqlite3
+import logging
+import threading
+from contextlib import contextmanager
+from dataclasses import dataclass, field
+from email.utils import parsedate_to_datetime
+from pathlib import Path
+from typing import Optional, Dict, Any, Iterator
+
+import httpx
+
+try:
+    import h2  # noqa: F401
+
+    HTTP2_AVAILABLE = True
+except ImportError:
+    HTTP2_AVAILABLE = False
+
+logger = logging.getLogger(__name__)
+
+PROJECT_ROOT = Path(__file__).resolve().parent.parent
+
+# Status codes worth retrying with backoff
+RETRY_STATUSES = frozenset({429, 500, 502, 503, 504})
+
+# Headers that describe the wire encoding rather than the cached body
+_TRANSPORT_HEADERS = frozenset({
+    'content-encoding', 'content-length', 'transfer-encoding', 'connection',
+})
+
+
+@dataclass
+class HTTPClientConfig:
+    """Crawler HTTP client settings"""
+    timeout: float = field(default_factory=lambda: float(os.getenv('HTTP_TIMEOUT', '10')))
+    http2: bool = field(default_factory=lambda: os.getenv('HTTP_HTTP2', 'true').lower() == 'true')
+    max_connections: int = field(default_factory=lambda: int(os.getenv('HTTP_MAX_CONNECTIONS', '20')))
+    max_keepalive_connections: int = field(default_factory=lambda: int(os.getenv('HTTP_MAX_KEEPALIVE', '10')))
+    max_retries: int = field(default_factory=lambda: int(os.getenv('HTTP_MAX_RETRIES', '3')))
+    backoff_base: float = field(default_factory=lambda: float(os.getenv('HTTP_BACKOFF_BASE', '1.0')))
+    backoff_max: float = field(default_factory=lambda: float(os.getenv('HTTP_BACKOFF_MAX', '30')))
+    max_per_host: int = field(default_factory=lambda: int(os.getenv('HTTP_MAX_PER_HOST', '4')))
+    min_interval: float = field(default_factory=lambda: float(os.getenv('HTTP_MIN_INTERVAL', '0')))
+    host_intervals: Dict[str, float] = field(default_factory=dict)
+    # sqlite | none
+    cache_backend: str = field(default_factory=lambda: os.getenv('HTTP_CACHE_BACKEND', 'sqlite').lower())
+    cache_path: str = field(default_factory=lambda: os.getenv(
+        'HTTP_CACHE_PATH', str(PROJECT_ROOT / '.cache' / 'http_cache.sqlite3')
+    ))
+    cache_max_entries: int = field(default_factory=lambda: int(os.getenv('HTTP_CACHE_MAX_ENTRIES', '5000')))
+
+
+class HostLimiter:
+    """Per-host concurrency limit and minimum spacing between request starts"""
+
+    def __init__(self, max_per_host: int = 4, min_interval: float = 0.0,
+                 host_intervals: Optional[Dict[str, float]] = None):
+        self.max_per_host = max(1, max_per_host)
+        self.min_interval = max(0.0, min_interval)
+        self.host_intervals = host_intervals or {}
+        self._lock = threading.Lock()
+        self._semaphores: Dict[str, threading.BoundedSemaphore] = {}
+        self._next_slot: Dict[str, float] = {}
+
+    @contextmanager
+    def slot(self, url: str, min_interval: Optional[float] = None):
+        """Hold one of the host's request slots, waiting for its spacing interval
+
+        ``min_interval`` raises the spacing after this request (e.g. a
+        politeness delay for page fetches) without slowing other requests.
+        """
+        host = httpx.URL(url).host
+        interval = self.host_intervals.get(host, self.min_interval)
+        if min_interval is not None:
+            interval = max(interval, min_interval)
+        with self._lock:
+            semaphore = self._semaphores.setdefault(
+                host, threading.BoundedSemaphore(self.max_per_host)
+            )
+        semaphore.acquire()
+        try:
+            with self._lock:
+                now = time.monotonic()
+                start_at = max(now, self._next_slot.get(host, now))
+                self._next_slot[host] = start_at + interval
+            if start_at > now:
+                time.sleep(start_at - now)
+            yield
+        finally:
+            semaphore.release()
+
+
+class ResponseCache:
+    """SQLite store of validators and bodies for conditional GETs (LRU bounded)"""
+
+    def __init__(self, path: str, max_entries: int = 5000):
+        self.path = path
+        self.max_entries = max_entries
+        self._lock = threading.Lock()
+
+        Path(path).parent.mkdir(parents=True, exist_ok=True)
+        self._conn = sqlite3.connect(path, check_same_thread=False, timeout=30)
+        with self._lock:
+            self._conn.execute("PRAGMA journal_mode=WAL")
+            self._conn.execute("""
+                CREATE TABLE IF NOT EXISTS http_cache (
+                    url TEXT PRIMARY KEY,
+                    etag TEXT,
+                    last_modified TEXT,
+                    status INTEGER NOT NULL,
+                    headers TEXT NOT NULL,
+                    content BLOB NOT NULL,
+                    accessed_at REAL NOT NULL
+                )
+            """)
+            self._conn.execute(
+                "CREATE INDEX IF NOT EXISTS idx_http_cache_accessed ON http_cache (accessed_at)"
+            )
+            self._conn.commit()
+
+    def get(self, url: str) -> Optional[Dict[str, Any]]:
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT etag, last_modified, status, headers, content FROM http_cache WHERE url = ?",
+                (url,)
+            ).fetchone()
+        if row is None:
+            return None
+        etag, last_modified, status, headers, content = row
+        return {
+            'etag': etag,
+            'last_modified': last_modified,
+            'status': status,
+            'headers': json.loads(headers),
+            'content': content,
+        }
+
+    def touch(self, url: str):
+        with self._lock:
+            self._conn.execute(
+                "UPDATE http_cache SET accessed_at = ? WHERE url = ?", (time.time(), url)
+            )
+            self._conn.commit()
+
+    def set(self, url: str, response: httpx.Response):
+        """Store a 200 response that carries an ETag or Last-Modified validator"""
+        headers = {
+            k: v for k, v in response.headers.items() if k.lower() not in _TRANSPORT_HEADERS
+        }
+        with self._lock:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO http_cache "
+                "(url, etag, last_modified, status, headers, content, accessed_at) "
+                "VALUES (?, ?, ?, ?, ?, ?, ?)",
+                (url, response.headers.get('etag'), response.headers.get('last-modified'),
+                 response.status_code, json.dumps(headers), response.content, time.time())
+            )
+            overflow = self._conn.execute("SELECT COUNT(*) FROM http_cache").fetchone()[0] - self.max_entries
+            if overflow > 0:
+                self._conn.execute(
+                    "DELETE FROM http_cache WHERE url IN "
+                    "(SELECT url FROM http_cache ORDER BY accessed_at LIMIT ?)",
+                    (overflow,)
+                )
+            self._conn.commit()
+
+    def clear(self):
+        with self._lock:
+            self._conn.execute("DELETE FROM http_cache")
+            self._conn.commit()
+
+    def close(self):
+        with self._lock:
+            self._conn.close()
+
+
+def _retry_after_seconds(response: httpx.Response) -> Optional[float]:
+    """Parse a Retry-After header (seconds or HTTP date)"""
+    value = response.headers.get('retry-after')
+    if not value:
+        return None
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        pass
+    try:
+        return max(0.0, parsedate_to_datetime(value).timestamp() - time.time())
+    except (TypeError, ValueError):
+        return None
+
+
+class CrawlerHTTPClient:
+    """Pooled httpx client with retries, host limits and conditional GETs
+
+    Drop-in for the ``requests.Session`` objects the crawlers used: ``get``
+    and ``head`` return ``httpx.Response`` objects. A GET revalidated with a
+    304 returns the cached 200 response with ``from_cache`` set to True.
+    """
+
+    def __init__(self, headers: Optional[Dict[str, str]] = None,
+                 config: Optional[HTTPClientConfig] = None,
+                 cache: Optional[ResponseCache] = None,
+                 **overrides):
+        self.config = config or HTTPClientConfig()
+        for name, value in overrides.items():
+            if not hasattr(self.config, name):
+                raise TypeError(f"Unknown HTTP client setting: {name}")
+            setattr(self.config, name, value)
+
+        http2 = self.config.http2 and HTTP2_AVAILABLE
+        if self.config.http2 and not HTTP2_AVAILABLE:
+            logger.info("h2 package not installed; using HTTP/1.1")
+
+        self.client = httpx.Client(
+            http2=http2,
+            headers=headers,
+            timeout=self.config.timeout,
+            follow_redirects=True,
+            limits=httpx.Limits(
+                max_connections=self.config.max_connections,
+                max_keepalive_connections=self.config.max_keepalive_connections,
+            ),
+        )
+        self.host_limiter = HostLimiter(
+            self.config.max_per_host, self.config.min_interval, self.config.host_intervals
+        )
+        self.cache = cache if cache is not None else get_response_cache()
+
+        self._stats_lock = threading.Lock()
+        self._stats = {
+            'requests': 0,
+            'retries': 0,
+            'not_modified': 0,
+            'cache_stores': 0,
+            'bytes_downloaded': 0,
+        }
+
+    def _incr(self, name: str, amount: int = 1):
+        with self._stats_lock:
+            self._stats[name] += amount
+
+    def _backoff(self, attempt: int, response: Optional[httpx.Response] = None) -> float:
+        """Exponential backoff with jitter, honouring Retry-After"""
+        if response is not None:
+            retry_after = _retry_after_seconds(response)
+            if retry_after is not None:
+                return min(retry_after, self.config.backoff_max)
+        delay = self.config.backoff_base * (2 ** attempt)
+        return min(delay + random.uniform(0, self.config.backoff_base), self.config.backoff_max)
+
+    def _send(self, method: str, url: str, retries: Optional[int],
+              min_interval: Optional[float] = None, **kwargs) -> httpx.Response:
+        """Send a request under the host limit, retrying transport errors and RETRY_STATUSES"""
+        max_retries = self.config.max_retries if retries is None else retries
+        attempt = 0
+        while True:
+            try:
+                with self.host_limiter.slot(url, min_interval):
+                    self._incr('requests')
+                    response = self.client.request(method, url, **kwargs)
+            except httpx.TransportError as e:
+                if attempt >= max_retries:
+                    raise
+                delay = self._backoff(attempt)
+                logger.warning(f"{method} {url} failed ({e}); retry {attempt + 1}/{max_retries} in {delay:.1f}s")
+            else:
+                if response.status_code not in RETRY_STATUSES or attempt >= max_retries:
+                    self._incr('bytes_downloaded', len(response.content))
+                    return response
+                delay = self._backoff(attempt, response)
+                logger.warning(f"{method} {url} returned {response.status_code}; "
+                               f"retry {attempt + 1}/{max_retries} in {delay:.1f}s")
+                response.close()
+            self._incr('retries')
+            attempt += 1
+            time.sleep(delay)
+
+    def request(self, method: str, url: str, *, params: Optional[Dict[str, Any]] = None,
+                headers: Optional[Dict[str, str]] = None, timeout: Optional[float] = None,
+                follow_redirects: bool = True, conditional: bool = True,
+                retries: Optional[int] = None,
+                min_interval: Optional[float] = None) -> httpx.Response:
+        """Send a request; GETs are revalidated against the response cache"""
+        method = method.upper()
+        kwargs = {'params': params, 'headers': dict(headers or {}), 'follow_redirects': follow_redirects}
+        if timeout is not None:
+            kwargs['timeout'] = timeout
+
+        cache_key = None
+        cached = None
+        if method == 'GET' and conditional and self.cache is not None:
+            cache_key = str(httpx.URL(url, params=params))
+            cached = self.cache.get(cache_key)
+            if cached:
+                if cached['etag']:
+                    kwargs['headers']['If-None-Match'] = cached['etag']
+                if cached['last_modified']:
+                    kwargs['headers']['If-Modified-Since'] = cached['last_modified']
+
+        response = self._send(method, url, retries, min_interval, **kwargs)
+
+        if cache_key is None:
+            return response
+        if response.status_code == 304 and cached:
+            self._incr('not_modified')
+            self.cache.touch(cache_key)
+            revalidated = httpx.Response(
+                cached['status'],
+                headers=cached['headers'],
+                content=cached['content'],
+                request=response.request,
+            )
+            revalidated.from_cache = True
+            return revalidated
+        if response.status_code == 200 and (
+                response.headers.get('etag') or response.headers.get('last-modified')):
+            try:
+                self.cache.set(cache_key, response)
+                self._incr('cache_stores')
+            except sqlite3.Error as e:
+                logger.warning(f"HTTP cache store failed for {cache_key}: {e}")
+        response.from_cache = False
+        return response
+
+    def get(self, url: str, **kwargs) -> httpx.Response:
+        return self.request('GET', url, **kwargs)
+
+    def head(self, url: str, **kwargs) -> httpx.Response:
+        return self.request('HEAD', url, **kwargs)
+
+    @contextmanager
+    def stream(self, method: str, url: str, *, headers: Optional[Dict[str, str]] = None,
+               timeout: Optional[float] = None) -> Iterator[httpx.Response]:
+        """Stream a response body under the host limit (bypasses the response cache)"""
+        kwargs = {'headers': headers}
+        if timeout is not None:
+            kwargs['timeout'] = timeout
+        with self.host_limiter.slot(url):
+            self._incr('requests')
+            with self.client.stream(method.upper(), url, **kwargs) as response:
+                yield response
+                self._incr('bytes_downloaded', response.num_bytes_downloaded)
+
+    def stats(self) -> Dict[str, Any]:
+        with self._stats_lock:
+            return dict(self._stats)
+
+    def close(self):
+        self.client.close()
+
+
+_cache_lock = threading.Lock()
+_response_cache: Optional[ResponseCache] = None
+_cache_initialized = False
+
+
+def get_response_cache() -> Optional[ResponseCache]:
+    """Process-wide response cache shared by all crawler clients (None if disabled)"""
+    global _response_cache, _cache_initialized
+    with _cache_lock:
+        if not _cache_initialized:
+            config = HTTPClientConfig()
+            if config.cache_backend == 'sqlite':
+                try:
+                    _response_cache = ResponseCache(config.cache_path, config.cache_max_entries)
+                except sqlite3.Error as e:
+                    logger.warning(f"HTTP response cache unavailable: {e}")
+            _cache_initialized = True
+        return _response_cache
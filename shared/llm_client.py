@@ -0,0 +1,406 @@
+"""
+Cached LLM Client
+
+Content-addressed response cache for OpenAI chat completions shared by all agents.
+Responses are keyed by a hash of (model, messages, temperature, max_tokens,
+response_format) and stored in a local SQLite file or, optionally, Redis.
+"""
+import os
+import json
+import time
+import sqlite3
+import hashlib
+import logging
+import threading
+from dataclasses import dataclass, field
+from pathlib import Path
+from types import SimpleNamespace
+from typing import Optional, Dict, Any, List
+
+from openai import AsyncOpenAI, OpenAI
+
+try:
+    import redis
+
+    REDIS_AVAILABLE = True
+except ImportError:
+    REDIS_AVAILABLE = False
+
+logger = logging.getLogger(__name__)
+
+PROJECT_ROOT = Path(__file__).resolve().parent.parent
+
+
+@dataclass
+class LLMCacheConfig:
+    """LLM response cache settings (defaults read from the environment at instantiation)"""
+    # sqlite | redis | none
+    backend: str = field(default_factory=lambda: os.getenv('LLM_CACHE_BACKEND', 'sqlite').lower())
+    path: str = field(default_factory=lambda: os.getenv('LLM_CACHE_PATH', str(PROJECT_ROOT / '.cache' / 'llm_cache.sqlite3')))
+    max_entries: int = field(default_factory=lambda: int(os.getenv('LLM_CACHE_MAX_ENTRIES', '20000')))
+    ttl_seconds: int = field(default_factory=lambda: int(os.getenv('LLM_CACHE_TTL', str(30 * 24 * 3600))))
+    redis_url: str = field(default_factory=lambda: os.getenv('LLM_CACHE_REDIS_URL', os.getenv('REDIS_URL', 'redis://localhost:6379/0')))
+
+
+@dataclass
+class CacheStats:
+    """Hit/miss counters for a cache backend"""
+    hits: int = 0
+    misses: int = 0
+    stores: int = 0
+    evictions: int = 0
+    errors: int = 0
+    _lock: threading.Lock = field(default_factory=threading.Lock, repr=False)
+
+    def incr(self, name: str, amount: int = 1):
+        with self._lock:
+            setattr(self, name, getattr(self, name) + amount)
+
+    def as_dict(self) -> Dict[str, Any]:
+        total = self.hits + self.misses
+        return {
+            'hits': self.hits,
+            'misses': self.misses,
+            'stores': self.stores,
+            'evictions': self.evictions,
+            'errors': self.errors,
+            'hit_rate': round(self.hits / total, 3) if total else 0.0,
+        }
+
+
+def make_cache_key(model: str, messages: List[Dict[str, Any]],
+                   temperature: Optional[float] = None,
+                   max_tokens: Optional[int] = None,
+                   response_format: Optional[Dict[str, Any]] = None,
+                   **extra) -> str:
+    """Build a content-addressed cache key for a chat completion request"""
+    payload = {
+        'model': model,
+        'messages': messages,
+        'temperature': temperature,
+        'max_tokens': max_tokens,
+        'response_format': response_format,
+    }
+    if extra:
+        payload['extra'] = extra
+    canonical = json.dumps(payload, ensure_ascii=False, sort_keys=True, default=str)
+    return hashlib.sha256(canonical.encode('utf-8')).hexdigest()
+
+
+class SQLiteLLMCache:
+    """Local disk cache with a size bound, LRU eviction and TTL expiry"""
+
+    def __init__(self, path: str, max_entries: int = 20000, ttl_seconds: int = 0):
+        self.path = path
+        self.max_entries = max_entries
+        self.ttl_seconds = ttl_seconds
+        self.stats = CacheStats()
+        self._lock = threading.Lock()
+
+        Path(path).parent.mkdir(parents=True, exist_ok=True)
+        self._conn = sqlite3.connect(path, check_same_thread=False, timeout=30)
+        with self._lock:
+            self._conn.execute("PRAGMA journal_mode=WAL")
+            self._conn.execute("""
+                CREATE TABLE IF NOT EXISTS llm_cache (
+                    cache_key TEXT PRIMARY KEY,
+                    value TEXT NOT NULL,
+                    created_at REAL NOT NULL,
+                    accessed_at REAL NOT NULL
+                )
+            """)
+            self._conn.execute(
+                "CREATE INDEX IF NOT EXISTS idx_llm_cache_accessed ON llm_cache (accessed_at)"
+            )
+            self._conn.commit()
+
+    def get(self, key: str) -> Optional[Dict[str, Any]]:
+        """Return a cached value, or None on miss/expiry"""
+        now = time.time()
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT value, created_at FROM llm_cache WHERE cache_key = ?", (key,)
+            ).fetchone()
+            if row is None:
+                self.stats.incr('misses')
+                return None
+
+            value, created_at = row
+            if self.ttl_seconds and now - created_at > self.ttl_seconds:
+                self._conn.execute("DELETE FROM llm_cache WHERE cache_key = ?", (key,))
+                self._conn.commit()
+                self.stats.incr('misses')
+                self.stats.incr('evictions')
+                return None
+
+            self._conn.execute(
+                "UPDATE llm_cache SET accessed_at = ? WHERE cache_key = ?", (now, key)
+            )
+            self._conn.commit()
+
+        self.stats.incr('hits')
+        return json.loads(value)
+
+    def set(self, key: str, value: Dict[str, Any]):
+        """Store a value and evict expired / least recently used entries"""
+        now = time.time()
+        with self._lock:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO llm_cache (cache_key, value, created_at, accessed_at) "
+                "VALUES (?, ?, ?, ?)",
+                (key, json.dumps(value, ensure_ascii=False), now, now)
+            )
+            evicted = 0
+            if self.ttl_seconds:
+                evicted += self._conn.execute(
+                    "DELETE FROM llm_cache WHERE created_at < ?", (now - self.ttl_seconds,)
+                ).rowcount
+            overflow = self._conn.execute("SELECT COUNT(*) FROM llm_cache").fetchone()[0] - self.max_entries
+            if overflow > 0:
+                evicted += self._conn.execute(
+                    "DELETE FROM llm_cache WHERE cache_key IN "
+                    "(SELECT cache_key FROM llm_cache ORDER BY accessed_at LIMIT ?)",
+                    (overflow,)
+                ).rowcount
+            self._conn.commit()
+
+        self.stats.incr('stores')
+        if evicted:
+            self.stats.incr('evictions', evicted)
+
+    def clear(self):
+        """Remove all cached responses"""
+        with self._lock:
+            self._conn.execute("DELETE FROM llm_cache")
+            self._conn.commit()
+
+    def close(self):
+        with self._lock:
+            self._conn.close()
+
+
+class RedisLLMCache:
+    """Redis-backed cache with TTL expiry and an LRU index for the size bound"""
+
+    KEY_PREFIX = 'llm_cache:'
+    LRU_INDEX = 'llm_cache:__lru__'
+
+    def __init__(self, url: str, max_entries: int = 20000, ttl_seconds: int = 0):
+        if not REDIS_AVAILABLE:
+            raise ImportError("redis package is not installed")
+        self.client = redis.Redis.from_url(url)
+        self.max_entries = max_entries
+        self.ttl_seconds = ttl_seconds
+        self.stats = CacheStats()
+
+    def get(self, key: str) -> Optional[Dict[str, Any]]:
+        value = self.client.get(self.KEY_PREFIX + key)
+        if value is None:
+            self.client.zrem(self.LRU_INDEX, key)
+            self.stats.incr('misses')
+            return None
+
+        self.client.zadd(self.LRU_INDEX, {key: time.time()})
+        self.stats.incr('hits')
+        return json.loads(value)
+
+    def set(self, key: str, value: Dict[str, Any]):
+        pipe = self.client.pipeline()
+        pipe.set(self.KEY_PREFIX + key, json.dumps(value, ensure_ascii=False),
+                 ex=self.ttl_seconds or None)
+        pipe.zadd(self.LRU_INDEX, {key: time.time()})
+        pipe.zcard(self.LRU_INDEX)
+        overflow = pipe.execute()[-1] - self.max_entries
+
+        if overflow > 0:
+            oldest = [k.decode() if isinstance(k, bytes) else k
+                      for k, _ in self.client.zpopmin(self.LRU_INDEX, overflow)]
+            if oldest:
+                self.client.delete(*(self.KEY_PREFIX + k for k in oldest))
+                self.stats.incr('evictions', len(oldest))
+        self.stats.incr('stores')
+
+    def clear(self):
+        keys = [k.decode() if isinstance(k, bytes) else k
+                for k in self.client.zrange(self.LRU_INDEX, 0, -1)]
+        if keys:
+            self.client.delete(*(self.KEY_PREFIX + k for k in keys))
+        self.client.delete(self.LRU_INDEX)
+
+    def close(self):
+        self.client.close()
+
+
+def _serialize_response(response) -> Optional[Dict[str, Any]]:
+    """Keep only the fields callers read from a chat completion"""
+    choice = response.choices[0]
+    if choice.message.content is None:
+        return None
+    usage = getattr(response, 'usage', None)
+    return {
+        'model': getattr(response, 'model', None),
+        'content': choice.message.content,
+        'role': choice.message.role,
+        'finish_reason': choice.finish_reason,
+        'usage': {
+            'prompt_tokens': getattr(usage, 'prompt_tokens', 0),
+            'completion_tokens': getattr(usage, 'completion_tokens', 0),
+            'total_tokens': getattr(usage, 'total_tokens', 0),
+        } if usage else None,
+    }
+
+
+def _deserialize_response(data: Dict[str, Any]):
+    """Rebuild an object with the same attribute shape as a ChatCompletion"""
+    message = SimpleNamespace(role=data.get('role', 'assistant'), content=data['content'])
+    choice = SimpleNamespace(index=0, message=message, finish_reason=data.get('finish_reason'))
+    usage = SimpleNamespace(**data['usage']) if data.get('usage') else None
+    return SimpleNamespace(model=data.get('model'), choices=[choice], usage=usage, cached=True)
+
+
+def _cache_lookup(cache, kwargs: Dict[str, Any]):
+    """Return (key, cached response or None); key is None when uncacheable"""
+    if cache is None or kwargs.get('stream') or kwargs.get('n', 1) != 1:
+        return None, None
+
+    key = make_cache_key(**kwargs)
+    try:
+        cached = cache.get(key)
+    except Exception as e:
+        cache.stats.incr('errors')
+        logger.warning(f"LLM cache read failed: {e}")
+        cached = None
+    return key, (_deserialize_response(cached) if cached is not None else None)
+
+
+def _cache_store(cache, key: str, response):
+    try:
+        data = _serialize_response(response)
+        if data is not None:
+            cache.set(key, data)
+    except Exception as e:
+        cache.stats.incr('errors')
+        logger.warning(f"LLM cache write failed: {e}")
+
+
+class _CachedCompletions:
+    """chat.completions facade that consults the cache before calling the API"""
+
+    def __init__(self, owner: 'CachedOpenAI'):
+        self._owner = owner
+
+    def create(self, **kwargs):
+        cache = self._owner.cache
+        key, cached = _cache_lookup(cache, kwargs)
+        if cached is not None:
+            return cached
+
+        response = self._owner._client.chat.completions.create(**kwargs)
+        if key is not None:
+            _cache_store(cache, key, response)
+        return response
+
+
+class _CachedAsyncCompletions:
+    """Async chat.completions facade sharing the same cache"""
+
+    def __init__(self, owner: 'CachedAsyncOpenAI'):
+        self._owner = owner
+
+    async def create(self, **kwargs):
+        cache = self._owner.cache
+        key, cached = _cache_lookup(cache, kwargs)
+        if cached is not None:
+            return cached
+
+        response = await self._owner._client.chat.completions.create(**kwargs)
+        if key is not None:
+            _cache_store(cache, key, response)
+        return response
+
+
+class CachedOpenAI:
+    """Drop-in OpenAI client wrapper that memoizes chat completions
+
+    Only ``chat.completions.create`` goes through the cache; every other
+    attribute (``images``, ``embeddings``, ...) is delegated to the wrapped client.
+    """
+
+    def __init__(self, api_key: Optional[str] = None, client: Optional[OpenAI] = None,
+                 cache=None, use_cache: bool = True):
+        self._client = client or OpenAI(api_key=api_key)
+        self.cache = (cache or get_llm_cache()) if use_cache else None
+        self.chat = SimpleNamespace(completions=_CachedCompletions(self))
+
+    def cache_stats(self) -> Dict[str, Any]:
+        return self.cache.stats.as_dict() if self.cache else {}
+
+    def __getattr__(self, name):
+        return getattr(self._client, name)
+
+
+class CachedAsyncOpenAI:
+    """AsyncOpenAI counterpart of CachedOpenAI backed by the same response cache
+
+    The underlying HTTP connection pool is bound to the event loop it first
+    runs on, so create one instance per ``asyncio.run`` and share it across the
+    coroutines of that run; release it with ``await client.close()``.
+    """
+
+    def __init__(self, api_key: Optional[str] = None, client: Optional[AsyncOpenAI] = None,
+                 cache=None, use_cache: bool = True):
+        self._client = client or AsyncOpenAI(api_key=api_key or os.getenv('OPENAI_API_KEY'))
+        self.cache = (cache or get_llm_cache()) if use_cache else None
+        self.chat = SimpleNamespace(completions=_CachedAsyncCompletions(self))
+
+    def cache_stats(self) -> Dict[str, Any]:
+        return self.cache.stats.as_dict() if self.cache else {}
+
+    async def close(self):
+        await self._client.close()
+
+    def __getattr__(self, name):
+        return getattr(self._client, name)
+
+
+# Process-wide cache and client instances
+_llm_cache = None
+_llm_cache_lock = threading.Lock()
+_llm_clients: Dict[Optional[str], CachedOpenAI] = {}
+
+
+def get_llm_cache(config: Optional[LLMCacheConfig] = None):
+    """Get the process-wide LLM response cache (None when disabled)"""
+    global _llm_cache
+    with _llm_cache_lock:
+        if _llm_cache is not None:
+            return _llm_cache
+
+        config = config or LLMCacheConfig()
+        if config.backend == 'none':
+            return None
+
+        if config.backend == 'redis':
+            try:
+                _llm_cache = RedisLLMCache(config.redis_url, config.max_entries, config.ttl_seconds)
+                _llm_cache.client.ping()
+                logger.info(f"LLM cache: redis ({config.redis_url})")
+                return _llm_cache
+            except Exception as e:
+                logger.warning(f"Redis LLM cache unavailable, falling back to SQLite: {e}")
+
+        _llm_cache = SQLiteLLMCache(config.path, config.max_entries, config.ttl_seconds)
+        logger.info(f"LLM cache: sqlite ({config.path})")
+        return _llm_cache
+
+
+def get_llm_client(api_key: Optional[str] = None) -> CachedOpenAI:
+    """Get a shared cached client for the given API key"""
+    api_key = api_key or os.getenv('OPENAI_API_KEY')
+    with _llm_cache_lock:
+        client = _llm_clients.get(api_key)
+    if client is None:
+        client = CachedOpenAI(api_key=api_key)
+        with _llm_cache_lock:
+            client = _llm_clients.setdefault(api_key, client)
+    return client